@@ -0,0 +1,62 @@
+"""
+Memory/time benchmark for ClassificationSkill.create_tasks.
+
+Compares the shared layout (system message and tool schema built once and
+shared by reference) against rebuilding both for every row, and against the
+compact TaskStore (shared template + serialized per-row payloads).
+
+Usage:
+    python benchmarks/create_tasks_benchmark.py --rows 1000000 --categories 200
+"""
+import argparse
+import time
+import tracemalloc
+
+from flashlearn.skills import ClassificationSkill
+
+
+def build_rows(n):
+    return [{"text": f"Review number {i}: the product arrived on time and works."} for i in range(n)]
+
+
+def per_row_tasks(skill, rows):
+    # Pre-sharing behaviour: every row builds its own system message and schema.
+    tasks = []
+    for idx, row in enumerate(rows):
+        task = skill._build_row_task(str(idx), row, {}, {})
+        if task is not None:
+            tasks.append(task)
+    return tasks
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tasks = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {len(tasks):>9} tasks  {elapsed:8.2f} s  peak {peak / 2 ** 20:10.1f} MiB")
+    return tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=200)
+    args = parser.parse_args()
+
+    skill = ClassificationSkill(
+        model_name="gpt-4o-mini",
+        categories=[f"category_{i}" for i in range(args.categories)],
+        system_prompt="Classify the review into one category.",
+    )
+    rows = build_rows(args.rows)
+
+    measure("shared", lambda: skill.create_tasks(rows))
+    measure("per-row", lambda: per_row_tasks(skill, rows))
+    measure("task store", lambda: skill.create_task_store(rows))
+
+
+if __name__ == "__main__":
+    main()
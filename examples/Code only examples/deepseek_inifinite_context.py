@@ -1,18 +1,13 @@
 import os
 from openai import OpenAI
-from flashlearn.skills.classification import ClassificationSkill
-
-
-def super_simple_chunker(text, chunk_size=1000):
-    """Chunks text into smaller segments of specified size."""
-    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
-    return [{"text": chunk} for chunk in chunks]
+from flashlearn.skills import RelevanceFilter
+from flashlearn.utils import iter_file_chunks
 
 
 def infinite_context(question, context):
     """
     Uses a language model to provide answers to a given question
-    by processing a large context into relevant chunks.
+    by narrowing a large context (text, or chunk rows) down to its relevant chunks.
     """
     # Step 1: Setup your provider
 
@@ -28,53 +23,32 @@ def infinite_context(question, context):
         base_url="https://api.deepseek.com",
     )
 
-    # Step 2: Chunk context like you would with any RAG flow
-    chunks = super_simple_chunker(context)
-
-    # Step 3: Initialize the Classification Skill - Classify relevant content
-    skill = ClassificationSkill(
+    # Step 2: Chunk the context by tokens and filter it in coarse-to-fine passes
+    # until the relevant part fits 8k tokens. Relevance labels are cached, so
+    # asking again over the same file only classifies new chunks.
+    relevance = RelevanceFilter(
         model_name=model_name,
         client=client,
-        categories=["relevant", "somehow_relevant", "irrelevant"],
-        max_categories=1,
-        system_prompt="Classify content based on relevancy to the task" f"{question}",
+        chunk_tokens=512,
+        target_tokens=8000,
+        max_passes=3,
+        cache_path="relevance_cache.sqlite",
     )
 
-    # Step 4: Prepare classification tasks (passing the list of dicts + columns to read)
-    iterations = 0
-    while len(chunks) > 64 or iterations > 2:
-        tasks = skill.create_tasks(chunks)
+    # Step 3: Answer from the filtered context, streaming the reply
+    answer = ""
+    for piece in relevance.answer(question, context):
+        print(piece, end="", flush=True)
+        answer += piece
+    print()
+    print(relevance.last_passes)  # chunks / classified / survivors per pass
 
-        # Narrow down on quality context
-        results = skill.run_tasks_in_parallel(tasks)
-        print(results)
-
-        # Step 6: Map results and reiterate if still too many chunks
-        for i, review in enumerate(chunks):
-            chunks[i]['category'] = results[str(i)]['categories']
-        chunks = [{'text': review['text']} for review in chunks if review['category'] == 'relevant']
-
-        iterations += 1
-
-    # Answer
-    answer = client.chat.completions.create(
-        model=model_name,
-        messages=[
-            {'role': 'user', 'content': str(chunks)},
-            {'role': 'user', 'content': question}
-        ]
-    )
-
-    return answer.choices[0].message.content
+    return answer
 
 
 if __name__ == "__main__":
-    # Open the long context file
+    # Stream the long context file in 512-token chunks without loading it into memory
     file_path = 'context.txt'
-    file = open(file_path, 'r', encoding='utf-8')
-
-    # Read the file's contents
-    file_contents = file.read()
+    chunks = iter_file_chunks(file_path, max_tokens=512, overlap_tokens=32)
 
-    answer = infinite_context('YOUR QUESTION', file_contents)
-    print(answer)
\ No newline at end of file
+    answer = infinite_context('YOUR QUESTION', chunks)
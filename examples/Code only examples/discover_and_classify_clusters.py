@@ -1,5 +1,4 @@
-from flashlearn.skills.classification import ClassificationSkill
-from flashlearn.skills import DiscoverLabelsSkill
+from flashlearn.skills import DiscoverLabelsSkill, LabelConsolidationSkill
 from flashlearn.utils import imdb_reviews_50k
 
 
@@ -18,15 +17,16 @@ def main():
     )
     labeling_skill.save()
 
-    # Step 4: Create tasks for discovering labels
-    tasks = labeling_skill.create_tasks(data)
-    results_labels = labeling_skill.run_tasks_in_parallel(tasks)
-    labels = results_labels['0']['labels']  # Extract discovered labels
+    # Step 4: Discover labels chunk by chunk; near-duplicate labels from different
+    # chunks are merged locally, only ambiguous ones are sent to the model
+    consolidator = LabelConsolidationSkill(model_name="gpt-4o-mini")
+    labels = labeling_skill.discover_labels(
+        data, max_tokens_per_chunk=20000, consolidator=consolidator
+    )
 
     # Step 5: Create a classification skill with discovered labels
-    skill = ClassificationSkill(
-        model_name="gpt-4o-mini",
-        categories=labels,
+    skill = consolidator.to_classification_skill(
+        labels,
         max_categories=1,
         system_prompt="We want to classify short movie reviews in listed categories",
     )
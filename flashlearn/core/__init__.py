@@ -9,7 +9,18 @@ You can expose certain classes/functions here if desired.
 from .flash_client import FlashLiteLLMClient
 from .orchestration import StatusTracker, ParallelTask, append_to_jsonl, token_count_for_task, run_task_with_timeout, \
     process_tasks_in_parallel
+from .result_store import ResultStore
+from .strict_schema import StrictSchemaError, repair_function_definition, strict_schema_problems
+from .task_store import TaskStore
+from .validation import InvalidOutputError, OutputValidator
 
 __all__ = [
      'FlashLiteLLMClient',
+     'ResultStore',
+     'TaskStore',
+     'InvalidOutputError',
+     'OutputValidator',
+     'StrictSchemaError',
+     'repair_function_definition',
+     'strict_schema_problems',
 ]
\ No newline at end of file
@@ -1,5 +1,3 @@
-import litellm
-
 class FlashLiteLLMClient:
     def __init__(self):
         pass
@@ -12,7 +10,7 @@ class FlashLiteLLMClient:
                 # This function passes kwargs to litellm's completion method
                 # Replace 'litellm.completion' with the actual function path if incorrect
                 kwargs.update({'no-log': True})
-                return litellm.completion(**kwargs)
+                return _litellm().completion(**kwargs)
 
         # Expose completions as a property of Chat
         @property
@@ -22,3 +20,12 @@ class FlashLiteLLMClient:
     # Create an instance of Chat as a class attribute
     chat = Chat()
 
+
+def _litellm():
+    """
+    Imports litellm on first use; it is slow to import and is only needed once a
+    request is sent. litellm fetches its model-cost map on import; set
+    LITELLM_LOCAL_MODEL_COST_MAP=True in the environment to use the bundled copy.
+    """
+    import litellm
+    return litellm
@@ -1,18 +1,23 @@
 import argparse
-import ast
 import asyncio
 import json
 import logging
 import os
+import queue
 import re
+import threading
 import time
 from asyncio import TimeoutError, wait_for
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List, Union, Callable, Tuple
+from typing import Any, Dict, Optional, List, Union, Callable, Tuple, Iterable
 
-import tiktoken
 from tqdm import tqdm
 
+from flashlearn.utils.media import resolve_media_refs
+from flashlearn.core.result_store import ResultStore
+from flashlearn.core.tool_arguments import LazyArguments, parse_tool_arguments, unwrap_function_definition
+from flashlearn.core.validation import InvalidOutputError, ValidatorCache
+
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger("ParallelProcessor")
 
@@ -70,12 +75,30 @@ class StatusTracker:
     num_tasks_in_progress: int = 0
     num_tasks_succeeded: int = 0
     num_tasks_failed: int = 0
+    num_tasks_cancelled: int = 0
     num_rate_limit_errors: int = 0
     num_api_errors: int = 0
     num_other_errors: int = 0
+    num_invalid_outputs: int = 0
     time_of_last_rate_limit_error: float = 0.0
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    total_cached_tokens: int = 0
+    total_request_seconds: float = 0.0
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """
+    Returns how many prompt tokens the provider served from its prompt cache,
+    read from usage.prompt_tokens_details.cached_tokens (litellm normalizes
+    Anthropic's cache_read_input_tokens into the same field). 0 if absent.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        cached = details.get("cached_tokens")
+    else:
+        cached = getattr(details, "cached_tokens", None)
+    return cached if isinstance(cached, int) else 0
 
 
 def append_to_jsonl(data: Any, filename: Optional[str]) -> None:
@@ -87,7 +110,14 @@ def append_to_jsonl(data: Any, filename: Optional[str]) -> None:
     if filename is None:
         return
     with open(filename, "a", encoding="utf-8") as f:
-        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+        f.write(json.dumps(data, ensure_ascii=False, default=_jsonl_default) + "\n")
+
+
+def _jsonl_default(obj: Any) -> Any:
+    # Lazy results are written as their raw argument string, without parsing.
+    if isinstance(obj, LazyArguments):
+        return obj.raw
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 @dataclass
@@ -105,33 +135,83 @@ class ParallelTask:
     pbar: Optional[tqdm] = None
     results_dict: Optional[Dict[str, Any]] = None
     result: List[Union[str, dict]] = field(default_factory=list)
+    validator: Optional[Callable[[Any], None]] = None
+    raw_results: bool = False
+    result_store: Optional[ResultStore] = None
+    latency: Optional[float] = None
+    on_result: Optional[Callable[[str, Any], None]] = None
 
     def _extract_function_call_arguments(self, completion: Any) -> Any:
         """
         Extracts JSON arguments from the model's function call (if present).
         Adjust as needed for your particular model response shape.
         """
-        args_str = ''
+        return unwrap_function_definition(self._parse_function_call_arguments(completion))
+
+    def _raw_function_call_arguments(self, completion: Any) -> Any:
+        """
+        Returns the tool-call argument string as sent by the model, or a
+        <PARSE_ERROR: ...> marker if the completion has no tool call.
+        """
         try:
             args_str = completion.choices[0].message.tool_calls[0].function.arguments
-            args_obj = ast.literal_eval(args_str)
-            try:
-                # Possibly the function_definition is a JSON string
-                args_obj = json.loads(args_obj['function_definition'])
-                args_obj["strict"] = True
-                return {"type": "function", "function": args_obj}
-            except:
-                # Or parse the entire string as JSON
-                try:
-                    args_obj = json.loads(args_str)
-                except:
-                    pass
-                return args_obj
         except Exception as e:
-            if args_str:
-                return args_str
             logger.error(f"Error parsing function call arguments: {e}")
             return f"<PARSE_ERROR: {e}>"
+        if not args_str:
+            return "<PARSE_ERROR: empty function call arguments>"
+        return args_str
+
+    def _parse_function_call_arguments(self, completion: Any) -> Any:
+        """
+        Parses the tool-call arguments (JSON first, then Python literal, see
+        parse_tool_arguments). Unparseable arguments are returned as the raw string.
+        """
+        return parse_tool_arguments(self._raw_function_call_arguments(completion))
+
+    def _lazy_function_call_arguments(self, completion: Any) -> Any:
+        """
+        Wraps the argument string in LazyArguments without parsing it. A missing
+        tool call is returned as the plain <PARSE_ERROR: ...> marker.
+        """
+        args_str = self._raw_function_call_arguments(completion)
+        if args_str.startswith("<PARSE_ERROR"):
+            return args_str
+        return LazyArguments(args_str)
+
+    @staticmethod
+    def _logprob_output(completion: Any) -> Dict[str, Any]:
+        """
+        For plain-text requests sent with logprobs (e.g. ClassificationSkill's
+        logprob mode): the text plus {token: logprob} of the first output
+        token's alternatives. A response without logprobs is not retried (a
+        model that never returns them would fail every attempt): top_logprobs
+        is then empty and the caller decides what to do with the row. Raises
+        InvalidOutputError only if the response has no message at all.
+        """
+        def get(obj, name):
+            return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+        try:
+            choice = completion.choices[0]
+            content = get(get(choice, "message"), "content") or ""
+        except (AttributeError, IndexError, KeyError, TypeError) as e:
+            raise InvalidOutputError(f"Response has no message: {e}")
+        try:
+            first = get(get(choice, "logprobs"), "content")[0]
+            top = get(first, "top_logprobs") or [first]
+            top_logprobs = {get(t, "token"): get(t, "logprob") for t in top}
+        except (AttributeError, IndexError, KeyError, TypeError):
+            top_logprobs = {}
+        return {"content": content, "top_logprobs": top_logprobs}
+
+    def _send_request(self) -> Any:
+        """
+        Runs in the worker thread: encodes any lazy media references, sends the
+        request, and lets the encoded copy go out of scope as soon as the call returns.
+        """
+        request_json = resolve_media_refs(self.request_json)
+        return self.client.chat.completions.create(**request_json)
 
     async def call_api(
         self,
@@ -149,9 +229,10 @@ class ParallelTask:
         error_data = None
         try:
             # 1) Perform synchronous API call in a thread
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create, **self.request_json
-            )
+            request_start = time.time()
+            response = await asyncio.to_thread(self._send_request)
+            self.latency = time.time() - request_start
+            status_tracker.total_request_seconds += self.latency
 
             # 2) Check for error in the response (raises exception if found)
             analyze_response_for_errors(response)
@@ -161,12 +242,26 @@ class ParallelTask:
                 usage_data = response.usage
                 prompt_tokens = usage_data.prompt_tokens
                 completion_tokens = usage_data.completion_tokens
+                cached_tokens = cached_prompt_tokens(usage_data)
             except:
                 prompt_tokens = 0
                 completion_tokens = 0
-
-            # 4) Extract the essential data from the completion
-            response_json = self._extract_function_call_arguments(response)
+                cached_tokens = 0
+
+            # 4) Extract the essential data from the completion, and check it
+            #    against the tool schema (raises InvalidOutputError)
+            if self.request_json.get("logprobs") and not self.request_json.get("tools"):
+                response_json = self._logprob_output(response)
+            elif self.raw_results:
+                # Keep the raw string; it is only parsed if validated or read
+                response_json = self._lazy_function_call_arguments(response)
+                if self.validator is not None:
+                    self.validator(getattr(response_json, "value", response_json))
+            else:
+                args_obj = self._parse_function_call_arguments(response)
+                if self.validator is not None:
+                    self.validator(args_obj)
+                response_json = unwrap_function_definition(args_obj)
 
             # 5) Success path => record success
             self._save_success(
@@ -175,9 +270,22 @@ class ParallelTask:
                 status_tracker=status_tracker,
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
+                cached_tokens=cached_tokens,
             )
             return
 
+        except InvalidOutputError as e:
+            # Output does not match the schema => retry right away (no backoff)
+            logger.warning(f"Task {self.task_id} returned an invalid output: {e}")
+            status_tracker.num_invalid_outputs += 1
+            self.result.append(str(e))
+            if self.attempts_left > 0:
+                retry_queue.put_nowait(self)
+            else:
+                logger.error(f"Task {self.task_id} still invalid after all retries. Error: {e}")
+                self._save_failed(save_filepath, status_tracker)
+            return
+
         except ApiRateLimitError as e:
             # 429 => we can retry with backoff
             logger.warning(f"Task {self.task_id} hit rate limit: {e}")
@@ -240,6 +348,7 @@ class ParallelTask:
         status_tracker: "StatusTracker",
         prompt_tokens: int = 0,
         completion_tokens: int = 0,
+        cached_tokens: int = 0,
     ) -> None:
         """
         Records a successful result both in JSONL (if filepath is given) and in memory.
@@ -251,15 +360,29 @@ class ParallelTask:
         )
         append_to_jsonl(data, filepath)
 
+        cid = self.custom_id or str(self.task_id)
+        if self.result_store is not None:
+            self.result_store.record(
+                cid,
+                self.request_json,
+                response_json,
+                metadata=self.metadata,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cached_tokens=cached_tokens,
+                latency=self.latency,
+            )
+
         # Store result if we have a shared dict
         if self.results_dict is not None:
-            cid = self.custom_id or str(self.task_id)
             self.results_dict[cid] = response_json
+        self._notify(cid, response_json)
 
         status_tracker.num_tasks_succeeded += 1
         status_tracker.num_tasks_in_progress -= 1
         status_tracker.total_input_tokens += prompt_tokens
         status_tracker.total_output_tokens += completion_tokens
+        status_tracker.total_cached_tokens += cached_tokens
 
         if self.pbar is not None:
             self.pbar.set_postfix_str(
@@ -268,6 +391,18 @@ class ParallelTask:
             )
             self.pbar.update(1)
 
+    def _notify(self, custom_id: str, result: Any) -> None:
+        """
+        Passes a final result to the on_result callback. Callback errors are
+        logged, never retried: the task itself has already completed.
+        """
+        if self.on_result is None:
+            return
+        try:
+            self.on_result(custom_id, result)
+        except Exception as e:
+            logger.error(f"on_result callback failed for task {self.task_id}: {e}")
+
     def _save_failed(self, filepath: Optional[str], status_tracker: "StatusTracker") -> None:
         """
         Records a permanently failed result in JSONL (if filepath is given) and updates counters.
@@ -279,10 +414,21 @@ class ParallelTask:
         )
         append_to_jsonl(data, filepath)
 
+        cid = self.custom_id or str(self.task_id)
+        if self.result_store is not None:
+            self.result_store.record(
+                cid,
+                self.request_json,
+                self.result,
+                metadata=self.metadata,
+                status="failed",
+                latency=self.latency,
+            )
+
         # Mark result as <ERROR> in shared dict
         if self.results_dict is not None:
-            cid = self.custom_id or str(self.task_id)
             self.results_dict[cid] = "<ERROR>"
+        self._notify(cid, "<ERROR>")
 
         status_tracker.num_tasks_in_progress -= 1
         status_tracker.num_tasks_failed += 1
@@ -296,6 +442,8 @@ def token_count_for_task(task_data: dict, token_encoding_name: str = "cl100k_bas
     Estimates how many tokens this request might consume.
     Adjust logic to match your actual request + token counting approach.
     """
+    import tiktoken
+
     encoding = tiktoken.get_encoding(token_encoding_name)
     messages = task_data.get("messages", [])
     total_tokens = 0
@@ -304,6 +452,9 @@ def token_count_for_task(task_data: dict, token_encoding_name: str = "cl100k_bas
     return total_tokens or 1
 
 
+_NO_MORE_TASKS = object()
+
+
 def task_id_generator():
     """
     A simple infinite generator for task IDs: 0, 1, 2, 3, ...
@@ -347,7 +498,7 @@ async def run_task_with_timeout(
 
 
 async def process_tasks_in_parallel(
-    tasks_data: List[dict],
+    tasks_data: Iterable[dict],
     client: Any,
     max_requests_per_minute: float = 1000,
     max_tokens_per_minute: float = 1000000,
@@ -358,6 +509,12 @@ async def process_tasks_in_parallel(
     show_progress: bool = True,
     return_results: bool = True,
     request_timeout: float = 5.0,
+    cached_token_weight: float = 1.0,
+    validate_outputs: bool = True,
+    raw_results: bool = False,
+    result_store: Union[ResultStore, str, None] = None,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+    stop_event: Optional[threading.Event] = None,
 ) -> Tuple[Optional[Dict[str, Any]], StatusTracker]:
     """
     Main orchestrator for concurrent tasks with rate-limiting, retry,
@@ -365,6 +522,33 @@ async def process_tasks_in_parallel(
 
     • We handle known error codes and do exponential backoff for 429/5xx.
     • If no headers are present, we use defaults as normal.
+    • tasks_data may be a list or any iterable (e.g. skill.iter_tasks(rows)).
+      Tasks are pulled lazily as the queue window frees up, so a generator is
+      only advanced while requests are in flight and peak memory is bounded
+      by the window rather than the dataset.
+    • cached_token_weight is the share of a cached prompt token that counts
+      against max_tokens_per_minute. 1.0 (default) counts cached tokens like any
+      other; lower values refund the difference once responses report them.
+    • With validate_outputs, every result is checked on arrival against the
+      request's tool "parameters" schema (compiled once per schema). Invalid
+      outputs are counted in status.num_invalid_outputs and only those tasks are
+      re-queued while attempts remain; otherwise they are recorded as failed.
+    • With raw_results, results are LazyArguments holding the model's argument
+      string, parsed only when accessed (and written to save_filepath as that
+      string). Combine with validate_outputs=False to skip parsing entirely.
+    • result_store (a ResultStore or an SQLite path) records each result keyed
+      by custom_id with usage and latency, storing shared request templates
+      once instead of the full request per row as the JSONL output does.
+    • on_result(custom_id, result) is called on the event-loop thread as each
+      task finishes (result is "<ERROR>" for permanent failures). See
+      stream_tasks_in_parallel for consuming results as an iterator.
+    • A task source may yield None to mean "nothing ready yet": loading stops
+      for this loop iteration and the source is polled again on the next one.
+      Sources that create tasks from earlier results (see skills.pipeline)
+      rely on this, since on_result runs on the same thread as the source.
+    • Once stop_event is set, no further tasks are loaded and no queued task or
+      retry is sent; requests already in flight finish and the call returns.
+      Tasks dropped this way are counted in status.num_tasks_cancelled.
     """
     if max_requests_per_minute > 1000 or max_tokens_per_minute > 1000000 or max_attempts > 3:
         raise EnterpriseVersionRequiredError()
@@ -379,9 +563,13 @@ async def process_tasks_in_parallel(
     retry_queue = asyncio.Queue()
     next_id = task_id_generator()
     results_out: Optional[Dict[str, Any]] = {} if return_results else None
+    validators = ValidatorCache() if validate_outputs else None
+    owns_result_store = isinstance(result_store, str)
+    if owns_result_store:
+        result_store = ResultStore(result_store)
 
     pbar = tqdm(
-        total=len(tasks_data),
+        total=len(tasks_data) if hasattr(tasks_data, "__len__") else None,
         desc="Processing tasks - For consulting and support visit: https://calendly.com/flashlearn",
         disable=not show_progress,
     )
@@ -389,13 +577,19 @@ async def process_tasks_in_parallel(
     # We'll enqueue tasks incrementally
     tasks_queue = asyncio.Queue()
 
-    i = 0
-    n = len(tasks_data)
+    tasks_iter = iter(tasks_data)
+    all_enqueued = False
 
     def load_tasks_into_queue():
-        nonlocal i
-        while i < n and tasks_queue.qsize() < max_queue_size:
-            raw_item = tasks_data[i]
+        nonlocal all_enqueued
+        while not all_enqueued and tasks_queue.qsize() < max_queue_size:
+            raw_item = next(tasks_iter, _NO_MORE_TASKS)
+            if raw_item is _NO_MORE_TASKS:
+                all_enqueued = True
+                break
+            if raw_item is None:
+                # The source has nothing ready yet (e.g. a pipeline waiting on results)
+                break
             request_json = raw_item.get("request", {})
             meta = raw_item.get("metadata", {})
             custom_id = raw_item.get("custom_id")
@@ -414,18 +608,31 @@ async def process_tasks_in_parallel(
                 metadata=meta,
                 pbar=pbar,
                 results_dict=results_out,
+                validator=validators.for_request(request_json) if validators else None,
+                raw_results=raw_results,
+                result_store=result_store,
+                on_result=on_result,
             )
             tasks_queue.put_nowait(new_task)
             status.num_tasks_started += 1
             status.num_tasks_in_progress += 1
-            i += 1
 
     # Start available capacities at 0, so they build over time
     available_req_capacity = 0.0
     available_token_capacity = 0.0
     last_update_time = time.time()
+    cached_tokens_refunded = 0
 
     while True:
+        # 0) Once stopped, drop everything that has not been sent yet
+        if stop_event is not None and stop_event.is_set():
+            all_enqueued = True
+            for pending in (tasks_queue, retry_queue):
+                while not pending.empty():
+                    pending.get_nowait()
+                    status.num_tasks_in_progress -= 1
+                    status.num_tasks_cancelled += 1
+
         # 1) Load more tasks if there's room
         load_tasks_into_queue()
 
@@ -466,6 +673,14 @@ async def process_tasks_in_parallel(
             available_token_capacity + (current_tokens_per_minute * dt / 60.0),
             current_tokens_per_minute,
         )
+        # Refund the discounted share of prompt tokens served from the provider cache
+        if status.total_cached_tokens > cached_tokens_refunded:
+            new_cached = status.total_cached_tokens - cached_tokens_refunded
+            cached_tokens_refunded = status.total_cached_tokens
+            available_token_capacity = min(
+                available_token_capacity + new_cached * (1.0 - cached_token_weight),
+                current_tokens_per_minute,
+            )
 
         # 4) If there's a pending task and enough capacity, schedule it
         if pending_task:
@@ -490,7 +705,6 @@ async def process_tasks_in_parallel(
                 await tasks_queue.put(pending_task)
 
         # 5) Check if we're fully done
-        all_enqueued = (i >= n)
         if (all_enqueued and status.num_tasks_in_progress == 0
                 and tasks_queue.empty() and retry_queue.empty()):
             break
@@ -511,9 +725,15 @@ async def process_tasks_in_parallel(
             await asyncio.sleep(to_sleep)
 
     pbar.close()
+    if owns_result_store:
+        result_store.close()
+    elif result_store is not None:
+        result_store.commit()
     logger.info(
         f"All tasks complete. {status.num_tasks_succeeded} succeeded, "
-        f"{status.num_tasks_failed} failed."
+        f"{status.num_tasks_failed} failed, "
+        f"{status.num_invalid_outputs} invalid outputs retried or rejected, "
+        f"{status.total_cached_tokens} prompt tokens served from cache."
         + (f" Results saved to {save_filepath}" if save_filepath else "")
     )
 
@@ -527,6 +747,104 @@ async def process_tasks_in_parallel(
         return results_out, status
     return None, status
 
+class ResultStream:
+    """
+    Iterator over (custom_id, result) pairs in completion order, produced by
+    running process_tasks_in_parallel on a background thread.
+
+    Results pass through a bounded queue: if the consumer falls behind, the
+    orchestrator blocks on handing over the next result, so memory stays at
+    buffer_size results regardless of the number of tasks. `status` holds the
+    StatusTracker once the stream is exhausted. Closing the stream (or leaving
+    a for loop over it early) stops delivery and stops the orchestrator: no
+    further tasks are pulled from tasks_data and no queued task or retry is
+    sent. Only requests already in flight finish, in the background, and
+    their results are discarded. An optional transform(custom_id, result)
+    maps each task result to the (zero or more) items actually delivered.
+    """
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        tasks_data: Iterable[dict],
+        client: Any,
+        buffer_size: int = 1000,
+        transform: Optional[Callable[[str, Any], Iterable[Tuple[str, Any]]]] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("show_progress", False)
+        self.status: Optional[StatusTracker] = None
+        self._transform = transform
+        self._queue: "queue.Queue" = queue.Queue(maxsize=buffer_size)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(tasks_data, client, kwargs), daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: Any) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _deliver(self, custom_id: str, result: Any) -> None:
+        if self._transform is None:
+            self._put((custom_id, result))
+            return
+        for item in self._transform(custom_id, result):
+            self._put(item)
+
+    def _run(self, tasks_data: Iterable[dict], client: Any, kwargs: Dict[str, Any]) -> None:
+        try:
+            _, self.status = asyncio.run(process_tasks_in_parallel(
+                tasks_data=tasks_data,
+                client=client,
+                return_results=False,
+                on_result=self._deliver,
+                stop_event=self._stopped,
+                **kwargs,
+            ))
+            self._put(self._DONE)
+        except BaseException as e:
+            self._put(e)
+
+    def __iter__(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._stopped.set()
+
+
+def stream_tasks_in_parallel(
+    tasks_data: Iterable[dict],
+    client: Any,
+    buffer_size: int = 1000,
+    **kwargs,
+) -> ResultStream:
+    """
+    Like process_tasks_in_parallel, but returns an iterator of
+    (custom_id, result) pairs as tasks complete, instead of a final dict.
+    Keyword arguments are passed to process_tasks_in_parallel.
+
+        for custom_id, result in stream_tasks_in_parallel(skill.iter_tasks(rows), client):
+            ...
+    """
+    return ResultStream(tasks_data, client, buffer_size=buffer_size, **kwargs)
+
+
 class EnterpriseVersionRequiredError(Exception):
     def __init__(self, message="Enterprise version required for more than 1000 requests per minute. Request a demo at https://calendly.com/flashlearn/enterprise-demo"):
         super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from flashlearn.core.task_store import holds_same_parts
+from flashlearn.core.tool_arguments import LazyArguments, parse_tool_arguments
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    hash TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    custom_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    result TEXT,
+    metadata TEXT,
+    template_hash TEXT,
+    request_message TEXT,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    cached_tokens INTEGER,
+    latency REAL,
+    created_at REAL
+);
+"""
+
+
+def _dumps(value: Any) -> str:
+    if isinstance(value, LazyArguments):
+        return value.raw
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class ResultStore:
+    """
+    SQLite-backed store for orchestrator results, keyed by custom_id.
+
+    Unlike the JSONL output (one [request, response, metadata] line per row),
+    each row stores only its result, metadata, token usage and latency. The
+    shared part of a request (model, tools, system message — everything but
+    the last message) is stored once in `templates` and referenced by hash;
+    the per-row message, which may contain base64 media, is only kept with
+    store_requests=True.
+
+    Writes happen on the orchestrator's event-loop thread and are committed
+    every `commit_every` rows and on commit()/close().
+
+        with ResultStore("run.sqlite") as store:
+            skill.run_tasks_in_parallel(tasks, result_store=store)
+            for custom_id, result in store.results():
+                ...
+    """
+
+    def __init__(self, path: str, store_requests: bool = False, commit_every: int = 500):
+        self.path = path
+        self.store_requests = store_requests
+        self.commit_every = commit_every
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending = 0
+        # hash -> template parts (non-message values and shared messages); only
+        # these are kept, never the per-row message.
+        self._templates: Dict[str, Dict[str, Any]] = {}
+        # (id(value), ...) of a template's parts -> hash. Only recorded for the
+        # very objects held in _templates, so their ids cannot be recycled.
+        self._template_hashes: Dict[Tuple, str] = {}
+
+    # ─────────────────────────────────────────────────────────────────
+    # Writing
+    # ─────────────────────────────────────────────────────────────────
+    def record(
+            self,
+            custom_id: str,
+            request_json: Dict[str, Any],
+            result: Any,
+            metadata: Optional[Dict[str, Any]] = None,
+            status: str = "success",
+            prompt_tokens: int = 0,
+            completion_tokens: int = 0,
+            cached_tokens: int = 0,
+            latency: Optional[float] = None,
+    ) -> None:
+        """
+        Insert or replace the result for one custom_id.
+        """
+        messages = request_json.get("messages") or []
+        template_hash = self._store_template(request_json, messages)
+        request_message = _dumps(messages[-1]) if self.store_requests and messages else None
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                custom_id,
+                status,
+                _dumps(result),
+                _dumps(metadata) if metadata else None,
+                template_hash,
+                request_message,
+                prompt_tokens,
+                completion_tokens,
+                cached_tokens,
+                latency,
+                time.time(),
+            ),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def _store_template(self, request_json: Dict[str, Any], messages: list) -> str:
+        shared_messages = messages[:-1]
+        identity = tuple(
+            (key, id(value)) for key, value in request_json.items() if key != "messages"
+        ) + tuple(id(m) for m in shared_messages)
+        template_hash = self._template_hashes.get(identity)
+        if template_hash is not None:
+            return template_hash
+
+        template = {key: value for key, value in request_json.items() if key != "messages"}
+        template["messages"] = shared_messages
+        body = json.dumps(template, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        template_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+        stored = self._templates.get(template_hash)
+        if stored is None:
+            self._conn.execute("INSERT OR IGNORE INTO templates VALUES (?, ?)", (template_hash, body))
+            self._templates[template_hash] = template
+            self._template_hashes[identity] = template_hash
+        elif holds_same_parts(stored, template):
+            self._template_hashes[identity] = template_hash
+        return template_hash
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ─────────────────────────────────────────────────────────────────
+    # Reading
+    # ─────────────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, custom_id: str, default: Any = None) -> Any:
+        """
+        Returns the stored result for custom_id ("<ERROR>" for failed rows).
+        """
+        row = self._conn.execute(
+            "SELECT status, result FROM results WHERE custom_id = ?", (custom_id,)
+        ).fetchone()
+        if row is None:
+            return default
+        return self._decode(*row)
+
+    def results(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields (custom_id, result) for every row, in insertion order.
+        """
+        cursor = self._conn.execute("SELECT custom_id, status, result FROM results ORDER BY rowid")
+        for custom_id, status, result in cursor:
+            yield custom_id, self._decode(status, result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Same shape as the orchestrator's in-memory results: {custom_id: result}.
+        """
+        return dict(self.results())
+
+    def request(self, custom_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Rebuilds the full request for custom_id (template + stored message).
+        Returns None if the row is unknown or requests were not stored.
+        """
+        row = self._conn.execute(
+            "SELECT t.body, r.request_message FROM results r "
+            "JOIN templates t ON t.hash = r.template_hash WHERE r.custom_id = ?",
+            (custom_id,),
+        ).fetchone()
+        if row is None or row[1] is None:
+            return None
+        request = json.loads(row[0])
+        request["messages"].append(json.loads(row[1]))
+        return request
+
+    def usage(self) -> Dict[str, Any]:
+        """
+        Totals over all stored rows: counts, tokens and mean latency.
+        """
+        row = self._conn.execute(
+            "SELECT COUNT(*), SUM(status = 'success'), SUM(prompt_tokens), "
+            "SUM(completion_tokens), SUM(cached_tokens), AVG(latency) FROM results"
+        ).fetchone()
+        return {
+            "rows": row[0],
+            "succeeded": row[1] or 0,
+            "prompt_tokens": row[2] or 0,
+            "completion_tokens": row[3] or 0,
+            "cached_tokens": row[4] or 0,
+            "mean_latency": row[5],
+        }
+
+    @staticmethod
+    def _decode(status: str, result: Optional[str]) -> Any:
+        if status != "success":
+            return "<ERROR>"
+        return parse_tool_arguments(result)
@@ -0,0 +1,207 @@
+import copy
+import re
+from typing import Any, Dict, List, Tuple
+
+# Limits of the provider's strict (structured output) mode.
+MAX_DEPTH = 10
+MAX_PROPERTIES = 5000
+MAX_ENUM_VALUES = 1000
+
+SUPPORTED_TYPES = {"string", "number", "integer", "boolean", "object", "array", "null"}
+SUPPORTED_KEYWORDS = {
+    "type", "description", "title", "properties", "required", "additionalProperties",
+    "items", "enum", "const", "anyOf", "$ref", "$defs", "definitions",
+}
+# Common spellings of supported types, repaired in place.
+TYPE_ALIASES = {
+    "str": "string", "text": "string", "int": "integer", "float": "number",
+    "double": "number", "bool": "boolean", "dict": "object", "list": "array",
+}
+_NAME = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+
+
+class StrictSchemaError(ValueError):
+    """A function definition breaks strict-mode rules in a way that cannot be repaired."""
+
+    def __init__(self, problems: List[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+class _Walk:
+    """
+    One pass over a parameters schema. With repair=True fixable issues are
+    fixed in place and listed in fixes; otherwise they are listed in problems
+    next to the unfixable ones.
+    """
+
+    def __init__(self, repair: bool, max_depth: int):
+        self.repair = repair
+        self.max_depth = max_depth
+        self.fixes: List[str] = []
+        self.problems: List[str] = []
+        self.properties = 0
+        self.enum_values = 0
+
+    def fixable(self, message: str) -> bool:
+        (self.fixes if self.repair else self.problems).append(message)
+        return self.repair
+
+    def schema(self, node: Any, path: str, depth: int, root: bool = False) -> None:
+        if not isinstance(node, dict):
+            self.problems.append(f"{path}: schema must be an object")
+            return
+
+        for keyword in [k for k in node if k not in SUPPORTED_KEYWORDS]:
+            if self.fixable(f"{path}: removed unsupported keyword '{keyword}'"):
+                del node[keyword]
+
+        for defs_key in ("$defs", "definitions"):
+            for name, sub in (node.get(defs_key) or {}).items():
+                self.schema(sub, f"{path}/{defs_key}/{name}", depth)
+        if "$ref" in node:
+            return
+        if "anyOf" in node:
+            if root:
+                self.problems.append(f"{path}: the root schema cannot be anyOf")
+            for i, sub in enumerate(node["anyOf"] or []):
+                self.schema(sub, f"{path}/anyOf/{i}", depth)
+            return
+
+        types = self.types(node, path, root)
+        if types is None:
+            return
+        if "enum" in node:
+            self.enum_values += len(node["enum"] or [])
+        if "object" in types:
+            self.object(node, path, depth + 1)
+        if "array" in types:
+            if depth + 1 > self.max_depth:
+                self.problems.append(f"{path}: nested deeper than {self.max_depth} levels")
+            elif not isinstance(node.get("items"), dict):
+                self.problems.append(f"{path}: array without an 'items' schema")
+            else:
+                self.schema(node["items"], f"{path}/items", depth + 1)
+
+    def types(self, node: Dict[str, Any], path: str, root: bool):
+        declared = node.get("type")
+        if declared is None:
+            if "properties" in node or root:
+                inferred = "object"
+            elif "items" in node:
+                inferred = "array"
+            elif "enum" in node and node["enum"] and all(isinstance(v, str) for v in node["enum"]):
+                inferred = "string"
+            else:
+                self.problems.append(f"{path}: missing 'type'")
+                return None
+            if self.fixable(f"{path}: set missing type to '{inferred}'"):
+                node["type"] = inferred
+            declared = inferred
+
+        names = declared if isinstance(declared, list) else [declared]
+        repaired = []
+        for name in names:
+            alias = TYPE_ALIASES.get(str(name).lower())
+            if name in SUPPORTED_TYPES:
+                repaired.append(name)
+            elif alias:
+                self.fixable(f"{path}: replaced type '{name}' with '{alias}'")
+                repaired.append(alias)
+            else:
+                self.problems.append(f"{path}: unsupported type '{name}'")
+                return None
+        if self.repair and repaired != names:
+            node["type"] = repaired if isinstance(declared, list) else repaired[0]
+        if root and repaired != ["object"]:
+            self.problems.append(f"{path}: the root schema must be of type 'object'")
+            return None
+        return set(repaired)
+
+    def object(self, node: Dict[str, Any], path: str, depth: int) -> None:
+        if depth > self.max_depth:
+            self.problems.append(f"{path}: nested deeper than {self.max_depth} levels")
+            return
+        properties = node.get("properties")
+        if properties is None:
+            properties = {}
+            if self.fixable(f"{path}: added empty 'properties'"):
+                node["properties"] = properties
+        if not isinstance(properties, dict):
+            self.problems.append(f"{path}: 'properties' must be an object")
+            return
+        self.properties += len(properties)
+
+        if node.get("additionalProperties") is not False:
+            if self.fixable(f"{path}: set additionalProperties to false"):
+                node["additionalProperties"] = False
+        required = node.get("required")
+        if not isinstance(required, list) or set(required) != set(properties) or len(required) != len(properties):
+            if self.fixable(f"{path}: made every property required"):
+                node["required"] = list(properties)
+
+        for name, sub in properties.items():
+            self.schema(sub, f"{path}/properties/{name}", depth)
+
+
+def _walk_function(function_def: Dict[str, Any], repair: bool, max_depth: int) -> _Walk:
+    walk = _Walk(repair, max_depth)
+    function = function_def.get("function") if isinstance(function_def, dict) else None
+    if not isinstance(function, dict):
+        walk.problems.append("not a function tool definition")
+        return walk
+
+    name = function.get("name")
+    if not isinstance(name, str) or not name.strip():
+        walk.problems.append("function: missing name")
+    elif not _NAME.match(name):
+        fixed = re.sub(r"[^a-zA-Z0-9_-]+", "_", name.strip())[:64].strip("_") or "function"
+        if walk.fixable(f"function: renamed '{name}' to '{fixed}'"):
+            function["name"] = fixed
+    if function.get("strict") is not True:
+        if walk.fixable("function: set strict to true"):
+            function["strict"] = True
+    if function_def.get("type") != "function":
+        if walk.fixable("set tool type to 'function'"):
+            function_def["type"] = "function"
+
+    if "parameters" not in function:
+        if walk.fixable("function: added empty parameters"):
+            function["parameters"] = {}
+    walk.schema(function.get("parameters", {}), "parameters", 0, root=True)
+    if walk.properties > MAX_PROPERTIES:
+        walk.problems.append(f"more than {MAX_PROPERTIES} properties in total")
+    if walk.enum_values > MAX_ENUM_VALUES:
+        walk.problems.append(f"more than {MAX_ENUM_VALUES} enum values in total")
+    return walk
+
+
+def strict_schema_problems(function_def: Dict[str, Any], max_depth: int = MAX_DEPTH) -> List[str]:
+    """
+    Every way a tool definition ({"type": "function", "function": {...}})
+    breaks the provider's strict-mode rules; empty if it would be accepted.
+    Checked locally: additionalProperties false on every object, every
+    property required, supported types and keywords, nesting depth and the
+    property / enum size limits.
+    """
+    return _walk_function(function_def, repair=False, max_depth=max_depth).problems
+
+
+def repair_function_definition(
+    function_def: Dict[str, Any],
+    max_depth: int = MAX_DEPTH
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Returns a strict-mode compliant copy of a tool definition plus the fixes
+    that were applied (missing additionalProperties/required, type aliases
+    like "int", unsupported keywords such as minLength, ...).
+
+    :raises StrictSchemaError: If problems remain that cannot be fixed
+                               automatically (e.g. an array without items,
+                               a non-object root, too deep a nesting).
+    """
+    repaired = copy.deepcopy(function_def)
+    walk = _walk_function(repaired, repair=True, max_depth=max_depth)
+    if walk.problems:
+        raise StrictSchemaError(walk.problems)
+    return repaired, walk.fixes
@@ -0,0 +1,149 @@
+import json
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+def holds_same_parts(stored: Dict[str, Any], template: Dict[str, Any]) -> bool:
+    """
+    True if every part of a request template (its non-message values and
+    shared messages) is the same object as in stored.
+    """
+    if stored.keys() != template.keys():
+        return False
+    if any(stored[key] is not value for key, value in template.items() if key != "messages"):
+        return False
+    return len(stored["messages"]) == len(template["messages"]) and all(
+        a is b for a, b in zip(stored["messages"], template["messages"])
+    )
+
+
+class TaskStore:
+    """
+    Compact, append-only container for millions of queued tasks.
+
+    A task dict normally holds its own nested request (model, tools, system message,
+    user message, ...). TaskStore splits every task into:
+      • a shared request template — everything except the last (per-row) message —
+        stored once and referenced by index,
+      • a per-row payload — custom_id, last message and metadata — kept as compact
+        UTF-8 JSON in one bytearray, addressed through an offsets array.
+
+    Request dicts are only materialized when a task is read (iteration or indexing),
+    i.e. when the orchestrator pulls it into its queue window right before sending.
+    A TaskStore can be passed anywhere a list of tasks is accepted.
+    """
+
+    __slots__ = (
+        "_templates",
+        "_templates_by_identity",
+        "_templates_by_signature",
+        "_payload",
+        "_offsets",
+        "_template_ids",
+    )
+
+    def __init__(self, tasks: Iterable[Dict[str, Any]] = None):
+        self._templates: List[Dict[str, Any]] = []
+        # (id(value), ...) of a template's parts -> template index. Only recorded
+        # for the very objects a stored template holds, so their ids cannot be
+        # recycled while the entry exists.
+        self._templates_by_identity: Dict[Tuple, int] = {}
+        # Serialized template -> index, to dedupe equal but distinct objects.
+        self._templates_by_signature: Dict[str, int] = {}
+        self._payload = bytearray()
+        self._offsets = array("Q", [0])
+        self._template_ids = array("I")
+        if tasks is not None:
+            self.extend(tasks)
+
+    def append(self, task: Dict[str, Any]) -> None:
+        """
+        Add one task ({custom_id, request, metadata?}) to the store.
+        """
+        request = task.get("request", {})
+        messages = request.get("messages", [])
+        template_id = self._template_id(request, messages)
+
+        row = {
+            "custom_id": task.get("custom_id"),
+            "message": messages[-1] if messages else None,
+        }
+        if task.get("metadata"):
+            row["metadata"] = task["metadata"]
+
+        self._payload += json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._offsets.append(len(self._payload))
+        self._template_ids.append(template_id)
+
+    def extend(self, tasks: Iterable[Dict[str, Any]]) -> None:
+        for task in tasks:
+            self.append(task)
+
+    def _template_id(self, request: Dict[str, Any], messages: List[Dict[str, Any]]) -> int:
+        shared_messages = messages[:-1]
+        identity = tuple(
+            (key, id(value)) for key, value in request.items() if key != "messages"
+        ) + tuple(id(m) for m in shared_messages)
+
+        template_id = self._templates_by_identity.get(identity)
+        if template_id is not None:
+            return template_id
+
+        template = {key: value for key, value in request.items() if key != "messages"}
+        template["messages"] = shared_messages
+        signature = json.dumps(template, sort_keys=True, ensure_ascii=False)
+
+        template_id = self._templates_by_signature.get(signature)
+        if template_id is None:
+            template_id = len(self._templates)
+            self._templates.append(template)
+            self._templates_by_signature[signature] = template_id
+            self._templates_by_identity[identity] = template_id
+        elif holds_same_parts(self._templates[template_id], template):
+            self._templates_by_identity[identity] = template_id
+        # Otherwise the parts are equal copies the store does not keep alive:
+        # their ids may be reused by unrelated objects, so only the signature counts.
+        return template_id
+
+    def __len__(self) -> int:
+        return len(self._template_ids)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TaskStore index out of range")
+
+        start, end = self._offsets[index], self._offsets[index + 1]
+        row = json.loads(self._payload[start:end].decode("utf-8"))
+        template = self._templates[self._template_ids[index]]
+
+        request = {key: value for key, value in template.items() if key != "messages"}
+        messages = list(template["messages"])
+        if row["message"] is not None:
+            messages.append(row["message"])
+        request["messages"] = messages
+
+        task = {"custom_id": row["custom_id"], "request": request}
+        if "metadata" in row:
+            task["metadata"] = row["metadata"]
+        return task
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def num_templates(self) -> int:
+        return len(self._templates)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate size of the per-row storage (payload + index arrays), in bytes.
+        """
+        return (
+            len(self._payload)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._template_ids.itemsize * len(self._template_ids)
+        )
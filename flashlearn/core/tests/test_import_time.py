@@ -0,0 +1,49 @@
+import ast
+import os
+import subprocess
+import sys
+
+import flashlearn
+
+# Cumulative import time allowed for flashlearn.skills / flashlearn.utils, in
+# microseconds. The real figure is well under 0.2 s; the margin absorbs slow CI.
+IMPORT_BUDGET_US = 1_500_000
+
+HEAVY_MODULES = ("litellm", "openai", "kagglehub", "PIL", "tiktoken")
+
+
+def _importtime(statement):
+    """
+    Runs `statement` in a fresh interpreter with -X importtime and returns
+    ({module: cumulative_us}, loaded_heavy_modules).
+    """
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(flashlearn.__file__)))
+    env = dict(os.environ, PYTHONPATH=repo_root)
+    check = f"import sys; {statement}; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        timings[name] = int(cumulative)
+    return timings, ast.literal_eval(proc.stdout.strip())
+
+
+def test_import_skills_and_utils_is_lightweight():
+    timings, heavy = _importtime("import flashlearn.skills, flashlearn.utils")
+    assert heavy == []
+    assert timings["flashlearn.skills"] < IMPORT_BUDGET_US
+    assert timings["flashlearn.utils"] < IMPORT_BUDGET_US
+
+
+def test_default_client_is_created_lazily():
+    _, heavy = _importtime(
+        "from flashlearn.skills import GeneralSkill; "
+        "skill = GeneralSkill(model_name='m', function_definition={}); "
+        "assert type(skill.client).__name__ == 'FlashLiteLLMClient'"
+    )
+    assert heavy == []
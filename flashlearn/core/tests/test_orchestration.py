@@ -413,3 +413,251 @@ def unlimited_time_side_effect():
         yield current
         current += step
 
+
+# ==============================================================================
+# Cached prompt tokens
+# ==============================================================================
+def test_cached_prompt_tokens():
+    """
+    Reads usage.prompt_tokens_details.cached_tokens from objects or dicts, else 0.
+    """
+    from types import SimpleNamespace
+    from flashlearn.core.orchestration import cached_prompt_tokens
+
+    usage = SimpleNamespace(prompt_tokens_details=SimpleNamespace(cached_tokens=7))
+    assert cached_prompt_tokens(usage) == 7
+    assert cached_prompt_tokens(SimpleNamespace(prompt_tokens_details={"cached_tokens": 3})) == 3
+    assert cached_prompt_tokens(SimpleNamespace()) == 0
+    assert cached_prompt_tokens(MagicMock()) == 0
+
+@patch("flashlearn.core.orchestration.append_to_jsonl")
+def test_save_success_records_cached_tokens(mock_append, parallel_task_fixture):
+    """
+    _save_success adds the cached prompt tokens to the status tracker.
+    """
+    status = StatusTracker()
+    parallel_task_fixture._save_success(
+        filepath=None,
+        response_json={"ok": True},
+        status_tracker=status,
+        prompt_tokens=10,
+        completion_tokens=5,
+        cached_tokens=8,
+    )
+    assert status.total_cached_tokens == 8
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_accepts_generator():
+    """
+    tasks_data can be a generator; every task is pulled and processed.
+    """
+    mock_client = MagicMock()
+    mock_response = MagicMock()
+    type(mock_response).usage = MagicMock(prompt_tokens=1, completion_tokens=1)
+    mock_response.choices[0].message.tool_calls[0].function.arguments = '{"answer": "ok"}'
+    mock_client.chat.completions.create.return_value = mock_response
+
+    def tasks():
+        for i in range(3):
+            yield {"custom_id": f"gen{i}", "request": {"messages": [{"role": "user", "content": "hi"}]}}
+
+    results, status = await process_tasks_in_parallel(
+        tasks_data=tasks(),
+        client=mock_client,
+        show_progress=False,
+    )
+    assert status.num_tasks_succeeded == 3
+    assert set(results) == {"gen0", "gen1", "gen2"}
+
+# ==============================================================================
+# Lazy media references
+# ==============================================================================
+def test_send_request_encodes_media_at_dispatch(parallel_task_fixture, tmp_path):
+    """
+    The client receives the encoded image while the stored request keeps the path.
+    """
+    from flashlearn.utils.media import MediaRef
+
+    image = tmp_path / "img.jpg"
+    image.write_bytes(b"jpeg bytes")
+    parallel_task_fixture.request_json = {
+        "messages": [{"role": "user", "content": [MediaRef(str(image)).to_block()]}]
+    }
+    parallel_task_fixture._send_request()
+
+    sent = parallel_task_fixture.client.chat.completions.create.call_args[1]
+    assert sent["messages"][0]["content"][0]["image_url"]["url"].startswith("data:image/jpeg;base64,")
+    assert parallel_task_fixture.request_json["messages"][0]["content"][0]["type"] == "media_ref"
+
+# ==============================================================================
+# Output validation
+# ==============================================================================
+def _tool_response(arguments):
+    response = MagicMock()
+    type(response).usage = MagicMock(prompt_tokens=1, completion_tokens=1)
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [MagicMock()]
+    response.choices[0].message.tool_calls[0].function.arguments = arguments
+    return response
+
+
+def _schema_task(custom_id, tools):
+    return {
+        "custom_id": custom_id,
+        "request": {"messages": [{"role": "user", "content": "hi"}], "tools": tools},
+    }
+
+
+_TOOLS = [{
+    "type": "function",
+    "function": {
+        "name": "answer",
+        "parameters": {
+            "type": "object",
+            "properties": {"answer": {"type": "string"}},
+            "required": ["answer"],
+            "additionalProperties": False,
+        },
+    },
+}]
+
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_retries_only_invalid_outputs():
+    """
+    A row whose output fails the schema is re-queued on its own; valid rows
+    are stored once and never re-sent.
+    """
+    replies = {"ok": ['{"answer": "fine"}'], "bad": ['"just a string"', '{"answer": "fixed"}']}
+
+    def mock_create(**kwargs):
+        return _tool_response(replies[kwargs["messages"][0]["content"]].pop(0))
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.side_effect = mock_create
+    tasks = [_schema_task("ok", _TOOLS), _schema_task("bad", _TOOLS)]
+    tasks[0]["request"]["messages"][0]["content"] = "ok"
+    tasks[1]["request"]["messages"][0]["content"] = "bad"
+
+    results, status = await process_tasks_in_parallel(
+        tasks_data=tasks, client=mock_client, max_attempts=2, show_progress=False,
+    )
+    assert results == {"ok": {"answer": "fine"}, "bad": {"answer": "fixed"}}
+    assert status.num_invalid_outputs == 1
+    assert status.num_tasks_succeeded == 2
+    assert mock_client.chat.completions.create.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_invalid_output_fails_after_attempts():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"wrong": 1}')
+
+    results, status = await process_tasks_in_parallel(
+        tasks_data=[_schema_task("t", _TOOLS)], client=mock_client, max_attempts=2, show_progress=False,
+    )
+    assert results["t"] == "<ERROR>"
+    assert status.num_invalid_outputs == 2
+    assert status.num_tasks_failed == 1
+
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_validation_can_be_disabled():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"wrong": 1}')
+
+    results, status = await process_tasks_in_parallel(
+        tasks_data=[_schema_task("t", _TOOLS)], client=mock_client,
+        show_progress=False, validate_outputs=False,
+    )
+    assert results["t"] == {"wrong": 1}
+    assert status.num_invalid_outputs == 0
+
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_raw_results_are_lazy():
+    from flashlearn.core.tool_arguments import LazyArguments
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"answer": "x"}')
+
+    results, status = await process_tasks_in_parallel(
+        tasks_data=[_schema_task("t", _TOOLS)], client=mock_client, show_progress=False,
+        raw_results=True, validate_outputs=False,
+    )
+    assert isinstance(results["t"], LazyArguments)
+    assert not results["t"].is_parsed
+    assert results["t"]["answer"] == "x"
+
+
+# ==============================================================================
+# Result callbacks and streaming
+# ==============================================================================
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_on_result_callback():
+    seen = []
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"answer": "x"}')
+
+    def on_result(custom_id, result):
+        seen.append((custom_id, result))
+        raise RuntimeError("callback errors are logged, not retried")
+
+    _, status = await process_tasks_in_parallel(
+        tasks_data=[_schema_task("a", _TOOLS), _schema_task("b", _TOOLS)],
+        client=mock_client, show_progress=False, on_result=on_result,
+    )
+    assert sorted(seen) == [("a", {"answer": "x"}), ("b", {"answer": "x"})]
+    assert status.num_tasks_succeeded == 2
+    assert mock_client.chat.completions.create.call_count == 2
+
+
+def test_stream_tasks_in_parallel_yields_results():
+    from flashlearn.core.orchestration import stream_tasks_in_parallel
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"answer": "x"}')
+    tasks = (_schema_task(str(i), _TOOLS) for i in range(10))
+
+    stream = stream_tasks_in_parallel(tasks, mock_client, buffer_size=2)
+    results = dict(stream)
+    assert results == {str(i): {"answer": "x"} for i in range(10)}
+    assert stream.status.num_tasks_succeeded == 10
+
+
+def test_stream_close_stops_sending_requests():
+    from flashlearn.core.orchestration import stream_tasks_in_parallel
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"answer": "x"}')
+    tasks = (_schema_task(str(i), _TOOLS) for i in range(100))
+
+    stream = stream_tasks_in_parallel(tasks, mock_client, buffer_size=2, max_requests_per_minute=600)
+    for _ in stream:
+        break
+    stream._thread.join(timeout=10)
+    assert not stream._thread.is_alive()
+    # Leaving the loop closed the stream: only the requests already in flight were sent
+    assert mock_client.chat.completions.create.call_count < 10
+
+
+def test_logprob_output_reads_top_logprobs():
+    from flashlearn.core.validation import InvalidOutputError
+
+    # Choices as plain dicts, the shape some providers return through litellm
+    completion = MagicMock(choices=[{
+        "message": {"content": "A"},
+        "logprobs": {"content": [{"token": "A", "logprob": -0.1, "top_logprobs": [
+            {"token": "A", "logprob": -0.1}, {"token": "B", "logprob": -2.4},
+        ]}]},
+    }])
+    assert ParallelTask._logprob_output(completion) == {
+        "content": "A", "top_logprobs": {"A": -0.1, "B": -2.4}
+    }
+
+    # No logprobs is not retried; the caller falls back for that row
+    without = MagicMock(choices=[{"message": {"content": "A"}, "logprobs": None}])
+    assert ParallelTask._logprob_output(without) == {"content": "A", "top_logprobs": {}}
+
+    with pytest.raises(InvalidOutputError, match="no message"):
+        ParallelTask._logprob_output(MagicMock(choices=[]))
@@ -0,0 +1,101 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from flashlearn.core.orchestration import process_tasks_in_parallel
+from flashlearn.core.result_store import ResultStore
+from flashlearn.core.tool_arguments import LazyArguments
+
+SYSTEM = {"role": "system", "content": "long shared system prompt " * 50}
+TOOLS = [{"type": "function", "function": {"name": "f", "parameters": {"type": "object"}}}]
+
+
+def _request(text):
+    return {"model": "m", "tools": TOOLS, "messages": [SYSTEM, {"role": "user", "content": text}]}
+
+
+def test_record_and_read_back(tmp_path):
+    with ResultStore(str(tmp_path / "r.sqlite")) as store:
+        store.record("a", _request("x"), {"label": "pos"}, metadata={"row": 1},
+                     prompt_tokens=10, completion_tokens=2, cached_tokens=5, latency=0.5)
+        store.record("b", _request("y"), ["boom"], status="failed")
+        store.record("c", _request("z"), LazyArguments('{"label": "neg"}'))
+
+        assert len(store) == 3
+        assert store.get("a") == {"label": "pos"}
+        assert store.get("b") == "<ERROR>"
+        assert store.get("c") == {"label": "neg"}
+        assert store.get("missing", 0) == 0
+        assert list(store.results())[0] == ("a", {"label": "pos"})
+        assert store.usage()["prompt_tokens"] == 10
+        assert store.usage()["succeeded"] == 2
+
+
+def test_templates_stored_once_and_requests_opt_in(tmp_path):
+    path = str(tmp_path / "r.sqlite")
+    with ResultStore(path) as store:
+        for i in range(20):
+            store.record(str(i), _request(f"row {i}"), {"i": i})
+        assert store._conn.execute("SELECT COUNT(*) FROM templates").fetchone()[0] == 1
+        assert store.request("0") is None
+
+    with ResultStore(path, store_requests=True) as store:
+        store.record("r", _request("kept"), {})
+        assert store.request("r") == json.loads(json.dumps(_request("kept")))
+
+
+
+def test_template_cache_keeps_only_template_parts(tmp_path):
+    """
+    The template cache must not keep per-row messages (possibly large media)
+    alive, and fresh template objects must not alias through recycled ids.
+    """
+    import gc
+    import weakref
+
+    class Message(dict):
+        pass
+
+    with ResultStore(str(tmp_path / "r.sqlite"), store_requests=True) as store:
+        tools = [{"type": "function", "function": {"name": "f"}}]
+        system = {"role": "system", "content": "prompt"}
+        user = Message(role="user", content="x" * 50_000)
+        user_ref = weakref.ref(user)
+        store.record("0", {"model": "m", "tools": tools, "messages": [system, user]}, {})
+        del user
+        gc.collect()
+        assert user_ref() is None
+
+        for i in range(2000):
+            prompt = "A" if i < 1000 else "B"
+            request = {
+                "model": "m",
+                "tools": [{"type": "function", "function": {"name": prompt}}],
+                "messages": [{"role": "system", "content": prompt}, {"role": "user", "content": str(i)}],
+            }
+            store.record(f"r{i}", request, {})
+        assert store.request("r1999")["messages"][0]["content"] == "B"
+        assert store.request("r0")["messages"][0]["content"] == "A"
+        assert store._conn.execute("SELECT COUNT(*) FROM templates").fetchone()[0] == 3
+
+@pytest.mark.asyncio
+async def test_process_tasks_in_parallel_writes_result_store(tmp_path):
+    response = MagicMock()
+    type(response).usage = MagicMock(prompt_tokens=3, completion_tokens=1)
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [MagicMock()]
+    response.choices[0].message.tool_calls[0].function.arguments = '{"answer": "ok"}'
+    client = MagicMock()
+    client.chat.completions.create.return_value = response
+
+    path = str(tmp_path / "run.sqlite")
+    tasks = [{"custom_id": str(i), "request": _request(str(i))} for i in range(5)]
+    await process_tasks_in_parallel(
+        tasks_data=tasks, client=client, show_progress=False, return_results=False, result_store=path,
+    )
+
+    with ResultStore(path) as store:
+        assert store.to_dict() == {str(i): {"answer": "ok"} for i in range(5)}
+        assert store.usage()["prompt_tokens"] == 15
+        assert store.usage()["mean_latency"] is not None
@@ -0,0 +1,102 @@
+import pytest
+
+from flashlearn.core.strict_schema import (
+    StrictSchemaError,
+    repair_function_definition,
+    strict_schema_problems,
+)
+
+
+def _tool(parameters, name="f", strict=True):
+    return {"type": "function", "function": {"name": name, "strict": strict, "parameters": parameters}}
+
+
+STRICT = _tool({
+    "type": "object",
+    "properties": {
+        "label": {"type": "string", "enum": ["a", "b"]},
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"score": {"type": ["number", "null"]}},
+                "required": ["score"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["label", "items"],
+    "additionalProperties": False,
+})
+
+
+def test_compliant_definition_has_no_problems():
+    assert strict_schema_problems(STRICT) == []
+    repaired, fixes = repair_function_definition(STRICT)
+    assert repaired == STRICT
+    assert fixes == []
+
+
+def test_repairs_fixable_issues_without_touching_input():
+    loose = _tool({
+        "properties": {
+            "score": {"type": "int", "minimum": 1, "maximum": 100},
+            "reason": {"type": "string", "maxLength": 200},
+            "details": {"type": "object", "properties": {"note": {"type": "str"}}},
+        },
+        "required": ["score"],
+    }, name="score comments!", strict=False)
+
+    problems = strict_schema_problems(loose)
+    assert any("additionalProperties" in p for p in problems)
+    repaired, fixes = repair_function_definition(loose)
+    assert strict_schema_problems(repaired) == []
+    assert len(fixes) == len(problems)
+
+    function = repaired["function"]
+    assert function["name"] == "score_comments"
+    assert function["strict"] is True
+    params = function["parameters"]
+    assert params["type"] == "object"
+    assert params["required"] == ["score", "reason", "details"]
+    assert params["properties"]["score"] == {"type": "integer"}
+    assert params["properties"]["details"]["additionalProperties"] is False
+    assert params["properties"]["details"]["properties"]["note"] == {"type": "string"}
+    # The input is left as it was
+    assert "additionalProperties" not in loose["function"]["parameters"]
+
+
+def test_unfixable_issues_raise():
+    with pytest.raises(StrictSchemaError, match="items"):
+        repair_function_definition(_tool({"type": "object", "properties": {"tags": {"type": "array"}}}))
+    with pytest.raises(StrictSchemaError, match="unsupported type"):
+        repair_function_definition(_tool({"type": "object", "properties": {"x": {"type": "date"}}}))
+    with pytest.raises(StrictSchemaError, match="root"):
+        repair_function_definition(_tool({"type": "string"}))
+    with pytest.raises(StrictSchemaError, match="not a function"):
+        repair_function_definition({"name": "f"})
+
+
+def test_nesting_depth_limit():
+    node = {"type": "string"}
+    for _ in range(4):
+        node = {"type": "object", "properties": {"child": node}}
+    tool = _tool(node)
+    repair_function_definition(tool, max_depth=4)
+    with pytest.raises(StrictSchemaError) as excinfo:
+        repair_function_definition(tool, max_depth=3)
+    assert any("deeper than 3" in p for p in excinfo.value.problems)
+
+
+def test_anyof_and_refs_are_checked():
+    tool = _tool({
+        "type": "object",
+        "properties": {
+            "value": {"anyOf": [{"type": "string"}, {"$ref": "#/$defs/point"}]},
+        },
+        "$defs": {"point": {"type": "object", "properties": {"x": {"type": "number"}}}},
+    })
+    repaired, fixes = repair_function_definition(tool)
+    point = repaired["function"]["parameters"]["$defs"]["point"]
+    assert point["additionalProperties"] is False and point["required"] == ["x"]
+    assert any("$defs/point" in fix for fix in fixes)
@@ -0,0 +1,96 @@
+import pytest
+
+from flashlearn.core import TaskStore
+
+
+def make_tasks(n, tools=None, system_msg=None):
+    """
+    Build n tasks that share their tools list and system message, like create_tasks does.
+    """
+    tools = tools or [{"type": "function", "function": {"name": "f", "parameters": {}}}]
+    system_msg = system_msg or {"role": "system", "content": "prompt"}
+    return [
+        {
+            "custom_id": str(i),
+            "request": {
+                "model": "gpt-4o-mini",
+                "tools": tools,
+                "tool_choice": "required",
+                "messages": [system_msg, {"role": "user", "content": f"row {i}"}],
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def test_round_trip_materializes_original_tasks():
+    """
+    Every stored task reads back equal to the task that was added.
+    """
+    tasks = make_tasks(5)
+    store = TaskStore(tasks)
+    assert len(store) == 5
+    assert list(store) == tasks
+    assert store[-1] == tasks[-1]
+
+
+def test_shared_template_is_stored_once():
+    """
+    Tasks sharing tools/system message produce a single template, and materialized
+    requests reference the same shared objects.
+    """
+    store = TaskStore(make_tasks(100))
+    assert store.num_templates == 1
+    first, second = store[0]["request"], store[1]["request"]
+    assert first["tools"] is second["tools"]
+    assert first["messages"][0] is second["messages"][0]
+
+
+def test_equal_templates_from_distinct_objects_are_deduplicated():
+    """
+    Equal templates built from different objects still map to one template.
+    """
+    store = TaskStore(make_tasks(2) + make_tasks(2))
+    assert store.num_templates == 1
+    store.extend(make_tasks(1, system_msg={"role": "system", "content": "other"}))
+    assert store.num_templates == 2
+    assert store[4]["request"]["messages"][0]["content"] == "other"
+
+
+def test_metadata_round_trip_and_index_error():
+    """
+    Metadata is preserved; out-of-range access raises IndexError.
+    """
+    task = make_tasks(1)[0]
+    task["metadata"] = {"row_ids": ["0", "1"]}
+    store = TaskStore([task])
+    assert store[0]["metadata"] == {"row_ids": ["0", "1"]}
+    assert store.nbytes > 0
+    with pytest.raises(IndexError):
+        store[1]
+
+
+def test_fresh_template_objects_do_not_alias_through_recycled_ids():
+    """
+    Rows whose tools/system message are fresh dicts (freed after each append)
+    must not be matched to an earlier template through a recycled id().
+    """
+    def fresh_tasks():
+        for i in range(2000):
+            prompt = "A" if i < 1000 else "B"
+            yield {
+                "custom_id": str(i),
+                "request": {
+                    "model": "gpt-4o-mini",
+                    "tools": [{"type": "function", "function": {"name": prompt, "parameters": {}}}],
+                    "messages": [{"role": "system", "content": prompt}, {"role": "user", "content": f"row {i}"}],
+                },
+            }
+
+    store = TaskStore(fresh_tasks())
+    assert store.num_templates == 2
+    for i in (0, 999, 1000, 1999):
+        expected = "A" if i < 1000 else "B"
+        request = store[i]["request"]
+        assert request["messages"][0]["content"] == expected
+        assert request["tools"][0]["function"]["name"] == expected
@@ -0,0 +1,44 @@
+import json
+
+from flashlearn.core.orchestration import append_to_jsonl
+from flashlearn.core.tool_arguments import LazyArguments, parse_tool_arguments, unwrap_function_definition
+
+
+def test_parse_tool_arguments_fallback_order():
+    # JSON first: true/false/null work
+    assert parse_tool_arguments('{"a": true, "b": null}') == {"a": True, "b": None}
+    # Python literal second
+    assert parse_tool_arguments("{'a': True}") == {"a": True}
+    # Otherwise the raw input
+    assert parse_tool_arguments("{ not valid") == "{ not valid"
+    assert parse_tool_arguments(b'{"a": 1}') == {"a": 1}
+    assert parse_tool_arguments({"already": "parsed"}) == {"already": "parsed"}
+
+
+def test_unwrap_function_definition():
+    wrapped = {"function_definition": json.dumps({"name": "f", "parameters": {}})}
+    assert unwrap_function_definition(wrapped) == {
+        "type": "function",
+        "function": {"name": "f", "parameters": {}, "strict": True},
+    }
+    assert unwrap_function_definition({"function_definition": "not json"}) == {"function_definition": "not json"}
+    assert unwrap_function_definition("raw") == "raw"
+
+
+def test_lazy_arguments_parse_on_first_access():
+    lazy = LazyArguments('{"label": "a", "score": 1}')
+    assert not lazy.is_parsed
+    assert str(lazy) == lazy.raw
+    assert lazy["label"] == "a"
+    assert lazy.is_parsed
+    assert lazy.get("missing", 0) == 0
+    assert dict(lazy.items()) == {"label": "a", "score": 1}
+    assert lazy == {"label": "a", "score": 1}
+
+
+def test_append_to_jsonl_writes_lazy_arguments_raw(tmp_path):
+    path = tmp_path / "out.jsonl"
+    lazy = LazyArguments('{"label": "a"}')
+    append_to_jsonl([{"req": 1}, lazy], str(path))
+    assert json.loads(path.read_text()) == [{"req": 1}, '{"label": "a"}']
+    assert not lazy.is_parsed
@@ -0,0 +1,41 @@
+import pytest
+
+from flashlearn.core.validation import InvalidOutputError, OutputValidator, ValidatorCache
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"label": {"type": "string", "enum": ["a", "b"]}},
+    "required": ["label"],
+    "additionalProperties": False,
+}
+
+
+def _request(parameters):
+    return {"tools": [{"type": "function", "function": {"name": "f", "parameters": parameters}}]}
+
+
+def test_output_validator_accepts_and_rejects():
+    validator = OutputValidator(SCHEMA)
+    validator({"label": "a"})
+    with pytest.raises(InvalidOutputError, match="label"):
+        validator({"label": "c"})
+    with pytest.raises(InvalidOutputError):
+        validator({"label": "a", "extra": 1})
+    with pytest.raises(InvalidOutputError, match="JSON object"):
+        validator("<PARSE_ERROR: boom>")
+
+
+def test_validator_cache_compiles_once_per_schema():
+    cache = ValidatorCache()
+    shared = _request(SCHEMA)
+    first = cache.for_request(shared)
+    assert cache.for_request(shared) is first
+    # Equal schema held by a different object reuses the compiled validator
+    assert cache.for_request(_request(dict(SCHEMA))) is first
+
+
+def test_validator_cache_skips_requests_without_a_usable_schema():
+    cache = ValidatorCache()
+    assert cache.for_request({"messages": []}) is None
+    assert cache.for_request({"tools": [{"function": {"name": "f"}}]}) is None
+    assert cache.for_request(_request({"type": "not-a-type"})) is None
@@ -0,0 +1,122 @@
+import ast
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+_UNSET = object()
+
+
+def json_loads(data: Any) -> Any:
+    """
+    json.loads, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_tool_arguments(args: Any) -> Any:
+    """
+    Parses tool-call arguments, in order:
+      1. JSON (orjson if installed) — what models emit almost always;
+      2. a Python literal (ast.literal_eval) — for single-quoted dict reprs;
+      3. otherwise the input is returned unchanged (e.g. the raw string).
+    Non-string inputs (already parsed values) are returned as-is.
+    """
+    if isinstance(args, (bytes, bytearray)):
+        args = args.decode("utf-8", errors="replace")
+    if not isinstance(args, str):
+        return args
+    try:
+        return json_loads(args)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(args)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return args
+
+
+def unwrap_function_definition(args_obj: Any) -> Any:
+    """
+    If the arguments hold a "function_definition" JSON string (skills that
+    generate other skills), returns it as a strict tool definition; otherwise
+    returns the arguments unchanged.
+    """
+    if not isinstance(args_obj, dict) or not isinstance(args_obj.get("function_definition"), str):
+        return args_obj
+    try:
+        function_obj = json_loads(args_obj["function_definition"])
+    except ValueError:
+        return args_obj
+    if not isinstance(function_obj, dict):
+        return args_obj
+    function_obj["strict"] = True
+    return {"type": "function", "function": function_obj}
+
+
+class LazyArguments:
+    """
+    Raw tool-call arguments that are parsed only when first accessed.
+
+    Used for results when process_tasks_in_parallel(raw_results=True): runs
+    that only stream results to disk keep the model's argument string as-is
+    (append_to_jsonl writes it as that string) and never build Python objects
+    for it. Reading it like a dict (res["key"], res.get, iteration) or via
+    .value parses it once with parse_tool_arguments.
+    """
+
+    __slots__ = ("raw", "_value")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._value = _UNSET
+
+    @property
+    def value(self) -> Any:
+        if self._value is _UNSET:
+            self._value = parse_tool_arguments(self.raw)
+        return self._value
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._value is not _UNSET
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def get(self, key, default=None):
+        value = self.value
+        return value.get(key, default) if isinstance(value, dict) else default
+
+    def keys(self):
+        return self.value.keys()
+
+    def items(self):
+        return self.value.items()
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, key):
+        return key in self.value
+
+    def __eq__(self, other):
+        if isinstance(other, LazyArguments):
+            return self.raw == other.raw or self.value == other.value
+        return self.value == other
+
+    __hash__ = None
+
+    def __str__(self):
+        return self.raw
+
+    def __repr__(self):
+        return f"LazyArguments({self.raw!r})"
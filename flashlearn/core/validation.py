@@ -0,0 +1,89 @@
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("ParallelProcessor")
+
+_MISSING = object()
+
+
+class InvalidOutputError(Exception):
+    """The model's tool-call arguments do not match the tool's parameters schema."""
+
+
+class OutputValidator:
+    """
+    A jsonschema validator compiled once for one tool's "parameters" schema.
+    Calling it with parsed tool-call arguments raises InvalidOutputError if they
+    do not conform (including unparsed strings and <PARSE_ERROR> markers).
+    """
+
+    __slots__ = ("schema", "_validator")
+
+    def __init__(self, schema: Dict[str, Any]):
+        from jsonschema.validators import validator_for
+
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.schema = schema
+        self._validator = validator_cls(schema)
+
+    def __call__(self, output: Any) -> None:
+        if not isinstance(output, dict):
+            raise InvalidOutputError(f"Expected a JSON object, got: {str(output)[:200]}")
+        if self._validator.is_valid(output):
+            return
+        from jsonschema.exceptions import best_match
+
+        error = best_match(self._validator.iter_errors(output))
+        location = "/".join(str(p) for p in error.absolute_path) or "<root>"
+        raise InvalidOutputError(f"Output does not match schema at {location}: {error.message}")
+
+
+class ValidatorCache:
+    """
+    Hands out one OutputValidator per distinct parameters schema.
+
+    Skills share one tools list across all their tasks, so lookups are normally
+    by object identity (the cache keeps a reference, so ids are not recycled);
+    equal schemas held by different objects fall back to a JSON signature.
+    Schemas that jsonschema rejects are not validated.
+    """
+
+    def __init__(self):
+        self._by_identity: Dict[int, Tuple[Dict[str, Any], Optional[OutputValidator]]] = {}
+        self._by_signature: Dict[str, Optional[OutputValidator]] = {}
+
+    def for_request(self, request_json: Dict[str, Any]) -> Optional[OutputValidator]:
+        """
+        Returns the validator for the request's single tool, or None if the
+        request has no (or more than one) tool.
+        """
+        tools = request_json.get("tools")
+        if not isinstance(tools, list) or len(tools) != 1:
+            return None
+        parameters = (tools[0].get("function") or {}).get("parameters")
+        if not isinstance(parameters, dict):
+            return None
+
+        hit = self._by_identity.get(id(parameters))
+        if hit is not None:
+            return hit[1]
+
+        signature = json.dumps(parameters, sort_keys=True, default=str)
+        validator = self._by_signature.get(signature, _MISSING)
+        if validator is _MISSING:
+            validator = self._compile(parameters)
+            self._by_signature[signature] = validator
+        self._by_identity[id(parameters)] = (parameters, validator)
+        return validator
+
+    @staticmethod
+    def _compile(parameters: Dict[str, Any]) -> Optional[OutputValidator]:
+        from jsonschema.exceptions import SchemaError
+
+        try:
+            return OutputValidator(parameters)
+        except SchemaError as e:
+            logger.warning(f"Skipping output validation for an invalid schema: {e.message}")
+            return None
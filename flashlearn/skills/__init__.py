@@ -9,11 +9,22 @@ You can expose certain classes/functions here if desired.
 from .base_skill import BaseSkill
 from .classification import ClassificationSkill
 from .discover_labels import DiscoverLabelsSkill
+from .distilled_classification import DistilledClassificationSkill
 from .general_skill import GeneralSkill
+from .label_consolidation import LabelConsolidationSkill
+from .pipeline import Pipeline, PipelineStage
+from .relevance_filter import RelevanceFilter
+from .skill_cache import SkillCache
 
 __all__ = [
     'BaseSkill',
     'ClassificationSkill',
     'DiscoverLabelsSkill',
+    'DistilledClassificationSkill',
     'GeneralSkill',
+    'LabelConsolidationSkill',
+    'Pipeline',
+    'PipelineStage',
+    'RelevanceFilter',
+    'SkillCache',
 ]
\ No newline at end of file
@@ -1,8 +1,12 @@
 from abc import ABC
-from typing import List, Dict, Any
-import ast
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+
+from flashlearn.core.task_store import TaskStore
+from flashlearn.core.tool_arguments import parse_tool_arguments
+from flashlearn.utils.media import MEDIA_REF_TYPE, MediaRef
 
 from .base_skill import BaseSkill
+from .packing import PACKED_SYSTEM_SUFFIX, PackSizeTuner, pack_function_def, unpack_results
 
 
 class BaseDataSkill(BaseSkill, ABC):
@@ -55,6 +59,10 @@ class BaseDataSkill(BaseSkill, ABC):
           - { "type": "text",      "text": ... }
           - { "type": "image_url", "image_url": {"url": ...} }
           - { "type": "input_audio", "input_audio": { "data": ..., "format": ... } }
+          - { "type": "media_ref", "media_ref": { "path": ..., "kind": ... } }
+
+        "image_path" / "audio_path" modalities (or MediaRef values) only store the
+        file path; the file is encoded by the orchestrator right before sending.
 
         Falls back to 'text' if modality is missing or invalid.
         """
@@ -63,6 +71,10 @@ class BaseDataSkill(BaseSkill, ABC):
         content_blocks = []
 
         for key, val in row.items():
+            if isinstance(val, MediaRef):
+                content_blocks.append(val.to_block())
+                continue
+
             raw_value = str(val).strip()
             if not raw_value:
                 continue
@@ -95,6 +107,12 @@ class BaseDataSkill(BaseSkill, ABC):
                     "image_url": {"url": prefix + raw_value}
                 })
 
+            elif modality == "image_path":
+                content_blocks.append(MediaRef(raw_value, kind="image").to_block())
+
+            elif modality == "audio_path":
+                content_blocks.append(MediaRef(raw_value, kind="audio").to_block())
+
             else:
                 # Fallback: treat as text
                 content_blocks.append({"type": "text", "text": raw_value})
@@ -114,6 +132,8 @@ class BaseDataSkill(BaseSkill, ABC):
                 lines.append("[IMAGE_URL]")
             elif b["type"] == "input_audio":
                 lines.append("[AUDIO]")
+            elif b["type"] == MEDIA_REF_TYPE:
+                lines.append("[AUDIO]" if b[MEDIA_REF_TYPE].get("kind") == "audio" else "[IMAGE_URL]")
             else:
                 lines.append(f"[{b['type'].upper()}]")
         return "\n".join(lines)
@@ -123,60 +143,338 @@ class BaseDataSkill(BaseSkill, ABC):
             df: List[Dict[str, Any]],
             column_modalities: Dict[str, str] = None,
             output_modality: str = "text",
+            shared_context: str = None,
+            cache_control: bool = False,
             **kwargs
     ) -> List[Dict[str, Any]]:
         """
         Default implementation: one dictionary = one task. If needed,
         child classes can override for alternative grouping strategies.
 
+        Every request starts with the same prefix — tools, then the system prompt,
+        then the optional shared context — so provider prompt caches can reuse it
+        across rows (see build_system_message).
+
         :param df: A list of dicts; each dict is treated as a 'row'.
         :param column_modalities: Mapping from key → "text"/"image_url"/"audio"/etc.
         :param output_modality: "text", "audio", or "image"
+        :param shared_context: Optional text shared by all rows, placed after the system prompt.
+        :param cache_control: If True, mark the shared prefix with an ephemeral
+                              cache_control breakpoint (honoured by Anthropic via litellm).
         :param columns: (Unused) Only present for signature consistency with the original.
         :param kwargs: Additional keyword arguments, if any.
         :return: A list of tasks (each task a dict with {custom_id, request}).
         """
+        return list(self.iter_tasks(
+            df,
+            column_modalities=column_modalities,
+            output_modality=output_modality,
+            shared_context=shared_context,
+            cache_control=cache_control,
+            **kwargs
+        ))
+
+    def iter_tasks(
+            self,
+            df: Iterable[Dict[str, Any]],
+            column_modalities: Dict[str, str] = None,
+            output_modality: str = "text",
+            shared_context: str = None,
+            cache_control: bool = False,
+            **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazy version of create_tasks: yields one task per row as it is pulled.
+
+        df can be any row iterator (a list, a file reader, a DB cursor, a generator),
+        and the result can be passed straight to run_tasks_in_parallel. Content
+        blocks are then only built when the orchestrator's queue window has room,
+        so memory is bounded by the window instead of the dataset.
+
+        Accepts the same arguments as create_tasks.
+        """
         if column_modalities is None:
             column_modalities = {}
         if output_modality != "text":
             output_params = self.build_output_params(output_modality)
         else:
             output_params = {}
+        # Built once and shared by reference across all tasks; only the user
+        # message is allocated per row.
+        system_msg = self.build_system_message(self.system_prompt, shared_context, cache_control)
+        tools = [self._build_function_def()]
 
-        tasks = []
         for idx, row in enumerate(df):
-            content_blocks = self.build_content_blocks(row, column_modalities)
-            if not content_blocks:
-                continue
+            task = self._build_row_task(str(idx), row, column_modalities, output_params, system_msg, tools)
+            if task is not None:
+                yield task
+
+    def create_task_store(self, df: Iterable[Dict[str, Any]], **kwargs) -> TaskStore:
+        """
+        Like create_tasks, but returns a compact TaskStore instead of a list of dicts:
+        the shared request template is stored once and each row only keeps its
+        serialized user message. Use for multi-million-row jobs; the store can be
+        passed to run_tasks_in_parallel directly.
+
+        Accepts the same arguments as create_tasks.
+        """
+        return TaskStore(self.iter_tasks(df, **kwargs))
+
+    def _build_row_task(
+            self,
+            custom_id: str,
+            row: Dict[str, Any],
+            column_modalities: Dict[str, str],
+            output_params: Dict[str, Any],
+            system_msg: Dict[str, Any] = None,
+            tools: List[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the task for a single row, or None if the row yields no content blocks.
+
+        system_msg and tools are shared, read-only objects when passed in by
+        create_tasks; treat them as immutable once tasks are built.
+        """
+        content_blocks = self.build_content_blocks(row, column_modalities)
+        if not content_blocks:
+            return None
+
+        user_text_for_prompt = self.flatten_blocks_for_debug(content_blocks)
+
+        if system_msg is None:
+            system_msg = self.build_system_message(self.system_prompt)
+        if tools is None:
+            tools = [self._build_function_def()]
+        user_msg = {
+            "role": "user",
+            "content": content_blocks,
+            "content_str": user_text_for_prompt
+        }
+
+        request_body = {
+            "model": self.model_name,
+            "tools": tools,
+            "tool_choice": "required",
+            "messages": [system_msg, user_msg]
+        }
+        request_body.update(output_params)
 
-            user_text_for_prompt = self.flatten_blocks_for_debug(content_blocks)
+        return {
+            "custom_id": custom_id,
+            "request": request_body
+        }
+
+    def build_system_message(
+            self,
+            system_prompt: str,
+            shared_context: str = None,
+            cache_control: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build the system message that opens every request.
 
-            system_msg = {
+        Without shared_context or cache_control this is the plain prompt string.
+        Otherwise the content becomes text blocks — prompt, then shared context —
+        and, with cache_control, the last block carries
+        {"cache_control": {"type": "ephemeral"}} so everything up to it
+        (tools + system + shared context) is cached by the provider.
+        """
+        if not shared_context and not cache_control:
+            return {
                 "role": "system",
-                "content": self.system_prompt,
-                "content_str": self.system_prompt
+                "content": system_prompt,
+                "content_str": system_prompt
             }
+
+        blocks = [{"type": "text", "text": system_prompt}]
+        if shared_context:
+            blocks.append({"type": "text", "text": shared_context})
+        if cache_control:
+            blocks[-1]["cache_control"] = {"type": "ephemeral"}
+
+        return {
+            "role": "system",
+            "content": blocks,
+            "content_str": self.flatten_blocks_for_debug(blocks)
+        }
+
+    def create_packed_tasks(
+            self,
+            df: List[Dict[str, Any]],
+            rows_per_task: int = 10,
+            column_modalities: Dict[str, str] = None,
+            output_modality: str = "text",
+            row_ids: List[str] = None,
+            shared_context: str = None,
+            cache_control: bool = False,
+            **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Packing mode: put up to rows_per_task rows into one request, so the
+        system prompt and tool schema are paid once per pack instead of once per row.
+
+        Each row is introduced by a "row_id: <id>" text block, and the function
+        schema is wrapped into an array of {row_id, ...} items (see pack_function_def).
+        Use unpack_results() to map the results back onto the row ids.
+
+        :param df: A list of dicts; each dict is treated as a 'row'.
+        :param rows_per_task: How many rows go into one request.
+        :param column_modalities: Mapping from key → "text"/"image_url"/"audio"/etc.
+        :param output_modality: "text", "audio", or "image"
+        :param row_ids: Optional ids for the rows; defaults to their index, like create_tasks.
+        :param shared_context: Optional text shared by all rows (see create_tasks).
+        :param cache_control: Mark the shared prefix for provider caching (see create_tasks).
+        :return: A list of tasks with {custom_id, request, metadata: {"row_ids": [...]}}.
+        """
+        if column_modalities is None:
+            column_modalities = {}
+        if row_ids is None:
+            row_ids = [str(idx) for idx in range(len(df))]
+        if output_modality != "text":
+            output_params = self.build_output_params(output_modality)
+        else:
+            output_params = {}
+        rows_per_task = max(1, int(rows_per_task))
+
+        sys_prompt = f"{self.system_prompt}\n{PACKED_SYSTEM_SUFFIX}".strip()
+        system_msg = self.build_system_message(sys_prompt, shared_context, cache_control)
+        tools = [pack_function_def(self._build_function_def())]
+
+        # Only rows that produce content take part in packing
+        packable = []
+        for row_id, row in zip(row_ids, df):
+            blocks = self.build_content_blocks(row, column_modalities)
+            if blocks:
+                packable.append((row_id, blocks))
+
+        tasks = []
+        for start in range(0, len(packable), rows_per_task):
+            pack = packable[start:start + rows_per_task]
+            all_blocks = []
+            for row_id, blocks in pack:
+                all_blocks.append({"type": "text", "text": f"row_id: {row_id}"})
+                all_blocks.extend(blocks)
+
             user_msg = {
                 "role": "user",
-                "content": content_blocks,
-                "content_str": user_text_for_prompt
+                "content": all_blocks,
+                "content_str": self.flatten_blocks_for_debug(all_blocks)
             }
 
             request_body = {
                 "model": self.model_name,
-                "messages": [system_msg, user_msg],
-                "tools": [self._build_function_def()],
-                "tool_choice": "required"
+                "tools": tools,
+                "tool_choice": "required",
+                "messages": [system_msg, user_msg]
             }
             request_body.update(output_params)
 
             tasks.append({
-                "custom_id": str(idx),
-                "request": request_body
+                "custom_id": f"pack_{pack[0][0]}",
+                "request": request_body,
+                "metadata": {"row_ids": [row_id for row_id, _ in pack]}
             })
 
         return tasks
 
+    def run_packed_tasks_in_parallel(
+            self,
+            df: List[Dict[str, Any]],
+            rows_per_task: int = None,
+            column_modalities: Dict[str, str] = None,
+            output_modality: str = "text",
+            tasks_per_wave: int = 50,
+            tuner: PackSizeTuner = None,
+            shared_context: str = None,
+            cache_control: bool = False,
+            **run_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run df in packing mode and return results keyed by row id (str(index)),
+        the same shape run_tasks_in_parallel returns for create_tasks.
+
+        Rows are sent in waves of tasks_per_wave packed requests. If rows_per_task
+        is None, the pack size is auto-tuned between waves from the observed request
+        latency and the share of rows that came back missing (PackSizeTuner).
+        Rows missing from a packed response are re-queued individually at the end.
+
+        :param df: A list of dicts; each dict is treated as a 'row'.
+        :param rows_per_task: Fixed pack size, or None to auto-tune.
+        :param column_modalities: Mapping from key → "text"/"image_url"/"audio"/etc.
+        :param output_modality: "text", "audio", or "image"
+        :param tasks_per_wave: Packed requests per wave (auto-tuning granularity).
+        :param tuner: Optional pre-configured PackSizeTuner.
+        :param shared_context: Optional text shared by all rows (see create_tasks).
+        :param cache_control: Mark the shared prefix for provider caching (see create_tasks).
+        :param run_kwargs: Passed through to run_tasks_in_parallel.
+        :return: Dict of row id → parsed function arguments (or "<ERROR>").
+        """
+        if rows_per_task is not None:
+            tuner = PackSizeTuner(size=rows_per_task, min_size=rows_per_task, max_size=rows_per_task)
+        elif tuner is None:
+            tuner = PackSizeTuner()
+
+        row_ids = [str(idx) for idx in range(len(df))]
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        input_tokens = output_tokens = cached_tokens = 0
+
+        start = 0
+        while start < len(df):
+            wave_rows = tuner.size * max(1, tasks_per_wave)
+            tasks = self.create_packed_tasks(
+                df[start:start + wave_rows],
+                rows_per_task=tuner.size,
+                column_modalities=column_modalities,
+                output_modality=output_modality,
+                row_ids=row_ids[start:start + wave_rows],
+                shared_context=shared_context,
+                cache_control=cache_control,
+            )
+            start += wave_rows
+            if not tasks:
+                continue
+
+            packed_results = self.run_tasks_in_parallel(tasks, **run_kwargs)
+            input_tokens += self.total_input_tokens
+            output_tokens += self.total_output_tokens
+            cached_tokens += self.total_cached_tokens
+
+            wave_results, wave_missing = unpack_results(packed_results, tasks)
+            results.update(wave_results)
+            missing.extend(wave_missing)
+
+            status = self.last_status
+            finished = status.num_tasks_succeeded + status.num_tasks_failed if status else 0
+            latency = status.total_request_seconds / finished if finished else 0.0
+            sent = sum(len(t["metadata"]["row_ids"]) for t in tasks)
+            tuner.observe(latency=latency, error_rate=len(wave_missing) / sent)
+
+        # Re-queue rows the packed responses did not cover, one row per request
+        if missing:
+            if column_modalities is None:
+                column_modalities = {}
+            output_params = self.build_output_params(output_modality) if output_modality != "text" else {}
+            system_msg = self.build_system_message(self.system_prompt, shared_context, cache_control)
+            tools = [self._build_function_def()]
+            retry_tasks = []
+            for row_id in missing:
+                task = self._build_row_task(
+                    row_id, df[int(row_id)], column_modalities, output_params, system_msg, tools
+                )
+                if task is not None:
+                    retry_tasks.append(task)
+            retry_results = self.run_tasks_in_parallel(retry_tasks, **run_kwargs) or {}
+            input_tokens += self.total_input_tokens
+            output_tokens += self.total_output_tokens
+            cached_tokens += self.total_cached_tokens
+            results.update(retry_results)
+
+        self.total_input_tokens = input_tokens
+        self.total_output_tokens = output_tokens
+        self.total_cached_tokens = cached_tokens
+        return results
+
     def parse_result(self, raw_result: Dict[str, Any]) -> Any:
         """
         By default, just return the raw result as-is.
@@ -199,7 +497,7 @@ class BaseDataSkill(BaseSkill, ABC):
             args_str = message["function_call"].get("arguments", "")
             if not args_str:
                 return None
-            args_obj = ast.literal_eval(args_str)
+            args_obj = parse_tool_arguments(args_str)
             return args_obj.get(arg_name, None)
         except Exception:
             return None
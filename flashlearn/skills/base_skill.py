@@ -5,7 +5,7 @@ import os
 from typing import List, Dict, Any
 
 from flashlearn.core.flash_client import FlashLiteLLMClient
-from flashlearn.core.orchestration import process_tasks_in_parallel
+from flashlearn.core.orchestration import process_tasks_in_parallel, stream_tasks_in_parallel
 from flashlearn.utils.token_utils import count_tokens_for_tasks
 
 
@@ -22,13 +22,16 @@ class BaseSkill(ABC):
     create_tasks().
     """
 
-    def __init__(self, model_name: str, system_prompt: str = '', full_row=False, client=FlashLiteLLMClient()):
+    def __init__(self, model_name: str, system_prompt: str = '', full_row=False, client=None):
         self.model_name = model_name
-        self.client = client
+        # Created here rather than as a default argument so importing skills stays cheap.
+        self.client = client if client is not None else FlashLiteLLMClient()
         self.system_prompt = system_prompt
         self.full_row = full_row
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
+        self.last_status = None
 
     @abstractmethod
     def create_tasks(self, df, **kwargs) -> List[Dict[str, Any]]:
@@ -81,11 +84,15 @@ class BaseSkill(ABC):
             token_encoding_name="cl100k_base",
             return_results=True,
             request_timeout=60,
+            cached_token_weight=1.0,
+            result_store=None,
+            validate_outputs=True,
+            raw_results=False,
     ):
         """
         Orchestrates tasks in parallel using process_tasks_in_parallel.
 
-        :param tasks: The list of tasks to run.
+        :param tasks: The tasks to run: a list, or any iterable such as skill.iter_tasks(rows).
         :param save_filepath: Where to save partial progress or results (optional).
         :param max_requests_per_minute: Throttle for requests/min.
         :param max_tokens_per_minute: Throttle for tokens/min.
@@ -93,6 +100,14 @@ class BaseSkill(ABC):
         :param token_encoding_name: The token encoding name (e.g., cl100k_base).
         :param return_results: Whether to return the final results.
         :param request_timeout: Timeout for each request.
+        :param cached_token_weight: Share of a cached prompt token counted against the token limit.
+        :param result_store: Optional ResultStore (or SQLite path) that records results compactly.
+        :param validate_outputs: Check every result against the tool's parameters schema
+                                 and re-send invalid ones while attempts remain (default
+                                 True, so each invalid output can cost up to max_attempts
+                                 requests). False returns outputs as the model gave them.
+        :param raw_results: Return LazyArguments holding each tool-call argument string,
+                            parsed only when accessed.
         :return: (final_results, final_status_tracker).
         """
         final_results, final_status = asyncio.run(
@@ -106,14 +121,51 @@ class BaseSkill(ABC):
                 max_attempts=max_attempts,
                 token_encoding_name=token_encoding_name,
                 request_timeout=request_timeout,
-
+                cached_token_weight=cached_token_weight,
+                result_store=result_store,
+                validate_outputs=validate_outputs,
+                raw_results=raw_results,
             )
         )
         # Update usage statistics from the status tracker
         self.total_input_tokens = getattr(final_status, "total_input_tokens", 0)
         self.total_output_tokens = getattr(final_status, "total_output_tokens", 0)
+        self.total_cached_tokens = getattr(final_status, "total_cached_tokens", 0)
+        self.last_status = final_status
         return final_results
 
+    def stream_tasks_in_parallel(
+            self,
+            tasks,
+            buffer_size: int = 1000,
+            max_requests_per_minute=999,
+            max_tokens_per_minute=999999,
+            max_attempts=2,
+            token_encoding_name="cl100k_base",
+            request_timeout=60,
+            **kwargs,
+    ):
+        """
+        Like run_tasks_in_parallel, but returns an iterator of (custom_id, result)
+        pairs as tasks complete, without keeping all results in memory.
+        Pair it with flashlearn.utils.join_results to enrich the input rows.
+
+        :param tasks: The tasks to run: a list, or any iterable such as skill.iter_tasks(rows).
+        :param buffer_size: Max finished results held until the consumer reads them.
+        :return: A ResultStream; its .status holds the StatusTracker once exhausted.
+        """
+        return stream_tasks_in_parallel(
+            tasks_data=tasks,
+            client=self.client,
+            buffer_size=buffer_size,
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_attempts=max_attempts,
+            token_encoding_name=token_encoding_name,
+            request_timeout=request_timeout,
+            **kwargs,
+        )
+
     def estimate_tasks_cost(self, tasks: list) -> float:
         """
         Return an approximate cost of tasks, based on # tokens * rate.
@@ -121,4 +173,24 @@ class BaseSkill(ABC):
         """
         total_tokens = count_tokens_for_tasks(tasks, self.model_name)
         # Example: GPT-4 prompt rate might be ~$0.03 / 1K tokens
-        return total_tokens * 1.5
\ No newline at end of file
+        return total_tokens * 1.5
+
+    def estimate_run_cost(
+            self,
+            input_cost_per_1k: float,
+            output_cost_per_1k: float,
+            cached_input_cost_per_1k: float = None,
+    ) -> float:
+        """
+        Return the cost of the last run from the usage the provider reported.
+        Cached prompt tokens are billed at cached_input_cost_per_1k
+        (defaults to the normal input rate when not given).
+        """
+        if cached_input_cost_per_1k is None:
+            cached_input_cost_per_1k = input_cost_per_1k
+        uncached_input = max(0, self.total_input_tokens - self.total_cached_tokens)
+        return (
+            uncached_input * input_cost_per_1k
+            + self.total_cached_tokens * cached_input_cost_per_1k
+            + self.total_output_tokens * output_cost_per_1k
+        ) / 1000
@@ -1,11 +1,26 @@
-from typing import Dict, Any, List
-from flashlearn.core import FlashLiteLLMClient
+import logging
+import math
+import string
+from typing import Dict, Any, List, Optional, Tuple
+
+from flashlearn.core.flash_client import _litellm
 from flashlearn.skills.base_data_skill import BaseDataSkill
 
+flash_logger = logging.getLogger("FlashLearn")
+
+# Single-token answer codes for logprob mode, in order of use.
+LOGPROB_CODES = string.ascii_uppercase + string.ascii_lowercase + string.digits
+
+
 class ClassificationSkill(BaseDataSkill):
     """
     A skill that classifies text from each input dictionary into one or more known categories.
     Optionally set max_categories = -1 if you want unlimited picks.
+
+    For single-label classification, run_logprob_tasks_in_parallel is a cheaper
+    alternative to the tool-call path: each category gets a one-token code, the
+    model answers with max_tokens=1, and the label and its probability are
+    decoded locally from the returned logprobs.
     """
 
     def __init__(
@@ -14,11 +29,24 @@ class ClassificationSkill(BaseDataSkill):
         categories: List[str],
         max_categories: int = 1,
         system_prompt: str = "",
-        client=FlashLiteLLMClient()
+        client=None,
+        logprobs_supported: Optional[bool] = None,
+        calibration_temperature: float = 1.0
     ):
+        """
+        :param logprobs_supported: Whether the model returns logprobs; None looks
+                                   it up in litellm's model map when first needed.
+        :param calibration_temperature: Temperature scaling for logprob-mode
+                                        confidences: code logprobs are divided
+                                        by it before the softmax. 1.0 uses the
+                                        model's probabilities as they are;
+                                        calibrate() fits it on labelled rows.
+        """
         super().__init__(model_name=model_name, system_prompt=system_prompt, client=client)
         self.categories = categories
         self.max_categories = max_categories
+        self.logprobs_supported = logprobs_supported
+        self.calibration_temperature = calibration_temperature
 
     def _build_function_def(self) -> Dict[str, Any]:
         """
@@ -76,4 +104,219 @@ class ClassificationSkill(BaseDataSkill):
         # If the schema was string for single-cat, convert to list
         if isinstance(categories_ret, str):
             return [categories_ret]
-        return categories_ret
\ No newline at end of file
+        return categories_ret
+
+    # ------------------------------------------------------------------
+    # Logprob mode
+    # ------------------------------------------------------------------
+    def supports_logprob_mode(self) -> bool:
+        """
+        Logprob mode needs a single-label skill, at most len(LOGPROB_CODES)
+        categories and a model that returns logprobs.
+        """
+        if self.max_categories != 1 or not 0 < len(self.categories) <= len(LOGPROB_CODES):
+            return False
+        if self.logprobs_supported is None:
+            try:
+                params = _litellm().get_supported_openai_params(model=self.model_name) or []
+            except Exception:
+                params = []
+            self.logprobs_supported = "logprobs" in params
+        return self.logprobs_supported
+
+    def _logprob_system_prompt(self) -> str:
+        codes = "\n".join(f"{code}: {category}" for code, category in zip(LOGPROB_CODES, self.categories))
+        return (
+            f"{self.system_prompt}\nClassify the input into exactly one of these categories. "
+            f"Answer with the category's code only.\n{codes}"
+        ).strip()
+
+    def create_logprob_tasks(
+            self,
+            df: List[Dict[str, Any]],
+            column_modalities: Dict[str, str] = None,
+            shared_context: str = None,
+            cache_control: bool = False,
+            top_logprobs: int = 20,
+            **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Like create_tasks, but the requests carry no tool: they ask for one
+        output token with its top_logprobs alternatives.
+        """
+        column_modalities = column_modalities or {}
+        system_msg = self.build_system_message(self._logprob_system_prompt(), shared_context, cache_control)
+        tasks = []
+        for idx, row in enumerate(df):
+            task = self._build_row_task(str(idx), row, column_modalities, {}, system_msg, [])
+            if task is None:
+                continue
+            request = task["request"]
+            del request["tools"], request["tool_choice"]
+            request.update({
+                "max_tokens": 1,
+                "temperature": 0,
+                "logprobs": True,
+                "top_logprobs": max(1, min(top_logprobs, 20)),
+            })
+            tasks.append(task)
+        return tasks
+
+    def _category_scores(self, top_logprobs: Dict[str, float]) -> Dict[str, float]:
+        """
+        Log-probability per category among the returned alternatives.
+        """
+        scores: Dict[str, float] = {}
+        codes = dict(zip(LOGPROB_CODES, self.categories))
+        for token, logprob in (top_logprobs or {}).items():
+            category = codes.get(str(token).strip())
+            if category is None or logprob is None:
+                continue
+            # " A" and "A" are different tokens for the same answer
+            if category in scores:
+                high, low = max(scores[category], logprob), min(scores[category], logprob)
+                scores[category] = high + math.log1p(math.exp(low - high))
+            else:
+                scores[category] = logprob
+        return scores
+
+    def decode_logprobs(self, top_logprobs: Dict[str, float]) -> Optional[Tuple[str, float]]:
+        """
+        The most likely category and its probability among the categories'
+        codes (temperature-scaled, then normalised), or None if no code is
+        among the returned alternatives.
+        """
+        scores = self._category_scores(top_logprobs)
+        if not scores:
+            return None
+        temperature = self.calibration_temperature or 1.0
+        top = max(scores.values())
+        weights = {c: math.exp((lp - top) / temperature) for c, lp in scores.items()}
+        best = max(weights, key=weights.get)
+        return best, weights[best] / sum(weights.values())
+
+    def fit_calibration_temperature(
+            self,
+            top_logprobs: List[Dict[str, float]],
+            labels: List[str],
+            temperatures: List[float] = None
+    ) -> float:
+        """
+        Temperature scaling: picks the temperature (from a log-spaced grid
+        between 0.05 and 20 unless given) that minimises the negative
+        log-likelihood of the true labels, sets calibration_temperature to it
+        and returns it. Rows whose label is not among the returned codes are
+        ignored; with none left the temperature is unchanged.
+
+        :param top_logprobs: The "top_logprobs" of logprob-mode outputs, one per row.
+        :param labels: The true category of each row.
+        """
+        rows = []
+        for row_logprobs, label in zip(top_logprobs, labels):
+            scores = self._category_scores(row_logprobs)
+            if label in scores:
+                rows.append((scores, label))
+        if not rows:
+            flash_logger.warning("No labelled row has its category among the logprobs; temperature unchanged.")
+            return self.calibration_temperature
+        if temperatures is None:
+            temperatures = [math.exp(math.log(0.05) + i * math.log(400) / 199) for i in range(200)]
+
+        def nll(temperature):
+            total = 0.0
+            for scores, label in rows:
+                top = max(scores.values())
+                norm = sum(math.exp((lp - top) / temperature) for lp in scores.values())
+                total -= (scores[label] - top) / temperature - math.log(norm)
+            return total
+
+        self.calibration_temperature = min(temperatures, key=nll)
+        return self.calibration_temperature
+
+    def calibrate(
+            self,
+            df: List[Dict[str, Any]],
+            labels: List[str],
+            column_modalities: Dict[str, str] = None,
+            top_logprobs: int = 20,
+            **run_kwargs
+    ) -> float:
+        """
+        Runs logprob mode on labelled rows and fits calibration_temperature to
+        them (see fit_calibration_temperature). Rows without content are skipped.
+
+        :param labels: The true category of each row of df.
+        :param run_kwargs: Passed through to run_tasks_in_parallel.
+        """
+        tasks = self.create_logprob_tasks(df, column_modalities, top_logprobs=top_logprobs)
+        raw = self.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+        outputs, true_labels = [], []
+        for task in tasks:
+            output = raw.get(task["custom_id"])
+            if isinstance(output, dict):
+                outputs.append(output.get("top_logprobs"))
+                true_labels.append(labels[int(task["custom_id"])])
+        return self.fit_calibration_temperature(outputs, true_labels)
+
+    def run_logprob_tasks_in_parallel(
+            self,
+            df: List[Dict[str, Any]],
+            column_modalities: Dict[str, str] = None,
+            shared_context: str = None,
+            cache_control: bool = False,
+            top_logprobs: int = 20,
+            **run_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Classifies df in logprob mode and returns {row id: {"categories": label,
+        "confidence": probability}}, keyed like run_tasks_in_parallel(create_tasks(df)).
+
+        Falls back to the tool-call path (results without "confidence") for the
+        whole run if supports_logprob_mode() is False, and for single rows whose
+        response had no logprobs or no category code among them.
+
+        :param run_kwargs: Passed through to run_tasks_in_parallel.
+        """
+        if not self.supports_logprob_mode():
+            flash_logger.info(f"Logprob mode unavailable for {self.model_name}; using tool calls.")
+            tasks = self.create_tasks(
+                df, column_modalities=column_modalities,
+                shared_context=shared_context, cache_control=cache_control
+            )
+            return self.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+
+        tasks = self.create_logprob_tasks(
+            df, column_modalities, shared_context, cache_control, top_logprobs
+        )
+        raw = self.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+        input_tokens, output_tokens = self.total_input_tokens, self.total_output_tokens
+        cached_tokens = self.total_cached_tokens
+
+        results: Dict[str, Any] = {}
+        fallback: List[str] = []
+        for task in tasks:
+            row_id = task["custom_id"]
+            output = raw.get(row_id)
+            decoded = self.decode_logprobs(output.get("top_logprobs")) if isinstance(output, dict) else None
+            if decoded is None:
+                fallback.append(row_id)
+            else:
+                results[row_id] = {"categories": decoded[0], "confidence": decoded[1]}
+
+        if fallback:
+            flash_logger.info(f"{len(fallback)} row(s) without usable logprobs; retrying with tool calls.")
+            system_msg = self.build_system_message(self.system_prompt, shared_context, cache_control)
+            tools = [self._build_function_def()]
+            retry_tasks = [
+                self._build_row_task(row_id, df[int(row_id)], column_modalities or {}, {}, system_msg, tools)
+                for row_id in fallback
+            ]
+            results.update(self.run_tasks_in_parallel(retry_tasks, **run_kwargs) or {})
+            input_tokens += self.total_input_tokens
+            output_tokens += self.total_output_tokens
+            cached_tokens += self.total_cached_tokens
+
+        self.total_input_tokens = input_tokens
+        self.total_output_tokens = output_tokens
+        self.total_cached_tokens = cached_tokens
+        return results
@@ -1,12 +1,24 @@
-from typing import List, Dict, Any
-from flashlearn.core import FlashLiteLLMClient
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
+
 from flashlearn.skills.base_data_skill import BaseDataSkill
+from flashlearn.utils.token_utils import get_token_counter
+
+# Rough token cost of a non-text block (image/audio) when packing chunks.
+MEDIA_BLOCK_TOKENS = 800
+
+flash_logger = logging.getLogger("FlashLearn")
 
 
 class DiscoverLabelsSkill(BaseDataSkill):
     """
     Example of a skill that lumps all rows (dicts) together into a
     single user message for discovering labels across the entire dataset.
+
+    For datasets that do not fit one context window, discover_labels() runs a
+    map-reduce: rows are packed into token-bounded chunk tasks that run in
+    parallel, and their candidate labels are merged by (tree-)reduce tasks.
     """
 
     def __init__(
@@ -14,10 +26,12 @@ class DiscoverLabelsSkill(BaseDataSkill):
         model_name: str,
         label_count: int = -1,
         system_prompt: str = "",
-        client=FlashLiteLLMClient()
+        client=None
     ):
         super().__init__(model_name=model_name, system_prompt=system_prompt, client=client)
         self.label_count = label_count
+        # custom_ids of chunk/reduce tasks that failed twice in the last discover_labels()
+        self.last_failed_tasks: List[str] = []
 
     def create_tasks(
         self,
@@ -50,16 +64,23 @@ class DiscoverLabelsSkill(BaseDataSkill):
         if not all_blocks:
             return []
 
-        flattened_str = self.flatten_blocks_for_debug(all_blocks)
+        # Return just one aggregated task
+        return [self._build_label_task("0", self._label_prompt(), all_blocks, output_params)]
 
+    def _label_prompt(self) -> str:
         # Possibly mention the label_count in the prompt
         if self.label_count > 0:
-            sys_prompt = (
-                f"{self.system_prompt} You may select up to {self.label_count} labels."
-            )
-        else:
-            sys_prompt = f"{self.system_prompt} You may select any number of labels."
+            return f"{self.system_prompt} You may select up to {self.label_count} labels."
+        return f"{self.system_prompt} You may select any number of labels."
 
+    def _build_label_task(
+        self,
+        custom_id: str,
+        sys_prompt: str,
+        blocks: List[Dict[str, Any]],
+        output_params: Dict[str, Any] = None,
+        tools: List[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         system_msg = {
             "role": "system",
             "content": sys_prompt,
@@ -67,23 +88,229 @@ class DiscoverLabelsSkill(BaseDataSkill):
         }
         user_msg = {
             "role": "user",
-            "content": all_blocks,
-            "content_str": flattened_str
+            "content": blocks,
+            "content_str": self.flatten_blocks_for_debug(blocks)
         }
 
         request_body = {
             "model": self.model_name,
             "messages": [system_msg, user_msg],
-            "tools": [self._build_function_def()],
+            "tools": tools or [self._build_function_def()],
             "tool_choice": "required"
         }
-        request_body.update(output_params)
+        request_body.update(output_params or {})
+        return {"custom_id": custom_id, "request": request_body}
 
-        # Return just one aggregated task
-        return [{
-            "custom_id": "0",
-            "request": request_body
-        }]
+    # ─────────────────────────────────────────────────────────────────
+    # Map-reduce discovery
+    # ─────────────────────────────────────────────────────────────────
+    def create_chunk_tasks(
+        self,
+        df: Iterable[Dict[str, Any]],
+        max_tokens_per_chunk: int = 50000,
+        column_modalities: Dict[str, str] = None,
+        output_modality: str = "text",
+        token_counter: Optional[Callable[[str], int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Map step: packs rows, in order, into as few tasks as possible whose user
+        content stays within max_tokens_per_chunk (a row larger than the budget
+        gets a chunk of its own). Each task asks for candidate labels for its rows.
+
+        :param token_counter: Counts tokens of a string (default: tiktoken cl100k_base).
+        :return: Tasks with custom_ids "chunk_0", "chunk_1", ...
+        """
+        count = token_counter or get_token_counter()
+        output_params = self.build_output_params(output_modality) if output_modality != "text" else {}
+        sys_prompt = self._label_prompt()
+        tools = [self._build_function_def()]
+
+        tasks = []
+        blocks: List[Dict[str, Any]] = []
+        used = 0
+        for row in df:
+            row_blocks = self.build_content_blocks(row, column_modalities)
+            if not row_blocks:
+                continue
+            row_tokens = sum(
+                count(b["text"]) if b.get("type") == "text" else MEDIA_BLOCK_TOKENS
+                for b in row_blocks
+            )
+            if blocks and used + row_tokens > max_tokens_per_chunk:
+                tasks.append(self._build_label_task(f"chunk_{len(tasks)}", sys_prompt, blocks, output_params, tools))
+                blocks, used = [], 0
+            blocks.extend(row_blocks)
+            used += row_tokens
+        if blocks:
+            tasks.append(self._build_label_task(f"chunk_{len(tasks)}", sys_prompt, blocks, output_params, tools))
+        return tasks
+
+    def create_reduce_tasks(
+        self,
+        label_lists: List[List[str]],
+        max_tokens_per_chunk: int = 50000,
+        token_counter: Optional[Callable[[str], int]] = None,
+        level: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Reduce step: merges candidate label lists. Exact duplicates (ignoring
+        case and surrounding whitespace) are combined locally with a count of how
+        many lists proposed them; the remaining candidates, most frequent first,
+        are packed into tasks within max_tokens_per_chunk.
+
+        :return: Tasks with custom_ids "reduce_<level>_0", ...
+        """
+        count = token_counter or get_token_counter()
+        sys_prompt = (
+            f"{self.system_prompt} The candidate labels below were proposed for different "
+            "parts of one dataset. Merge them into one consistent label set: combine "
+            "synonyms and near-duplicates, and prefer labels proposed more often. "
+            + (f"Return at most {self.label_count} labels."
+               if self.label_count > 0 else "Return as many labels as needed.")
+        )
+        tools = [self._build_function_def()]
+
+        seen: Dict[str, str] = {}
+        frequency: Counter = Counter()
+        for labels in label_lists:
+            for label in dict.fromkeys(l.strip() for l in labels if isinstance(l, str) and l.strip()):
+                key = label.lower()
+                seen.setdefault(key, label)
+                frequency[key] += 1
+
+        tasks = []
+        lines: List[str] = []
+        used = 0
+        for key, n in frequency.most_common():
+            line = f"- {seen[key]} (proposed {n}x)"
+            line_tokens = count(line) + 1
+            if lines and used + line_tokens > max_tokens_per_chunk:
+                tasks.append(self._build_reduce_task(level, len(tasks), sys_prompt, lines, tools))
+                lines, used = [], 0
+            lines.append(line)
+            used += line_tokens
+        if lines:
+            tasks.append(self._build_reduce_task(level, len(tasks), sys_prompt, lines, tools))
+        return tasks
+
+    def _build_reduce_task(self, level, index, sys_prompt, lines, tools) -> Dict[str, Any]:
+        blocks = [{"type": "text", "text": "Candidate labels:\n" + "\n".join(lines)}]
+        return self._build_label_task(f"reduce_{level}_{index}", sys_prompt, blocks, tools=tools)
+
+    def discover_labels(
+        self,
+        df: Iterable[Dict[str, Any]],
+        max_tokens_per_chunk: int = 50000,
+        column_modalities: Dict[str, str] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        consolidator=None,
+        **run_kwargs,
+    ) -> List[str]:
+        """
+        Discovers labels for a dataset of any size with map-reduce.
+
+        Chunk tasks run in parallel; if there is more than one chunk, their
+        candidate labels are reduced, level by level, until one reduce task
+        returns the final set (at most label_count labels when label_count > 0).
+
+        :param df: Rows (dicts) to label.
+        :param max_tokens_per_chunk: Token budget for the user content of every task.
+        :param column_modalities: Which keys get "text", "image_url", "audio", etc.
+        :param token_counter: Counts tokens of a string (default: tiktoken cl100k_base).
+        :param consolidator: Optional LabelConsolidationSkill; if given, chunk labels
+                             are merged locally (only ambiguous groups go to the
+                             model) instead of by reduce tasks.
+        :param run_kwargs: Passed to run_tasks_in_parallel (rate limits, attempts, ...).
+        :return: The discovered labels.
+        :raises RuntimeError: If every task of a map or reduce step fails, even
+                              after one retry of the failed tasks.
+        """
+        self.last_failed_tasks = []
+        tasks = self.create_chunk_tasks(
+            df,
+            max_tokens_per_chunk=max_tokens_per_chunk,
+            column_modalities=column_modalities,
+            token_counter=token_counter,
+        )
+        label_lists = self._run_label_tasks(tasks, **run_kwargs)
+        if consolidator is not None and len(label_lists) > 1:
+            return consolidator.consolidate(label_lists, max_labels=self.label_count, **run_kwargs)
+
+        level = 0
+        while len(label_lists) > 1:
+            tasks = self.create_reduce_tasks(label_lists, max_tokens_per_chunk, token_counter, level)
+            if len(tasks) >= len(label_lists):
+                # Not shrinking (e.g. unbounded label_count). Tasks are packed most
+                # frequent candidates first, so the first one holds the most frequent
+                # candidates that fit the budget: reduce those in one final task.
+                flash_logger.warning(
+                    f"Reduce level {level} did not shrink; keeping the most frequent "
+                    f"candidates that fit one task and dropping {len(tasks) - 1} task(s)."
+                )
+                tasks = tasks[:1]
+            label_lists = self._run_label_tasks(tasks, **run_kwargs)
+            level += 1
+
+        labels = label_lists[0] if label_lists else []
+        if self.label_count > 0:
+            labels = labels[:self.label_count]
+        return labels
+
+    def _run_label_tasks(self, tasks: List[Dict[str, Any]], **run_kwargs) -> List[List[str]]:
+        """
+        Label lists of the tasks that returned one, in task order. Failed or
+        malformed tasks are run once more; those failing again are logged and
+        recorded in last_failed_tasks.
+        """
+        if not tasks:
+            return []
+        results = self.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+        failed = [task for task in tasks if self._labels_of(results.get(task["custom_id"])) is None]
+        if failed:
+            flash_logger.warning(f"{len(failed)} of {len(tasks)} label tasks failed; retrying them once.")
+            results.update(self.run_tasks_in_parallel(failed, **run_kwargs) or {})
+
+        label_lists = []
+        for task in tasks:
+            labels = self._labels_of(results.get(task["custom_id"]))
+            if labels is None:
+                self.last_failed_tasks.append(task["custom_id"])
+            else:
+                label_lists.append(labels)
+        still_failed = len(tasks) - len(label_lists)
+        if not label_lists:
+            raise RuntimeError(f"All {len(tasks)} label tasks failed; no labels were returned.")
+        if still_failed:
+            flash_logger.warning(
+                f"{still_failed} of {len(tasks)} label tasks failed again; their rows add no labels."
+            )
+        return label_lists
+
+    @staticmethod
+    def _labels_of(result: Any) -> Optional[List[str]]:
+        if isinstance(result, dict) and isinstance(result.get("labels"), list):
+            return [l for l in result["labels"] if isinstance(l, str)]
+        return None
+
+    def iter_tasks(
+        self,
+        df: Iterable[Dict[str, Any]],
+        column_modalities: Dict[str, str] = None,
+        output_modality: str = "text",
+        columns: List[str] = None,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Label discovery needs every row in its single task, so this consumes
+        df fully and then yields the aggregated task (if any).
+        """
+        yield from self.create_tasks(
+            df,
+            column_modalities=column_modalities,
+            output_modality=output_modality,
+            columns=columns,
+            **kwargs
+        )
 
     def _build_function_def(self) -> Dict[str, Any]:
         """
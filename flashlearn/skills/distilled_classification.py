@@ -0,0 +1,199 @@
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from flashlearn.skills.classification import ClassificationSkill
+
+flash_logger = logging.getLogger("FlashLearn")
+
+
+class DistilledClassificationSkill(ClassificationSkill):
+    """
+    A single-label ClassificationSkill that learns from its own LLM answers.
+
+    A logistic regression on hashed word n-grams (scikit-learn) is trained on
+    rows the LLM has labelled. Rows it predicts with at least
+    confidence_threshold are answered locally; only the rest go through the
+    orchestrator, and their labels become new training data. Rows are handled
+    in batches and the local model is refitted every retrain_every new labels,
+    so the share of LLM calls drops as a run goes on:
+
+        skill = DistilledClassificationSkill("gpt-4o-mini", ["positive", "negative"])
+        results = skill.run_distilled_tasks_in_parallel(rows)
+        print(skill.last_routing)    # {"local": ..., "llm": ...}
+
+    Without scikit-learn installed every row goes to the LLM.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        categories: List[str],
+        system_prompt: str = "",
+        client=None,
+        confidence_threshold: float = 0.9,
+        min_training_rows: int = 200,
+        retrain_every: int = 500,
+        max_training_rows: int = 50000,
+        n_features: int = 2 ** 18,
+        ngram_range: Tuple[int, int] = (1, 2),
+        inverse_regularization: float = 10.0,
+    ):
+        """
+        :param confidence_threshold: Minimum local probability to skip the LLM.
+        :param min_training_rows: LLM labels needed before the first fit.
+        :param retrain_every: New LLM labels between refits.
+        :param max_training_rows: Most recent labels kept for training.
+        :param n_features: Size of the hashed feature space.
+        :param ngram_range: Word n-grams used as features.
+        :param inverse_regularization: LogisticRegression's C; higher values
+                                       give sharper probabilities on small data.
+        """
+        super().__init__(
+            model_name=model_name,
+            categories=categories,
+            max_categories=1,
+            system_prompt=system_prompt,
+            client=client,
+        )
+        self.confidence_threshold = confidence_threshold
+        self.min_training_rows = min_training_rows
+        self.retrain_every = retrain_every
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.inverse_regularization = inverse_regularization
+        self.training: Deque[Tuple[str, str]] = deque(maxlen=max_training_rows)
+        self.last_routing: Dict[str, int] = {"local": 0, "llm": 0}
+        self._model = None
+        self._vectorizer = None
+        self._new_labels = 0
+
+    # ------------------------------------------------------------------
+    # Local model
+    # ------------------------------------------------------------------
+    @staticmethod
+    def row_text(row: Dict[str, Any], column_modalities: Dict[str, str] = None) -> str:
+        """
+        The text the local model sees for a row: its text columns, joined.
+        """
+        column_modalities = column_modalities or {}
+        return " ".join(
+            str(value) for key, value in row.items()
+            if column_modalities.get(key, "text") == "text" and value is not None
+        )
+
+    def fit(self, texts: List[str], labels: List[str]) -> bool:
+        """
+        Adds labelled examples and refits the local model on everything kept.
+        Returns False (and keeps routing everything to the LLM) if scikit-learn
+        is missing or fewer than two categories have been seen.
+        """
+        self.training.extend(
+            (text, label) for text, label in zip(texts, labels) if label in self.categories
+        )
+        self._new_labels = 0
+        if len({label for _, label in self.training}) < 2:
+            return False
+        try:
+            from sklearn.feature_extraction.text import HashingVectorizer
+            from sklearn.linear_model import LogisticRegression
+        except ImportError:
+            flash_logger.warning("scikit-learn is not installed; every row goes to the LLM.")
+            return False
+
+        if self._vectorizer is None:
+            self._vectorizer = HashingVectorizer(
+                n_features=self.n_features,
+                ngram_range=self.ngram_range,
+                alternate_sign=False,
+            )
+        features = self._vectorizer.transform([text for text, _ in self.training])
+        model = LogisticRegression(C=self.inverse_regularization, max_iter=1000)
+        model.fit(features, [label for _, label in self.training])
+        self._model = model
+        flash_logger.info(f"Local classifier fitted on {len(self.training)} LLM-labelled rows.")
+        return True
+
+    def predict_local(self, texts: List[str]) -> List[Optional[Tuple[str, float]]]:
+        """
+        (label, probability) per text from the local model, in one batch;
+        all None before the first fit.
+        """
+        if self._model is None or not texts:
+            return [None] * len(texts)
+        probabilities = self._model.predict_proba(self._vectorizer.transform(texts))
+        best = probabilities.argmax(axis=1)
+        confidence = probabilities[range(len(texts)), best]
+        return [
+            (str(self._model.classes_[b]), float(c)) for b, c in zip(best.tolist(), confidence.tolist())
+        ]
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+    def run_distilled_tasks_in_parallel(
+            self,
+            df: List[Dict[str, Any]],
+            column_modalities: Dict[str, str] = None,
+            batch_size: int = 1000,
+            **run_kwargs
+    ) -> Dict[str, Any]:
+        """
+        Classifies df, keyed like run_tasks_in_parallel(create_tasks(df)).
+        Local answers are {"categories": label, "confidence": p}; LLM answers
+        are the usual tool-call results. Rows without content are skipped.
+
+        :param batch_size: Rows per routing batch; the local model can be
+                           refitted between batches.
+        :param run_kwargs: Passed through to run_tasks_in_parallel.
+        """
+        column_modalities = column_modalities or {}
+        system_msg = self.build_system_message(self.system_prompt)
+        tools = [self._build_function_def()]
+        results: Dict[str, Any] = {}
+        routing = {"local": 0, "llm": 0}
+        input_tokens = output_tokens = cached_tokens = 0
+
+        for start in range(0, len(df), max(1, batch_size)):
+            batch = list(range(start, min(start + batch_size, len(df))))
+            texts = {idx: self.row_text(df[idx], column_modalities) for idx in batch}
+            predictions = self.predict_local([texts[idx] for idx in batch])
+
+            tasks = []
+            for idx, prediction in zip(batch, predictions):
+                if prediction is not None and prediction[1] >= self.confidence_threshold:
+                    results[str(idx)] = {"categories": prediction[0], "confidence": prediction[1]}
+                    routing["local"] += 1
+                    continue
+                task = self._build_row_task(str(idx), df[idx], column_modalities, {}, system_msg, tools)
+                if task is not None:
+                    tasks.append(task)
+            if not tasks:
+                continue
+
+            llm_results = self.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+            input_tokens += self.total_input_tokens
+            output_tokens += self.total_output_tokens
+            cached_tokens += self.total_cached_tokens
+            routing["llm"] += len(tasks)
+            results.update(llm_results)
+
+            new_texts, new_labels = [], []
+            for task in tasks:
+                result = llm_results.get(task["custom_id"])
+                label = result.get("categories") if isinstance(result, dict) else None
+                if label in self.categories:
+                    new_texts.append(texts[int(task["custom_id"])])
+                    new_labels.append(label)
+            self.training.extend(zip(new_texts, new_labels))
+            self._new_labels += len(new_labels)
+            due = self._new_labels >= (self.retrain_every if self._model is not None else self.min_training_rows)
+            if due:
+                self.fit([], [])
+
+        self.total_input_tokens = input_tokens
+        self.total_output_tokens = output_tokens
+        self.total_cached_tokens = cached_tokens
+        self.last_routing = routing
+        flash_logger.info(f"Distilled routing: {routing['local']} local, {routing['llm']} LLM.")
+        return results
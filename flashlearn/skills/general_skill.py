@@ -1,11 +1,10 @@
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, Iterator
 
 from copy import copy
 import ast
 import json
 
-from flashlearn.core import FlashLiteLLMClient
 from flashlearn.skills.base_data_skill import BaseDataSkill
 
 flash_logger = logging.getLogger("FlashLearn")
@@ -26,7 +25,7 @@ class GeneralSkill(BaseDataSkill):
             function_definition: Dict[str, Any],
             system_prompt: str = "You are a helpful assistant.",
             columns: List[str] = None,
-            client=FlashLiteLLMClient()
+            client=None
     ):
         super().__init__(model_name=model_name, system_prompt=system_prompt, client=client)
         self._function_definition = function_definition
@@ -64,6 +63,29 @@ class GeneralSkill(BaseDataSkill):
             **kwargs
         )
 
+    def iter_tasks(
+            self,
+            df: Iterable[Dict[str, Any]],
+            column_modalities: Dict[str, str] = None,
+            output_modality: str = "text",
+            columns: List[str] = None,
+            **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazy version of create_tasks (see BaseDataSkill.iter_tasks), with the
+        same fallback to self.columns.
+        """
+        if not columns:
+            columns = self.columns
+
+        return super().iter_tasks(
+            df=df,
+            column_modalities=column_modalities,
+            output_modality=output_modality,
+            columns=columns,
+            **kwargs
+        )
+
     def _build_function_def(self) -> Dict[str, Any]:
         """
         Return whatever custom function definition was provided at init.
@@ -78,7 +100,7 @@ class GeneralSkill(BaseDataSkill):
         return raw_result
 
     @staticmethod
-    def load_skill(config: Dict[str, Any], model_name="gpt-4o-mini",client=FlashLiteLLMClient()):
+    def load_skill(config: Dict[str, Any], model_name="gpt-4o-mini",client=None):
         """
         Load a dictionary specifying model, prompts, and function definition, then
         return an initialized GeneralSkill instance.
@@ -0,0 +1,373 @@
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from flashlearn.skills.base_skill import BaseSkill
+from flashlearn.skills.classification import ClassificationSkill
+
+_NON_WORD = re.compile(r"[^\w]+")
+# Rows of the similarity matrix computed per sparse product
+_BLOCK_ROWS = 1024
+
+
+def normalize_label(label: str) -> str:
+    """
+    Canonical comparison key for a label: NFKC, lowercase, punctuation and
+    underscores to spaces, collapsed whitespace, and a light plural strip
+    ("Prices" -> "price", but "glass" stays).
+    """
+    text = unicodedata.normalize("NFKC", label).lower().replace("_", " ")
+    words = _NON_WORD.sub(" ", text).split()
+    return " ".join(
+        w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+        for w in words
+    )
+
+
+def _char_ngrams(text: str, ngram_range: Tuple[int, int]) -> Counter:
+    grams: Counter = Counter()
+    for word in text.split():
+        padded = f" {word} "
+        for n in range(ngram_range[0], ngram_range[1] + 1):
+            for i in range(len(padded) - n + 1):
+                grams[padded[i:i + n]] += 1
+    return grams
+
+
+def _similarity_rows(texts: List[str], ngram_range: Tuple[int, int], min_similarity: float):
+    """
+    Cosine similarity of character n-gram TF-IDF vectors, keeping only pairs
+    with similarity >= min_similarity. With scikit-learn this is a sparse CSR
+    matrix computed block by block, so the dense n x n matrix never exists;
+    without it, one {index: similarity} dict per text.
+    """
+    try:
+        from scipy import sparse
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        sparse = None
+
+    if sparse is not None:
+        matrix = TfidfVectorizer(analyzer="char_wb", ngram_range=ngram_range).fit_transform(texts)
+        blocks = []
+        for start in range(0, matrix.shape[0], _BLOCK_ROWS):
+            block = (matrix[start:start + _BLOCK_ROWS] @ matrix.T).tocsr()
+            block.data[block.data < min_similarity] = 0
+            block.eliminate_zeros()
+            blocks.append(block)
+        return sparse.vstack(blocks, format="csr")
+
+    counts = [_char_ngrams(t, ngram_range) for t in texts]
+    df = Counter(g for c in counts for g in c)
+    n = len(texts)
+    vectors = []
+    for c in counts:
+        vec = {g: tf * (math.log((1 + n) / (1 + df[g])) + 1) for g, tf in c.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({g: v / norm for g, v in vec.items()})
+    rows = []
+    for a in vectors:
+        row = {}
+        for j, b in enumerate(vectors):
+            similarity = sum(v * b.get(g, 0.0) for g, v in a.items())
+            if similarity >= min_similarity:
+                row[j] = similarity
+        rows.append(row)
+    return rows
+
+
+def _assign_leaders(sim, size: int, similarity_threshold: float) -> Tuple[List[int], Dict[int, List[int]]]:
+    """
+    Walks keys in order; each joins its most similar earlier leader at
+    >= similarity_threshold or becomes a leader itself.
+    """
+    leaders: List[int] = []
+    assigned: Dict[int, List[int]] = {}
+    if isinstance(sim, list):
+        for i in range(size):
+            candidates = [(s, leader) for leader, s in sim[i].items() if leader in assigned]
+            best_sim, best = max(candidates, default=(0.0, None))
+            if best is not None and best_sim >= similarity_threshold:
+                assigned[best].append(i)
+            else:
+                leaders.append(i)
+                assigned[i] = [i]
+        return leaders, assigned
+
+    import numpy as np
+
+    is_leader = np.zeros(size, dtype=bool)
+    for i in range(size):
+        start, end = sim.indptr[i], sim.indptr[i + 1]
+        indexes, values = sim.indices[start:end], sim.data[start:end]
+        mask = is_leader[indexes] & (values >= similarity_threshold)
+        if mask.any():
+            best = int(indexes[mask][values[mask].argmax()])
+            assigned[best].append(i)
+        else:
+            leaders.append(i)
+            assigned[i] = [i]
+            is_leader[i] = True
+    return leaders, assigned
+
+
+def _leader_links(sim, leaders: List[int], low: float, high: float) -> List[Dict[int, float]]:
+    """
+    Per leader position, the other leader positions with low <= similarity < high.
+    """
+    if isinstance(sim, list):
+        position = {leader: c for c, leader in enumerate(leaders)}
+        return [
+            {position[j]: s for j, s in sim[leader].items()
+             if j in position and position[j] != c and low <= s < high}
+            for c, leader in enumerate(leaders)
+        ]
+
+    import numpy as np
+
+    position = np.full(sim.shape[0], -1)
+    position[leaders] = np.arange(len(leaders))
+    links = []
+    for c, leader in enumerate(leaders):
+        start, end = sim.indptr[leader], sim.indptr[leader + 1]
+        others, values = position[sim.indices[start:end]], sim.data[start:end]
+        mask = (others >= 0) & (others != c) & (values >= low) & (values < high)
+        links.append(dict(zip(others[mask].tolist(), values[mask].tolist())))
+    return links
+
+
+def cluster_labels(
+    label_lists: Iterable[Iterable[str]],
+    similarity_threshold: float = 0.75,
+    ambiguity_threshold: float = 0.4,
+    ngram_range: Tuple[int, int] = (2, 4),
+    max_group_size: int = 8,
+) -> Tuple[List[Dict[str, Any]], List[List[int]]]:
+    """
+    Clusters labels from many lists (e.g. one per discovery chunk) locally.
+
+    Labels with the same normalize_label() key are merged outright. The keys
+    are then assigned, most frequent first, to the most similar existing
+    cluster leader if their TF-IDF cosine similarity is >= similarity_threshold,
+    otherwise they lead a new cluster. Leaders whose similarity falls between
+    ambiguity_threshold and similarity_threshold are reported as ambiguous
+    groups, the only part worth asking a model about. Groups are complete-link
+    (every pair in a group is at least ambiguity_threshold similar, so they do
+    not chain through intermediate labels) and hold at most max_group_size
+    clusters; each cluster is in at most one group.
+
+    :return: (clusters, ambiguous_groups). Clusters are dicts with "label"
+             (most common spelling of the leader), "members" (original
+             spellings) and "count" (occurrences), sorted by count. Ambiguous
+             groups are lists of indexes into clusters.
+    """
+    count: Counter = Counter()
+    spellings: Dict[str, Counter] = defaultdict(Counter)
+    for labels in label_lists:
+        for label in labels:
+            if not isinstance(label, str) or not label.strip():
+                continue
+            key = normalize_label(label)
+            if not key:
+                continue
+            count[key] += 1
+            spellings[key][label.strip()] += 1
+
+    keys = [key for key, _ in count.most_common()]
+    if not keys:
+        return [], []
+    sim = _similarity_rows(keys, ngram_range, min(ambiguity_threshold, similarity_threshold))
+    leaders, assigned = _assign_leaders(sim, len(keys), similarity_threshold)
+
+    clusters = []
+    for leader in leaders:
+        members: Counter = Counter()
+        for i in assigned[leader]:
+            members.update(spellings[keys[i]])
+        clusters.append({
+            "label": spellings[keys[leader]].most_common(1)[0][0],
+            "members": [m for m, _ in members.most_common()],
+            "count": sum(count[keys[i]] for i in assigned[leader]),
+        })
+    order = sorted(range(len(leaders)), key=lambda c: -clusters[c]["count"])
+    clusters = [clusters[c] for c in order]
+    leaders = [leaders[c] for c in order]
+
+    # Greedy complete-link groups, seeded by the most frequent clusters
+    links = _leader_links(sim, leaders, ambiguity_threshold, similarity_threshold)
+    grouped = [False] * len(leaders)
+    ambiguous = []
+    for c in range(len(leaders)):
+        if grouped[c] or not links[c]:
+            continue
+        group = [c]
+        for other, _ in sorted(links[c].items(), key=lambda item: -item[1]):
+            if len(group) >= max_group_size:
+                break
+            if not grouped[other] and all(other in links[m] for m in group):
+                group.append(other)
+        if len(group) > 1:
+            for m in group:
+                grouped[m] = True
+            ambiguous.append(group)
+    return clusters, ambiguous
+
+
+class LabelConsolidationSkill(BaseSkill):
+    """
+    Merges near-duplicate labels (e.g. from DiscoverLabelsSkill chunks) into a
+    frequency-ranked canonical list.
+
+    Most merging happens locally with cluster_labels(); only ambiguous groups
+    of clusters become tasks, one per group, asking the model which of them
+    mean the same thing. The result can go straight into a ClassificationSkill:
+
+        consolidator = LabelConsolidationSkill("gpt-4o-mini")
+        labels = consolidator.consolidate(label_lists, max_labels=8)
+        classifier = consolidator.to_classification_skill(labels)
+    """
+
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        system_prompt: str = "",
+        similarity_threshold: float = 0.75,
+        ambiguity_threshold: float = 0.4,
+        client=None,
+        max_group_size: int = 8
+    ):
+        super().__init__(model_name=model_name, system_prompt=system_prompt, client=client)
+        self.similarity_threshold = similarity_threshold
+        self.ambiguity_threshold = ambiguity_threshold
+        self.max_group_size = max_group_size
+
+    def _build_function_def(self) -> Dict[str, Any]:
+        return {
+            "type": "function",
+            "function": {
+                "name": "merge_labels",
+                "description": "Group labels that mean the same thing and name each group.",
+                "strict": True,
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "groups": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "canonical": {"type": "string"},
+                                    "members": {"type": "array", "items": {"type": "string"}}
+                                },
+                                "required": ["canonical", "members"],
+                                "additionalProperties": False
+                            }
+                        }
+                    },
+                    "required": ["groups"],
+                    "additionalProperties": False
+                }
+            }
+        }
+
+    def create_tasks(self, df: List[List[str]], **kwargs) -> List[Dict[str, Any]]:
+        """
+        One task per ambiguous group; df is a list of label groups.
+        """
+        sys_prompt = (
+            f"{self.system_prompt} You are given labels that may be synonyms or "
+            "near-duplicates. Group the labels that mean the same thing (a label may "
+            "stay alone) and give each group a short canonical name. Every given "
+            "label must appear in exactly one group."
+        ).strip()
+        tools = [self._build_function_def()]
+        tasks = []
+        for idx, group in enumerate(df):
+            text = "Labels:\n" + "\n".join(f"- {label}" for label in group)
+            tasks.append({
+                "custom_id": str(idx),
+                "request": {
+                    "model": self.model_name,
+                    "messages": [
+                        {"role": "system", "content": sys_prompt, "content_str": sys_prompt},
+                        {"role": "user", "content": [{"type": "text", "text": text}], "content_str": text}
+                    ],
+                    "tools": tools,
+                    "tool_choice": "required"
+                }
+            })
+        return tasks
+
+    def consolidate(
+        self,
+        label_lists: Iterable[Iterable[str]],
+        max_labels: int = -1,
+        resolve_ambiguous: bool = True,
+        **run_kwargs
+    ) -> List[str]:
+        """
+        Returns canonical labels, most frequent first (at most max_labels when > 0).
+
+        :param label_lists: Label lists, e.g. one per discovery chunk.
+        :param resolve_ambiguous: Ask the model about ambiguous groups; if False,
+                                  consolidation is purely local.
+        :param run_kwargs: Passed to run_tasks_in_parallel.
+        """
+        clusters, ambiguous = cluster_labels(
+            label_lists,
+            similarity_threshold=self.similarity_threshold,
+            ambiguity_threshold=self.ambiguity_threshold,
+            max_group_size=self.max_group_size,
+        )
+        merged = [{"label": c["label"], "count": c["count"]} for c in clusters]
+
+        if resolve_ambiguous and ambiguous:
+            groups = [[clusters[c]["label"] for c in group] for group in ambiguous]
+            results = self.run_tasks_in_parallel(self.create_tasks(groups), **run_kwargs) or {}
+            for idx, group in enumerate(ambiguous):
+                self._apply_merges(merged, group, results.get(str(idx)))
+
+        ranked = sorted((m for m in merged if m is not None), key=lambda m: -m["count"])
+        labels = list(dict.fromkeys(m["label"] for m in ranked))
+        return labels[:max_labels] if max_labels > 0 else labels
+
+    @staticmethod
+    def _apply_merges(merged: List[Dict[str, Any]], group: List[int], result: Any) -> None:
+        if not isinstance(result, dict) or not isinstance(result.get("groups"), list):
+            return
+        by_label = {merged[c]["label"]: c for c in group if merged[c] is not None}
+        for answer in result["groups"]:
+            if not isinstance(answer, dict):
+                continue
+            members = [by_label[m] for m in answer.get("members") or [] if m in by_label]
+            members = [c for c in dict.fromkeys(members) if merged[c] is not None]
+            if len(members) < 2:
+                continue
+            keep = max(members, key=lambda c: merged[c]["count"])
+            for c in members:
+                if c != keep:
+                    merged[keep]["count"] += merged[c]["count"]
+                    merged[c] = None
+            canonical = answer.get("canonical")
+            if isinstance(canonical, str) and canonical.strip():
+                merged[keep]["label"] = canonical.strip()
+
+    def to_classification_skill(
+        self,
+        labels: List[str],
+        model_name: str = None,
+        max_categories: int = 1,
+        system_prompt: str = ""
+    ) -> ClassificationSkill:
+        """
+        Builds a ClassificationSkill over the consolidated labels, sharing this skill's client.
+        """
+        return ClassificationSkill(
+            model_name=model_name or self.model_name,
+            categories=labels,
+            max_categories=max_categories,
+            system_prompt=system_prompt,
+            client=self.client
+        )
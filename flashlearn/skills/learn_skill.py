@@ -1,11 +1,15 @@
+import asyncio
 import logging
 from copy import copy
-from typing import Dict, Any, List
-import ast
-import json
+from typing import Dict, Any, List, Optional, Union
 
 from flashlearn.core import FlashLiteLLMClient
+from flashlearn.core.orchestration import process_tasks_in_parallel
+from flashlearn.core.strict_schema import StrictSchemaError, repair_function_definition
+from flashlearn.core.tool_arguments import parse_tool_arguments, unwrap_function_definition
 from flashlearn.skills import GeneralSkill
+from flashlearn.skills.skill_cache import SkillCache
+from flashlearn.utils.sampling import sample_rows
 
 flash_logger = logging.getLogger("FlashLearn")
 logging.basicConfig(level=logging.ERROR)
@@ -19,19 +23,24 @@ class LearnSkill:
      - Cost estimation
      - Creating or retrieving skill objects
      - Additional utility like "learn_skill"
+
+    Pass skill_cache (a SkillCache, or a directory for one) to reuse learned
+    definitions across runs instead of learning them again.
     """
 
     def __init__(
         self,
         model_name: str = "gpt-4o",
         verbose: bool = True,
-        client=FlashLiteLLMClient()
+        client=None,
+        skill_cache: Union[SkillCache, str, None] = None
     ):
         flash_logger.setLevel(logging.INFO if verbose else logging.ERROR)
         flash_logger.info(f"Initializing FlashLearn with model '{model_name}'.")
-        self.client = client
+        self.client = client if client is not None else FlashLiteLLMClient()
         self.model_name = model_name
         self.verbose = verbose
+        self.skill_cache = SkillCache(skill_cache) if isinstance(skill_cache, str) else skill_cache
 
     def learn_skill(
         self,
@@ -41,7 +50,14 @@ class LearnSkill:
         model_name: str = "gpt-4o-mini",
         column_modalities: Dict[str, str] = None,
         output_modality: str = "text",
+        sample_tokens: int = 4000,
+        max_field_tokens: int = 200,
         retry: int = 5,
+        candidates: int = 3,
+        validation_rows: int = 1,
+        max_attempts: int = 2,
+        remote_validation: bool = False,
+        **run_kwargs
     ):
         """
         Example method that requests a minimal function definition from the model,
@@ -51,6 +67,13 @@ class LearnSkill:
         'df' is actually a list of dictionaries here, each dict representing one "row."
         If 'columns' is not specified, we will gather all keys found in the data.
 
+        Each round generates `candidates` definitions concurrently and checks them
+        locally against the provider's strict-mode rules, repairing what can be
+        repaired (see flashlearn.core.strict_schema); the earliest compliant
+        candidate wins, so a round is one model round trip. With
+        remote_validation=True every compliant candidate is also tried on a few
+        sample rows, concurrently, and the one with the most valid outputs wins.
+
         Parameters
         ----------
         df : List[Dict[str, Any]]
@@ -67,21 +90,188 @@ class LearnSkill:
             Keys not listed (or if None) default to "text".
         output_modality : str, optional
             Desired output modality: "text" (default), "audio", or "image".
+        sample_tokens : int
+            Token budget for the sample rows shown to the model; a diverse subset
+            of df is picked to fit it (see flashlearn.utils.sampling.sample_rows).
+        max_field_tokens : int
+            Longer text fields are truncated to this many tokens.
         retry : int
-            Number of retry attempts for generating + validating the definition.
+            Number of rounds of generating + validating candidates.
+        candidates : int
+            Definitions generated concurrently per round.
+        validation_rows : int
+            Sample rows each candidate is tried on (with remote_validation).
+        max_attempts : int
+            Attempts per generation request (validation requests get one).
+        remote_validation : bool
+            Also validate candidates with a model call on sample rows.
+        run_kwargs :
+            Passed to process_tasks_in_parallel (rate limits, timeouts, ...).
 
         Returns
         -------
         GeneralSkill or None
             A skill object with the extracted function definition, or None if learning fails.
         """
+        return self.learn_skills(
+            [{
+                "df": df,
+                "task": task,
+                "columns": columns,
+                "model_name": model_name,
+                "column_modalities": column_modalities,
+                "output_modality": output_modality,
+                "sample_tokens": sample_tokens,
+                "max_field_tokens": max_field_tokens,
+            }],
+            retry=retry,
+            candidates=candidates,
+            validation_rows=validation_rows,
+            max_attempts=max_attempts,
+            remote_validation=remote_validation,
+            **run_kwargs
+        )[0]
+
+    def learn_skills(
+        self,
+        specs: List[Dict[str, Any]],
+        retry: int = 5,
+        candidates: int = 3,
+        validation_rows: int = 1,
+        max_attempts: int = 2,
+        remote_validation: bool = False,
+        **run_kwargs
+    ) -> List[Optional[GeneralSkill]]:
+        """
+        Learns many skills at once. Every round sends the generation requests of all
+        unresolved specs as one orchestrator run (and, with remote_validation, their
+        validation requests as another), so all skills share one rate limit and run
+        concurrently.
+
+        Parameters
+        ----------
+        specs : List[Dict[str, Any]]
+            One dict per skill with the keyword arguments of learn_skill:
+            df, task, columns, model_name, column_modalities, output_modality,
+            sample_tokens, max_field_tokens.
+        retry, candidates, validation_rows, max_attempts, remote_validation, run_kwargs :
+            As in learn_skill.
+
+        Returns
+        -------
+        List[GeneralSkill or None]
+            One entry per spec, in order; None where learning failed.
+        """
+        prepared = [self._prepare_learning(**spec) for spec in specs]
+        learned: List[Optional[GeneralSkill]] = [None] * len(specs)
+        if self.skill_cache is not None:
+            for i, spec in enumerate(prepared):
+                learned[i] = self.skill_cache.get(
+                    self._cache_key(spec), model_name=spec["model_name"], client=self.client
+                )
+            hits = sum(skill is not None for skill in learned)
+            if hits:
+                flash_logger.info(f"Loaded {hits} of {len(specs)} skill(s) from the skill cache.")
+        cached = [skill is not None for skill in learned]
+        run_kwargs.setdefault("show_progress", False)
+        run_kwargs.setdefault("request_timeout", 60)
+        flash_logger.info(f"Creating minimal function definitions for {len(specs)} skill(s).")
+
+        for attempt_i in range(retry):
+            pending = [i for i in range(len(specs)) if learned[i] is None]
+            if not pending:
+                break
 
+            # First pass: K candidate definitions per skill, all at once
+            generation_tasks = [
+                {"custom_id": f"{i}:{k}", "request": prepared[i]["request"]}
+                for i in pending for k in range(candidates)
+            ]
+            generated = self._run(generation_tasks, max_attempts, **run_kwargs)
+            proposals = {}
+            for custom_id, args in generated.items():
+                function_def = self._strict_candidate(custom_id, unwrap_function_definition(args))
+                if function_def is not None:
+                    proposals[custom_id] = function_def
+
+            scores: Dict[str, int] = {custom_id: 1 for custom_id in proposals}
+            if remote_validation:
+                # Second pass: try every candidate on sample rows, all at once
+                validation_tasks = []
+                for custom_id, function_def in proposals.items():
+                    spec = prepared[int(custom_id.split(":")[0])]
+                    validation_tasks.extend(
+                        self._validation_tasks(custom_id, function_def, spec, validation_rows)
+                    )
+                validated = self._run(validation_tasks, 1, **run_kwargs)
+                scores = {}
+                for custom_id, result in validated.items():
+                    candidate_id = custom_id.rsplit("/", 1)[0]
+                    scores[candidate_id] = scores.get(candidate_id, 0) + (result != "<ERROR>")
+
+            for i in pending:
+                ranked = [
+                    (scores.get(f"{i}:{k}", 0), -k) for k in range(candidates) if f"{i}:{k}" in proposals
+                ]
+                best = max(ranked, default=(0, 0))
+                if best[0] > 0:
+                    learned[i] = self._make_skill(prepared[i], proposals[f"{i}:{-best[1]}"])
+                else:
+                    flash_logger.info(
+                        f"Learning attempt {attempt_i+1} of {retry} failed for skill {i}, retrying..."
+                    )
+        for i, skill in enumerate(learned):
+            if skill is None:
+                flash_logger.error(f"Learning failed for skill {i}: no candidate passed validation.")
+            elif self.skill_cache is not None and not cached[i]:
+                self.skill_cache.put(self._cache_key(prepared[i]), skill)
+        return learned
+
+    def invalidate_skill(
+        self,
+        df: List[Dict[str, Any]],
+        task: str = "",
+        columns: List[str] = None,
+        model_name: str = "gpt-4o-mini",
+        column_modalities: Dict[str, str] = None,
+        **kwargs
+    ) -> bool:
+        """
+        Drops the cached skill learn_skill would return for these arguments, so
+        the next call learns it again. Returns True if an entry was removed.
+        """
+        if self.skill_cache is None:
+            return False
+        columns = columns or self._gather_columns(df)
+        key = SkillCache.key(task, columns, column_modalities, df, model_name)
+        return self.skill_cache.invalidate(key) > 0
+
+    def _prepare_learning(
+        self,
+        df: List[Dict[str, Any]],
+        task: str = "",
+        columns: List[str] = None,
+        model_name: str = "gpt-4o-mini",
+        column_modalities: Dict[str, str] = None,
+        output_modality: str = "text",
+        sample_tokens: int = 4000,
+        max_field_tokens: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        Builds the generation request for one skill, plus what validation needs.
+        """
         # Gather columns if none provided
         if not columns:
-            columns_set = set()
-            for row in df:
-                columns_set.update(row.keys())
-            columns = list(columns_set)
+            columns = self._gather_columns(df)
+
+        # Only a diverse, token-bounded sample of the rows goes into the prompt
+        sample = sample_rows(
+            df,
+            columns,
+            max_tokens=sample_tokens,
+            max_field_tokens=max_field_tokens,
+            column_modalities=column_modalities,
+        )
 
         # Construct the "system" message as a list of blocks
         system_blocks = [
@@ -124,9 +314,9 @@ class LearnSkill:
             "text": f"Write exact JSON string function definition with requested keys: {task}"
         })
 
-        # Then, gather data from df
+        # Then, gather data from the sample
         # We interpret each row's relevant columns via column_modalities
-        for idx, row in enumerate(df):
+        for idx, row in sample:
             for col in columns:
                 if col not in row:
                     continue
@@ -251,69 +441,113 @@ class LearnSkill:
         }
         request_json.update(output_params)
 
-        flash_logger.info("Creating a minimal function definition from the model.")
+        return {
+            "request": request_json,
+            "task": task,
+            "df": df,
+            "sample": [row for _, row in sample],
+            "columns": columns,
+            "model_name": model_name,
+            "column_modalities": column_modalities,
+            "output_modality": output_modality,
+        }
 
+    @staticmethod
+    def _strict_candidate(custom_id: str, function_def: Any) -> Optional[Dict[str, Any]]:
+        """
+        The candidate repaired to strict mode, or None if it is not a function
+        definition or cannot be repaired.
+        """
+        if not isinstance(function_def, dict) or not isinstance(function_def.get("function"), dict):
+            flash_logger.info(f"Candidate {custom_id} is not a function definition.")
+            return None
         try:
-            for attempt_i in range(retry):
-                # First pass: ask the model to produce the function definition
-                completion = self.client.chat.completions.create(**request_json)
-                function_def = self._extract_function_call_arguments(completion)
-
-                # Second pass: attempt to validate the function we got
-                try:
-                    validation_request = copy(request_json)
-                    validation_request["tools"] = [function_def]
-                    completion = self.client.chat.completions.create(**validation_request)
-                    # If this succeeds, break out of the retry loop
-                    break
-                except Exception:
-                    flash_logger.info(f"Learning attempt {attempt_i+1} of {retry} failed, retrying...")
-
-            # We either succeeded or ran out of tries
-            skill = GeneralSkill(
-                model_name=model_name,
-                function_definition=function_def,
-                system_prompt="Exactly populate the provided function definition",
-                columns=columns,
-                client=self.client
-            )
-            return skill
-
-        except Exception as e:
-            flash_logger.error(f"Learning failed: {e}")
+            repaired, fixes = repair_function_definition(function_def)
+        except StrictSchemaError as e:
+            flash_logger.info(f"Candidate {custom_id} rejected by the strict schema check: {e}")
             return None
+        if fixes:
+            flash_logger.info(f"Candidate {custom_id} repaired: {'; '.join(fixes)}")
+        return repaired
+
+    @staticmethod
+    def _gather_columns(df: List[Dict[str, Any]]) -> List[str]:
+        columns_set = set()
+        for row in df:
+            columns_set.update(row.keys())
+        return list(columns_set)
+
+    @staticmethod
+    def _cache_key(prepared: Dict[str, Any]) -> str:
+        return SkillCache.key(
+            prepared["task"],
+            prepared["columns"],
+            prepared["column_modalities"],
+            prepared["df"],
+            prepared["model_name"],
+        )
+
+    def _make_skill(self, prepared: Dict[str, Any], function_def: Dict[str, Any]) -> GeneralSkill:
+        return GeneralSkill(
+            model_name=prepared["model_name"],
+            function_definition=function_def,
+            system_prompt="Exactly populate the provided function definition",
+            columns=prepared["columns"],
+            client=self.client
+        )
+
+    def _validation_tasks(
+        self,
+        candidate_id: str,
+        function_def: Dict[str, Any],
+        prepared: Dict[str, Any],
+        validation_rows: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Tasks that run a candidate on up to validation_rows sample rows; the
+        orchestrator checks each output against the candidate's own schema.
+        Without usable rows, the generation request itself is sent with the
+        candidate as its tool.
+        """
+        rows = prepared["sample"][:validation_rows]
+
+        tasks = self._make_skill(prepared, function_def).create_tasks(
+            rows,
+            column_modalities=prepared["column_modalities"],
+            output_modality=prepared["output_modality"],
+        )
+        if not tasks:
+            validation_request = copy(prepared["request"])
+            validation_request["tools"] = [function_def]
+            tasks = [{"request": validation_request}]
+        return [
+            {"custom_id": f"{candidate_id}/{n}", "request": t["request"]} for n, t in enumerate(tasks)
+        ]
+
+    def _run(self, tasks: List[Dict[str, Any]], max_attempts: int, **run_kwargs) -> Dict[str, Any]:
+        if not tasks:
+            return {}
+        results, _ = asyncio.run(process_tasks_in_parallel(
+            tasks_data=tasks,
+            client=self.client,
+            max_attempts=max_attempts,
+            **run_kwargs
+        ))
+        return results or {}
 
     def _extract_function_call_arguments(self, completion):
         """
         Extracts JSON arguments from the model's function call output.
-        If nested JSON is found, we try to parse it as well.
+        If nested JSON is found in 'function_definition', it is returned as a
+        strict tool definition (see flashlearn.core.tool_arguments).
         """
-        args_str = ""
         try:
             # The new usage might store conversation tool calls here
             args_str = completion.choices[0].message.tool_calls[0].function.arguments
-            args_obj = ast.literal_eval(args_str)
-
-            # Attempt to see if it's actually a JSON string inside 'function_definition'
-            try:
-                # We expect something like: { "function_definition": "{ ... }" }
-                # so parse that nested string
-                args_obj = json.loads(args_obj["function_definition"])
-                args_obj["strict"] = True
-                args_obj = {
-                    "type": "function",
-                    "function": args_obj
-                }
-            except:
-                # If that fails, maybe the entire args_str is raw JSON
-                try:
-                    args_obj = json.loads(args_str)
-                except:
-                    pass
-            return args_obj
-
         except Exception as e:
-            if args_str:
-                return args_str
             flash_logger.error(f"Error parsing function call arguments: {e}")
-            return f"<PARSE_ERROR: {e}>"
\ No newline at end of file
+            return f"<PARSE_ERROR: {e}>"
+        if not args_str:
+            flash_logger.error("Error parsing function call arguments: empty arguments")
+            return "<PARSE_ERROR: empty function call arguments>"
+        return unwrap_function_definition(parse_tool_arguments(args_str))
\ No newline at end of file
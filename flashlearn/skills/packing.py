@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+
+PACKED_SYSTEM_SUFFIX = (
+    "The input contains several rows. Each row starts with a line 'row_id: <id>'. "
+    "Process every row independently and return exactly one item per row in 'items', "
+    "copying its row_id."
+)
+
+
+def pack_function_def(function_def: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap a single-row function definition into a multi-row one.
+
+    The original parameters become the schema of one array item, extended
+    with a required 'row_id' string, so the model returns:
+        {"items": [{"row_id": "0", ...}, {"row_id": "1", ...}]}
+    """
+    func = function_def.get("function", {})
+    params = func.get("parameters", {})
+
+    item_schema = {
+        "type": "object",
+        "properties": {
+            "row_id": {"type": "string"},
+            **params.get("properties", {})
+        },
+        "required": ["row_id"] + [r for r in params.get("required", []) if r != "row_id"],
+        "additionalProperties": False
+    }
+
+    return {
+        "type": "function",
+        "function": {
+            "name": func.get("name", "basic_function"),
+            "description": (
+                f"{func.get('description', '')} Applied to every row of the input, "
+                "returning one item per row."
+            ).strip(),
+            "strict": func.get("strict", True),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": item_schema,
+                        "description": "One result per input row, identified by row_id."
+                    }
+                },
+                "required": ["items"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+def unpack_results(
+        results: Dict[str, Any],
+        tasks: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Map packed results back onto per-row ids.
+
+    :param results: Orchestrator results keyed by the packed task custom_id.
+    :param tasks: The packed tasks (each carries metadata["row_ids"]).
+    :return: (row_results, missing_row_ids). A row is missing if its task failed
+             or the model did not return an item for it.
+    """
+    row_results: Dict[str, Any] = {}
+    missing: List[str] = []
+
+    for task in tasks:
+        expected = task.get("metadata", {}).get("row_ids", [])
+        packed = (results or {}).get(task["custom_id"])
+        items = packed.get("items") if isinstance(packed, dict) else None
+
+        found = {}
+        if isinstance(items, list):
+            for item in items:
+                if not isinstance(item, dict) or "row_id" not in item:
+                    continue
+                row_id = str(item["row_id"])
+                if row_id in expected and row_id not in found:
+                    found[row_id] = {k: v for k, v in item.items() if k != "row_id"}
+
+        for row_id in expected:
+            if row_id in found:
+                row_results[row_id] = found[row_id]
+            else:
+                missing.append(row_id)
+
+    return row_results, missing
+
+
+@dataclass
+class PackSizeTuner:
+    """
+    Additive-increase / multiplicative-decrease controller for rows per request.
+
+    After every wave of packed requests, call observe() with the mean request
+    latency and the fraction of rows that came back missing or failed:
+      • error rate or latency above target => halve the pack size
+      • otherwise => grow it by ~25% (at least one row)
+    """
+    size: int = 8
+    min_size: int = 1
+    max_size: int = 50
+    target_latency: float = 30.0
+    max_error_rate: float = 0.05
+
+    def observe(self, latency: float, error_rate: float) -> int:
+        if error_rate > self.max_error_rate or latency > self.target_latency:
+            self.size = max(self.min_size, self.size // 2)
+        else:
+            self.size = min(self.max_size, self.size + max(1, self.size // 4))
+        return self.size
@@ -0,0 +1,286 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from flashlearn.core.orchestration import ResultStream, process_tasks_in_parallel
+
+from .base_data_skill import BaseDataSkill
+from .base_skill import BaseSkill
+
+logger = logging.getLogger("ParallelProcessor")
+
+
+def merge_result(row: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    """
+    Default transform between stages: the result's fields are added to the row
+    ({**row, **result}); non-dict results are stored under "result".
+    """
+    if hasattr(result, "items"):
+        return {**row, **dict(result.items())}
+    return {**row, "result": result}
+
+
+@dataclass
+class StageStats:
+    """
+    Counters for one pipeline stage. Latency runs from the moment a row's task
+    is handed to the orchestrator until its result arrives (queueing included).
+    """
+    name: str
+    started: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    dropped: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        done = self.succeeded + self.failed
+        return self.total_latency / done if done else None
+
+
+class PipelineStage:
+    """
+    One skill in a Pipeline, plus the transform(row, result) -> row that builds
+    the input of the next stage (return None to drop the row).
+    """
+
+    def __init__(
+        self,
+        skill: BaseSkill,
+        transform: Callable[[Dict[str, Any], Any], Optional[Dict[str, Any]]] = None,
+        name: str = None,
+        column_modalities: Dict[str, str] = None,
+        output_modality: str = "text"
+    ):
+        self.skill = skill
+        self.transform = transform or merge_result
+        self.name = name or skill.__class__.__name__
+        self.column_modalities = column_modalities or {}
+        self.output_modality = output_modality
+        self._shared = None
+
+    def build_task(self, custom_id: str, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Task for one row, or None if the row has no content. Data skills share
+        one system message and tools list across rows, as in iter_tasks.
+        """
+        if isinstance(self.skill, BaseDataSkill):
+            if self._shared is None:
+                output_params = (
+                    self.skill.build_output_params(self.output_modality)
+                    if self.output_modality != "text" else {}
+                )
+                self._shared = (
+                    output_params,
+                    self.skill.build_system_message(self.skill.system_prompt),
+                    [self.skill._build_function_def()],
+                )
+            return self.skill._build_row_task(custom_id, row, self.column_modalities, *self._shared)
+
+        tasks = self.skill.create_tasks(
+            [row], column_modalities=self.column_modalities, output_modality=self.output_modality
+        )
+        if not tasks:
+            return None
+        return {**tasks[0], "custom_id": custom_id}
+
+
+class _PipelineRun:
+    """
+    State of one pipeline run. tasks() is the orchestrator's task source and
+    advance() its on_result callback; both run on the event-loop thread, so the
+    state needs no locking.
+    """
+
+    def __init__(self, stages: List[PipelineStage], rows: Iterable[Dict[str, Any]],
+                 row_id: Callable[[int, Dict[str, Any]], str], max_in_flight: int):
+        self.stages = stages
+        self.rows = enumerate(rows)
+        self.row_id = row_id
+        self.max_in_flight = max_in_flight
+        self.stats = [StageStats(stage.name) for stage in stages]
+        # Heap of (-stage index, arrival, row id, row): the next task is for the
+        # row furthest down the pipeline, oldest first within a stage
+        self.ready: List[Tuple[int, int, str, Dict[str, Any]]] = []
+        self._arrival = itertools.count()
+        self.pending: Dict[str, Tuple[str, int, Dict[str, Any], float]] = {}
+        self.in_flight = 0
+        self.exhausted = False
+
+    def _push(self, rid: str, stage_idx: int, row: Dict[str, Any]) -> None:
+        heapq.heappush(self.ready, (-stage_idx, next(self._arrival), rid, row))
+
+    def tasks(self) -> Iterator[Optional[Dict[str, Any]]]:
+        while True:
+            if self.ready:
+                # Rows further down the pipeline go first, so they finish sooner
+                neg_stage, _, rid, row = heapq.heappop(self.ready)
+                stage_idx = -neg_stage
+                custom_id = f"{rid}@{stage_idx}"
+                task = self.stages[stage_idx].build_task(custom_id, row)
+                if task is None:
+                    self.stats[stage_idx].dropped += 1
+                    self.in_flight -= 1
+                    continue
+                self.stats[stage_idx].started += 1
+                self.pending[custom_id] = (rid, stage_idx, row, time.time())
+                yield task
+            elif not self.exhausted and self.in_flight < self.max_in_flight:
+                item = next(self.rows, None)
+                if item is None:
+                    self.exhausted = True
+                    continue
+                index, row = item
+                self.in_flight += 1
+                self._push(self.row_id(index, row), 0, row)
+            elif self.exhausted and self.in_flight == 0:
+                return
+            else:
+                yield None
+
+    def advance(self, custom_id: str, result: Any) -> List[Tuple[str, Any]]:
+        """
+        Moves a row on after its stage finished. Returns the rows that left the
+        pipeline: (row_id, final row), or (row_id, "<ERROR>") if a stage failed.
+        """
+        entry = self.pending.pop(custom_id, None)
+        if entry is None:
+            return []
+        rid, stage_idx, row, started = entry
+        stage, stats = self.stages[stage_idx], self.stats[stage_idx]
+        stats.total_latency += time.time() - started
+
+        next_row = None
+        failed = isinstance(result, str) and result == "<ERROR>"
+        if not failed:
+            try:
+                next_row = stage.transform(row, result)
+            except Exception as e:
+                logger.error(f"Pipeline transform after stage '{stage.name}' failed for row {rid}: {e}")
+                failed = True
+        if failed:
+            stats.failed += 1
+            self.in_flight -= 1
+            return [(rid, "<ERROR>")]
+
+        stats.succeeded += 1
+        if next_row is None:
+            stats.dropped += 1
+            self.in_flight -= 1
+            return []
+        if stage_idx + 1 == len(self.stages):
+            self.in_flight -= 1
+            return [(rid, next_row)]
+        self._push(rid, stage_idx + 1, next_row)
+        return []
+
+
+class Pipeline:
+    """
+    Chains skills so each row moves to the next stage as soon as its previous
+    stage finishes, instead of every stage waiting for the slowest row of the
+    one before it.
+
+    All stages share one orchestrator run, i.e. one client, rate limiter and
+    retry queue; each task carries its own stage's model. At most
+    max_in_flight rows are inside the pipeline at a time, and new rows are
+    only admitted when nothing downstream is waiting.
+
+        pipeline = Pipeline([
+            PipelineStage(summary_skill, transform=lambda row, res: {"summary": res["summary"]}),
+            classification_skill,
+        ])
+        results = pipeline.run(rows)     # {row_id: final row or "<ERROR>"}
+        print(pipeline.stats)            # one StageStats per stage
+    """
+
+    def __init__(
+        self,
+        stages: List[Union[BaseSkill, PipelineStage]],
+        client=None,
+        max_in_flight: int = 1000
+    ):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage.")
+        self.stages = [s if isinstance(s, PipelineStage) else PipelineStage(s) for s in stages]
+        self.client = client if client is not None else self.stages[0].skill.client
+        self.max_in_flight = max_in_flight
+        self.stats: List[StageStats] = []
+        self.last_status = None
+
+    def _start(self, rows, row_id) -> _PipelineRun:
+        run = _PipelineRun(
+            self.stages, rows, row_id or (lambda index, row: str(index)), self.max_in_flight
+        )
+        self.stats = run.stats
+        return run
+
+    def run(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        row_id: Callable[[int, Dict[str, Any]], str] = None,
+        max_requests_per_minute=999,
+        max_tokens_per_minute=999999,
+        max_attempts=2,
+        token_encoding_name="cl100k_base",
+        request_timeout=60,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Runs all rows through all stages.
+
+        :param rows: Input rows (any iterable; pulled lazily).
+        :param row_id: Id of a row; defaults to its index.
+        :param kwargs: Passed to process_tasks_in_parallel.
+        :return: {row_id: final row}; failed rows map to "<ERROR>", dropped rows are absent.
+        """
+        run = self._start(rows, row_id)
+        results: Dict[str, Any] = {}
+        _, self.last_status = asyncio.run(process_tasks_in_parallel(
+            tasks_data=run.tasks(),
+            client=self.client,
+            return_results=False,
+            on_result=lambda custom_id, result: results.update(run.advance(custom_id, result)),
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_attempts=max_attempts,
+            token_encoding_name=token_encoding_name,
+            request_timeout=request_timeout,
+            **kwargs
+        ))
+        return results
+
+    def stream(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        row_id: Callable[[int, Dict[str, Any]], str] = None,
+        buffer_size: int = 1000,
+        max_requests_per_minute=999,
+        max_tokens_per_minute=999999,
+        max_attempts=2,
+        token_encoding_name="cl100k_base",
+        request_timeout=60,
+        **kwargs
+    ) -> ResultStream:
+        """
+        Like run, but returns an iterator of (row_id, final row) pairs as rows
+        leave the last stage.
+        """
+        run = self._start(rows, row_id)
+        return ResultStream(
+            run.tasks(),
+            self.client,
+            buffer_size=buffer_size,
+            transform=run.advance,
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_attempts=max_attempts,
+            token_encoding_name=token_encoding_name,
+            request_timeout=request_timeout,
+            **kwargs
+        )
@@ -0,0 +1,266 @@
+import hashlib
+import sqlite3
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from flashlearn.core.flash_client import FlashLiteLLMClient
+from flashlearn.skills.classification import ClassificationSkill
+from flashlearn.utils.chunking import chunk_text
+from flashlearn.utils.token_utils import get_token_counter
+
+RELEVANCE_CATEGORIES = ["relevant", "somehow_relevant", "irrelevant"]
+
+
+class RelevanceCache:
+    """
+    Relevance labels keyed by a hash of (model, question, chunk text), so asking
+    the same question over the same corpus again only classifies new chunks.
+    In memory by default; pass an SQLite path to keep it across runs.
+    """
+
+    def __init__(self, path: str = None):
+        self._memory: Dict[str, str] = {}
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS relevance (key TEXT PRIMARY KEY, category TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def key(model_name: str, question: str, text: str) -> str:
+        return hashlib.sha256(f"{model_name}\0{question}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        if self._conn is None:
+            return {k: self._memory[k] for k in keys if k in self._memory}
+        found = {}
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            rows = self._conn.execute(
+                f"SELECT key, category FROM relevance WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, labels: Dict[str, str]) -> None:
+        if self._conn is None:
+            self._memory.update(labels)
+            return
+        self._conn.executemany("INSERT OR REPLACE INTO relevance VALUES (?, ?)", labels.items())
+        self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+
+
+class RelevanceFilter:
+    """
+    Narrows a long context down to what is relevant to a question, then answers
+    from it ("infinite context").
+
+    The context is split into token-bounded chunks, and each pass classifies them
+    as relevant / somehow_relevant / irrelevant in parallel:
+      • the first (coarse) pass keeps relevant and somehow_relevant chunks,
+        later (finer) passes keep only relevant ones;
+      • surviving neighbours are merged (up to chunk_tokens * 2**pass tokens),
+        so later passes judge larger, more coherent spans;
+      • passes stop as soon as the survivors fit target_tokens, or after
+        max_passes, after which the least relevant chunks are cut to fit.
+    Labels are cached per chunk (see RelevanceCache).
+
+        rf = RelevanceFilter("gpt-4o-mini", target_tokens=8000, cache_path="relevance.sqlite")
+        for piece in rf.answer("Who signed the contract?", open("context.txt").read()):
+            print(piece, end="")
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        client=None,
+        chunk_tokens: int = 512,
+        target_tokens: int = 8000,
+        max_passes: int = 3,
+        cache_path: str = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        self.model_name = model_name
+        self.client = client if client is not None else FlashLiteLLMClient()
+        self.chunk_tokens = chunk_tokens
+        self.target_tokens = target_tokens
+        self.max_passes = max_passes
+        self.cache = RelevanceCache(cache_path)
+        self.token_counter = token_counter
+        self.last_passes: List[Dict[str, int]] = []
+
+    def _skill(self, question: str) -> ClassificationSkill:
+        return ClassificationSkill(
+            model_name=self.model_name,
+            categories=RELEVANCE_CATEGORIES,
+            max_categories=1,
+            system_prompt=(
+                "Classify how relevant this part of a long document is for answering "
+                f"the question: {question}"
+            ),
+            client=self.client,
+        )
+
+    def filter(
+        self,
+        question: str,
+        context: Union[str, List[Dict[str, Any]]],
+        **run_kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the surviving chunks ({"text", "offset", "tokens"}) in document order.
+
+        :param context: The full text, or pre-chunked rows (e.g. from chunk_text).
+        :param run_kwargs: Passed to run_tasks_in_parallel.
+        """
+        count = self.token_counter or get_token_counter()
+        if isinstance(context, str):
+            context = chunk_text(context, self.chunk_tokens, count)
+        # "_span": first and last position of the original chunks a chunk covers
+        chunks = [{**c, "_span": (i, i)} for i, c in enumerate(context)]
+        skill = self._skill(question)
+        self.last_passes = []
+
+        for pass_idx in range(self.max_passes):
+            if sum(c["tokens"] for c in chunks) <= self.target_tokens:
+                break
+            labels, classified = self._classify(skill, question, chunks, **run_kwargs)
+            keep = {"relevant", "somehow_relevant"} if pass_idx == 0 else {"relevant"}
+            survivors = []
+            for chunk, label in zip(chunks, labels):
+                if label is None:
+                    # Classification failed: keep the chunk for another look
+                    survivors.append({**chunk, "category": chunk.get("category", "somehow_relevant")})
+                elif label in keep:
+                    survivors.append({**chunk, "category": label})
+            self.last_passes.append({
+                "chunks": len(chunks),
+                "classified": classified,
+                "survivors": len(survivors),
+            })
+            chunks = self._merge_neighbours(survivors, self.chunk_tokens * 2 ** (pass_idx + 1), count)
+
+        return [
+            {k: v for k, v in c.items() if k != "_span"} for c in self._fit_budget(chunks)
+        ]
+
+    def _classify(self, skill, question, chunks, **run_kwargs) -> Tuple[List[str], int]:
+        """
+        Labels for chunks (None where classification failed), plus how many
+        were not cached and had to be classified.
+        """
+        keys = [RelevanceCache.key(self.model_name, question, c["text"]) for c in chunks]
+        labels = self.cache.get_many(keys)
+        todo = [i for i, key in enumerate(keys) if key not in labels]
+        if todo:
+            tasks = skill.create_tasks([{"text": chunks[i]["text"]} for i in todo])
+            results = skill.run_tasks_in_parallel(tasks, **run_kwargs) or {}
+            new_labels = {}
+            for task_idx, i in enumerate(todo):
+                result = results.get(str(task_idx))
+                category = result.get("categories") if isinstance(result, dict) else None
+                if category in RELEVANCE_CATEGORIES:
+                    new_labels[keys[i]] = category
+            self.cache.put_many(new_labels)
+            labels.update(new_labels)
+        return [labels.get(key) for key in keys], len(todo)
+
+    @staticmethod
+    def _merge_neighbours(chunks, max_tokens, count) -> List[Dict[str, Any]]:
+        merged: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            prev = merged[-1] if merged else None
+            if (
+                prev is not None
+                and prev["_span"][1] + 1 == chunk["_span"][0]
+                and prev["tokens"] + chunk["tokens"] <= max_tokens
+            ):
+                text = prev["text"] + chunk["text"][RelevanceFilter._overlap(prev, chunk):]
+                best = min(prev["category"], chunk["category"], key=RELEVANCE_CATEGORIES.index)
+                merged[-1] = {
+                    "text": text,
+                    "offset": prev.get("offset"),
+                    "tokens": count(text),
+                    "category": best,
+                    "_span": (prev["_span"][0], chunk["_span"][1]),
+                }
+            else:
+                merged.append(dict(chunk))
+        return merged
+
+    @staticmethod
+    def _overlap(prev, chunk) -> int:
+        """
+        Characters at the start of chunk that repeat the end of prev (chunks
+        made with overlap_tokens). Found from the offsets, which are character
+        offsets (chunk_text) or byte offsets (iter_file_chunks); the repeated
+        text must match in either case.
+        """
+        start, end = prev.get("offset"), chunk.get("offset")
+        if not isinstance(start, int) or not isinstance(end, int):
+            return 0
+        prev_text, text = prev["text"], chunk["text"]
+        size = len(prev_text) - (end - start)
+        if 0 < size <= len(text) and prev_text.endswith(text[:size]):
+            return size
+        prev_bytes, data = prev_text.encode("utf-8"), text.encode("utf-8")
+        size = len(prev_bytes) - (end - start)
+        if 0 < size <= len(data) and prev_bytes.endswith(data[:size]):
+            try:
+                return len(data[:size].decode("utf-8"))
+            except UnicodeDecodeError:
+                return 0
+        return 0
+
+    def _fit_budget(self, chunks) -> List[Dict[str, Any]]:
+        if sum(c["tokens"] for c in chunks) <= self.target_tokens:
+            return chunks
+        rank = {"relevant": 0, "somehow_relevant": 1}
+        order = sorted(range(len(chunks)), key=lambda i: (rank.get(chunks[i].get("category"), 2), i))
+        kept, used = set(), 0
+        for i in order:
+            if used + chunks[i]["tokens"] <= self.target_tokens:
+                kept.add(i)
+                used += chunks[i]["tokens"]
+        return [c for i, c in enumerate(chunks) if i in kept]
+
+    def answer(
+        self,
+        question: str,
+        context: Union[str, List[Dict[str, Any]]],
+        stream: bool = True,
+        **run_kwargs
+    ) -> Union[str, Iterator[str]]:
+        """
+        Filters the context, then asks the model the question over the survivors.
+
+        :param stream: Return an iterator of text pieces as the answer is
+                       generated; otherwise the full answer string.
+        """
+        chunks = self.filter(question, context, **run_kwargs)
+        context_text = "\n\n".join(c["text"].strip() for c in chunks)
+        response = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": "Answer the question using only the provided context."},
+                {"role": "user", "content": f"Context:\n{context_text}\n\nQuestion: {question}"},
+            ],
+            stream=stream,
+        )
+        if not stream:
+            return response.choices[0].message.content
+        return self._iter_answer(response)
+
+    @staticmethod
+    def _iter_answer(response) -> Iterator[str]:
+        for event in response:
+            choices = getattr(event, "choices", None) or []
+            delta = getattr(choices[0], "delta", None) if choices else None
+            content = getattr(delta, "content", None)
+            if content:
+                yield content
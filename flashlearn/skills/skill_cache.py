@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from flashlearn.skills.general_skill import GeneralSkill
+
+
+def sample_fingerprint(df: List[Dict[str, Any]], columns: List[str]) -> str:
+    """
+    Hash of the values of the given columns over all rows, in row order.
+    """
+    digest = hashlib.sha256()
+    for row in df:
+        values = [row.get(col) for col in columns]
+        digest.update(json.dumps(values, ensure_ascii=False, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class SkillCache:
+    """
+    Learned skill definitions on disk, one JSON file per key, in the format
+    BaseSkill.save writes (plus "columns"), loaded back with
+    GeneralSkill.load_skill. Keys hash everything that shapes a learned
+    definition: task text, columns, column modalities, the sample and the model.
+
+        cache = SkillCache(".flashlearn_skills")
+        learner = LearnSkill(skill_cache=cache)
+        skill = learner.learn_skill(rows, task="...")   # instant on the next run
+        cache.invalidate()                              # forget everything
+    """
+
+    def __init__(self, directory: str = ".flashlearn_skills"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        task: str,
+        columns: List[str],
+        column_modalities: Optional[Dict[str, str]],
+        df: List[Dict[str, Any]],
+        model_name: str
+    ) -> str:
+        columns = sorted(columns)
+        parts = {
+            "task": task,
+            "columns": columns,
+            "column_modalities": dict(sorted((column_modalities or {}).items())),
+            "sample": sample_fingerprint(df, columns),
+            "model": model_name,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str, model_name: str = "gpt-4o-mini", client=None) -> Optional[GeneralSkill]:
+        """
+        The cached skill for key, or None. Unreadable entries count as misses.
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(config, dict) or not config.get("function_definition"):
+            return None
+        return GeneralSkill.load_skill(config, model_name=model_name, client=client)
+
+    def put(self, key: str, skill: GeneralSkill) -> Dict[str, Any]:
+        """
+        Stores skill under key (written atomically) and returns the stored config.
+        """
+        config = {
+            "skill_class": skill.__class__.__name__,
+            "system_prompt": skill.system_prompt,
+            "function_definition": skill._build_function_def(),
+            "columns": list(getattr(skill, "columns", None) or []),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return config
+
+    def invalidate(self, key: str = None) -> int:
+        """
+        Removes the entry for key, or every entry if key is None.
+
+        :return: Number of entries removed.
+        """
+        if key is not None:
+            names = [f"{key}.json"]
+        else:
+            names = [n for n in os.listdir(self.directory) if n.endswith(".json")]
+        removed = 0
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
@@ -309,4 +309,159 @@ class TestBaseDataSkill:
         assert func_def["type"] == "function"
         assert "function" in func_def
         assert "parameters" in func_def["function"]
-        assert "strict" in func_def["function"]
\ No newline at end of file
+        assert "strict" in func_def["function"]
+    # --------------------------------------------------------------------------
+    # Packing mode
+    # --------------------------------------------------------------------------
+    def test_create_packed_tasks(self, skill):
+        """
+        Rows are packed rows_per_task at a time, empty rows are skipped,
+        and each task records the row ids it carries.
+        """
+        data = [{"col1": "a"}, {"col1": ""}, {"col1": "b"}, {"col1": "c"}]
+        tasks = skill.create_packed_tasks(data, rows_per_task=2)
+        assert len(tasks) == 2
+        assert tasks[0]["metadata"]["row_ids"] == ["0", "2"]
+        assert tasks[1]["metadata"]["row_ids"] == ["3"]
+        assert tasks[0]["custom_id"] == "pack_0"
+
+        user_content = tasks[0]["request"]["messages"][1]["content"]
+        assert user_content[0] == {"type": "text", "text": "row_id: 0"}
+        assert user_content[2] == {"type": "text", "text": "row_id: 2"}
+
+        params = tasks[0]["request"]["tools"][0]["function"]["parameters"]
+        item = params["properties"]["items"]["items"]
+        assert item["required"] == ["row_id", "result"]
+        assert "result" in item["properties"]
+
+    def test_unpack_results_reports_missing_rows(self, skill):
+        """
+        Items are mapped back to their row ids; rows the model skipped or
+        whose task failed come back as missing.
+        """
+        from flashlearn.skills.packing import unpack_results
+
+        tasks = [
+            {"custom_id": "pack_0", "metadata": {"row_ids": ["0", "1"]}},
+            {"custom_id": "pack_2", "metadata": {"row_ids": ["2"]}},
+        ]
+        results = {
+            "pack_0": {"items": [{"row_id": "0", "result": "x"}, {"row_id": "9", "result": "?"}]},
+            "pack_2": "<ERROR>",
+        }
+        row_results, missing = unpack_results(results, tasks)
+        assert row_results == {"0": {"result": "x"}}
+        assert missing == ["1", "2"]
+
+    def test_run_packed_tasks_requeues_missing_rows(self, skill):
+        """
+        Missing rows are retried one per request and merged into the results.
+        """
+        from unittest.mock import MagicMock
+
+        def fake_run(tasks, **kwargs):
+            if "metadata" in tasks[0]:
+                return {"pack_0": {"items": [{"row_id": "0", "result": "packed"}]}}
+            return {t["custom_id"]: {"result": "single"} for t in tasks}
+
+        skill.run_tasks_in_parallel = MagicMock(side_effect=fake_run)
+        results = skill.run_packed_tasks_in_parallel(
+            [{"col1": "a"}, {"col1": "b"}], rows_per_task=2
+        )
+        assert results == {"0": {"result": "packed"}, "1": {"result": "single"}}
+        assert skill.run_tasks_in_parallel.call_count == 2
+
+    def test_pack_size_tuner(self):
+        """
+        Error rate above target halves the pack size; a clean wave grows it.
+        """
+        from flashlearn.skills.packing import PackSizeTuner
+
+        tuner = PackSizeTuner(size=8, max_size=10)
+        assert tuner.observe(latency=1.0, error_rate=0.5) == 4
+        assert tuner.observe(latency=1.0, error_rate=0.0) == 5
+        assert tuner.observe(latency=999.0, error_rate=0.0) == 2
+
+    # --------------------------------------------------------------------------
+    # Prompt-cache-friendly layout
+    # --------------------------------------------------------------------------
+    def test_create_tasks_shared_prefix_with_cache_control(self, skill):
+        """
+        With shared_context + cache_control, every task starts with the same
+        tools and system blocks, and the last shared block carries cache_control.
+        """
+        data = [{"col1": "a"}, {"col1": "b"}]
+        tasks = skill.create_tasks(data, shared_context="Glossary: ...", cache_control=True)
+        first, second = tasks[0]["request"], tasks[1]["request"]
+
+        assert list(first.keys())[:4] == ["model", "tools", "tool_choice", "messages"]
+        assert first["tools"] == second["tools"]
+        assert first["messages"][0] == second["messages"][0]
+
+        system_blocks = first["messages"][0]["content"]
+        assert system_blocks[0] == {"type": "text", "text": "Test prompt"}
+        assert system_blocks[1]["text"] == "Glossary: ..."
+        assert system_blocks[1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_create_tasks_plain_system_prompt_by_default(self, skill):
+        """
+        Without shared context or cache_control, the system content stays a plain string.
+        """
+        tasks = skill.create_tasks([{"col1": "a"}])
+        assert tasks[0]["request"]["messages"][0]["content"] == "Test prompt"
+
+    def test_create_tasks_shares_system_message_and_tools(self, skill):
+        """
+        The system message and tool list are built once and shared by reference;
+        the user message is per row.
+        """
+        tasks = skill.create_tasks([{"col1": "a"}, {"col1": "b"}])
+        first, second = tasks[0]["request"], tasks[1]["request"]
+        assert first["tools"] is second["tools"]
+        assert first["messages"][0] is second["messages"][0]
+        assert first["messages"][1] is not second["messages"][1]
+
+    # --------------------------------------------------------------------------
+    # iter_tasks
+    # --------------------------------------------------------------------------
+    def test_iter_tasks_is_lazy(self, skill):
+        """
+        iter_tasks pulls rows only as tasks are requested and matches create_tasks.
+        """
+        pulled = []
+
+        def rows():
+            for text in ["a", "", "b"]:
+                pulled.append(text)
+                yield {"col1": text}
+
+        gen = skill.iter_tasks(rows())
+        assert pulled == []
+        first = next(gen)
+        assert pulled == ["a"]
+        assert first["custom_id"] == "0"
+        assert [t["custom_id"] for t in gen] == ["2"]
+
+    def test_create_task_store_matches_create_tasks(self, skill):
+        """
+        create_task_store yields the same tasks as create_tasks.
+        """
+        data = [{"col1": "a"}, {"col1": ""}, {"col1": "b"}]
+        store = skill.create_task_store(data)
+        assert list(store) == skill.create_tasks(data)
+
+    # --------------------------------------------------------------------------
+    # Lazy media references
+    # --------------------------------------------------------------------------
+    def test_build_content_blocks_media_paths(self, skill):
+        """
+        image_path / audio_path modalities and MediaRef values produce media_ref placeholders.
+        """
+        from flashlearn.utils.media import MediaRef
+
+        row = {"img": "/data/cat.jpg", "clip": "/data/a.wav", "ref": MediaRef("/data/dog.png")}
+        blocks = skill.build_content_blocks(row, {"img": "image_path", "clip": "audio_path"})
+        assert [b["type"] for b in blocks] == ["media_ref"] * 3
+        assert blocks[0]["media_ref"]["path"] == "/data/cat.jpg"
+        assert blocks[1]["media_ref"]["kind"] == "audio"
+        assert skill.flatten_blocks_for_debug(blocks).split("\n") == ["[IMAGE_URL]", "[AUDIO]", "[IMAGE_URL]"]
@@ -137,6 +137,7 @@ def test_run_tasks_in_parallel_custom_arguments(mock_process, mock_skill):
         token_encoding_name="test_tokens",
         return_results=False,
         request_timeout=10,
+        validate_outputs=False,
     )
     assert results == ["some_data"]
     assert mock_skill.total_input_tokens == 10
@@ -151,9 +152,31 @@ def test_run_tasks_in_parallel_custom_arguments(mock_process, mock_skill):
         max_attempts=3,
         token_encoding_name="test_tokens",
         request_timeout=10,
+        cached_token_weight=1.0,
+        result_store=None,
+        validate_outputs=False,
+        raw_results=False,
     )
 
 
+def test_run_tasks_in_parallel_raw_results(mock_skill):
+    from flashlearn.core.tool_arguments import LazyArguments
+
+    response = MagicMock()
+    type(response).usage = MagicMock(prompt_tokens=1, completion_tokens=1)
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [MagicMock()]
+    response.choices[0].message.tool_calls[0].function.arguments = '{"example_key": "x"}'
+    mock_skill.client = MagicMock()
+    mock_skill.client.chat.completions.create.return_value = response
+
+    tasks = [{"custom_id": "0", "request": {"messages": [{"role": "user", "content": "hi"}]}}]
+    results = mock_skill.run_tasks_in_parallel(tasks, raw_results=True, validate_outputs=False)
+
+    assert isinstance(results["0"], LazyArguments)
+    assert results["0"]["example_key"] == "x"
+
+
 def test_estimate_tasks_cost(mock_skill):
     """
     Exercises estimate_tasks_cost to ensure lines 85–89 execute.
@@ -161,4 +184,17 @@ def test_estimate_tasks_cost(mock_skill):
     # We don't care about the exact cost, just that it doesn't crash and is >= 0
     tasks = [{"prompt": "Hello world"}]
     cost = mock_skill.estimate_tasks_cost(tasks)
-    assert cost >= 0, "Cost should be a non-negative float"
\ No newline at end of file
+    assert cost >= 0, "Cost should be a non-negative float"
+
+
+def test_estimate_run_cost_bills_cached_tokens_separately(mock_skill):
+    """
+    Cached prompt tokens are billed at the cached rate, the rest at the input rate.
+    """
+    mock_skill.total_input_tokens = 1000
+    mock_skill.total_cached_tokens = 600
+    mock_skill.total_output_tokens = 100
+    cost = mock_skill.estimate_run_cost(
+        input_cost_per_1k=1.0, output_cost_per_1k=2.0, cached_input_cost_per_1k=0.5
+    )
+    assert cost == pytest.approx(0.4 + 0.3 + 0.2)
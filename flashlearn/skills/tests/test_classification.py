@@ -145,4 +145,133 @@ def test_create_tasks_inherits_behavior(multi_cat_skill):
 
     req = tasks[0]["request"]
     # Confirm the classification function definition is used
-    assert req["tools"][0]["function"]["name"] == "categorize_text"
\ No newline at end of file
+    assert req["tools"][0]["function"]["name"] == "categorize_text"
+
+# -----------------------------------------------------------------------------
+# Logprob mode
+# -----------------------------------------------------------------------------
+from types import SimpleNamespace
+
+
+def _logprob_completion(top):
+    alternatives = [SimpleNamespace(token=t, logprob=lp) for t, lp in top.items()]
+    first = max(top, key=top.get)
+    completion = MagicMock()
+    completion.choices = [SimpleNamespace(
+        message=SimpleNamespace(content=first, tool_calls=None),
+        logprobs=SimpleNamespace(content=[SimpleNamespace(token=first, logprob=top[first],
+                                                          top_logprobs=alternatives)]),
+    )]
+    completion.usage.prompt_tokens = 10
+    completion.usage.completion_tokens = 1
+    return completion
+
+
+def _tool_completion(arguments):
+    completion = MagicMock()
+    completion.choices[0].message.tool_calls[0].function.arguments = arguments
+    completion.usage.prompt_tokens = 10
+    completion.usage.completion_tokens = 5
+    return completion
+
+
+def test_create_logprob_tasks(single_cat_skill):
+    tasks = single_cat_skill.create_logprob_tasks([{"text": "hello"}, {"text": ""}])
+    assert len(tasks) == 1
+    request = tasks[0]["request"]
+    assert "tools" not in request and "tool_choice" not in request
+    assert request["max_tokens"] == 1 and request["logprobs"] is True
+    assert "A: CategoryA\nB: CategoryB" in request["messages"][0]["content"]
+
+
+def test_decode_logprobs_normalises_over_codes(single_cat_skill):
+    label, confidence = single_cat_skill.decode_logprobs({"A": -0.1, " A": -3.0, "B": -2.5, "The": -0.5})
+    assert label == "CategoryA"
+    assert 0.9 < confidence < 1.0
+    assert single_cat_skill.decode_logprobs({"The": -0.1}) is None
+
+    single_cat_skill.calibration_temperature = 100.0
+    _, flattened = single_cat_skill.decode_logprobs({"A": -0.1, "B": -2.5})
+    assert 0.5 < flattened < 0.52
+
+
+def test_run_logprob_tasks_with_tool_fallback_per_row():
+    client = MagicMock()
+
+    def create(**kwargs):
+        if "tools" in kwargs:
+            return _tool_completion('{"categories": "neg"}')
+        text = kwargs["messages"][1]["content"][0]["text"]
+        if "great" in text:
+            return _logprob_completion({"A": -0.05, "B": -3.0})
+        return _logprob_completion({"Hmm": -0.1})  # no code among the alternatives
+
+    client.chat.completions.create.side_effect = create
+    skill = ClassificationSkill("gpt-4o-mini", ["pos", "neg"], client=client, logprobs_supported=True)
+    results = skill.run_logprob_tasks_in_parallel([{"text": "great"}, {"text": "meh"}])
+    assert results["0"]["categories"] == "pos"
+    assert results["0"]["confidence"] > 0.9
+    assert results["1"] == {"categories": "neg"}
+    assert client.chat.completions.create.call_count == 3
+    assert skill.total_output_tokens == 2 * 1 + 5
+
+
+def test_supports_logprob_mode_asks_litellm_through_flash_client(monkeypatch):
+    litellm = MagicMock()
+    litellm.get_supported_openai_params.return_value = ["tools", "logprobs"]
+    monkeypatch.setattr("flashlearn.skills.classification._litellm", lambda: litellm)
+    skill = ClassificationSkill("some-model", ["a", "b"])
+    assert skill.supports_logprob_mode() is True
+    litellm.get_supported_openai_params.assert_called_once_with(model="some-model")
+
+
+def test_run_logprob_tasks_falls_back_without_logprob_support(multi_cat_skill):
+    client = MagicMock()
+    client.chat.completions.create.return_value = _tool_completion('{"categories": ["Cat1"]}')
+    multi_cat_skill.client = client
+    assert multi_cat_skill.supports_logprob_mode() is False
+    results = multi_cat_skill.run_logprob_tasks_in_parallel([{"text": "x"}])
+    assert results == {"0": {"categories": ["Cat1"]}}
+    assert "tools" in client.chat.completions.create.call_args.kwargs
+
+    skill = ClassificationSkill("some-model", ["a", "b"], logprobs_supported=False)
+    assert skill.supports_logprob_mode() is False
+
+
+def test_fit_calibration_temperature_softens_overconfident_logprobs(single_cat_skill):
+    # The model is ~99% sure of A every time, but is right only half the time
+    outputs = [{"A": -0.01, "B": -4.6}] * 10
+    labels = ["CategoryA", "CategoryB"] * 5
+    temperature = single_cat_skill.fit_calibration_temperature(outputs, labels)
+    assert temperature > 5
+    _, confidence = single_cat_skill.decode_logprobs(outputs[0])
+    assert confidence < 0.6
+
+    assert single_cat_skill.fit_calibration_temperature([{"The": -0.1}], ["CategoryA"]) == temperature
+
+
+def test_calibrate_runs_logprob_mode_on_labelled_rows():
+    client = MagicMock()
+    client.chat.completions.create.return_value = _logprob_completion({"A": -0.2, "B": -1.8})
+    skill = ClassificationSkill("gpt-4o-mini", ["pos", "neg"], client=client, logprobs_supported=True)
+    temperature = skill.calibrate([{"text": "a"}, {"text": ""}, {"text": "b"}], ["pos", "neg", "pos"])
+    assert skill.calibration_temperature == temperature < 1.0
+    assert client.chat.completions.create.call_count == 2
+
+
+def test_logprob_mode_does_not_retry_responses_without_logprobs():
+    client = MagicMock()
+
+    def create(**kwargs):
+        if "tools" in kwargs:
+            return _tool_completion('{"categories": "pos"}')
+        completion = MagicMock()
+        completion.choices = [SimpleNamespace(message=SimpleNamespace(content="A", tool_calls=None), logprobs=None)]
+        completion.usage.prompt_tokens = 10
+        completion.usage.completion_tokens = 1
+        return completion
+
+    client.chat.completions.create.side_effect = create
+    skill = ClassificationSkill("gpt-4o-mini", ["pos", "neg"], client=client, logprobs_supported=True)
+    assert skill.run_logprob_tasks_in_parallel([{"text": "x"}], max_attempts=3) == {"0": {"categories": "pos"}}
+    assert client.chat.completions.create.call_count == 2
@@ -120,4 +120,103 @@ def test_parse_result_list(discover_skill_limited):
     """
     discover_skill_limited.parse_function_call = MagicMock(return_value=["label1", "label2"])
     result = discover_skill_limited.parse_result({})
-    assert result == ["label1", "label2"]
\ No newline at end of file
+    assert result == ["label1", "label2"]
+
+def _words(text):
+    return len(text.split())
+
+
+def test_create_chunk_tasks_packs_rows_within_budget(discover_skill_limited):
+    data = [{"col1": "one two three"} for _ in range(5)]
+    tasks = discover_skill_limited.create_chunk_tasks(
+        data, max_tokens_per_chunk=7, token_counter=_words
+    )
+    # 3 words per row, budget 7 => two rows per chunk
+    assert [t["custom_id"] for t in tasks] == ["chunk_0", "chunk_1", "chunk_2"]
+    assert [len(t["request"]["messages"][1]["content"]) for t in tasks] == [2, 2, 1]
+    assert "up to 3 labels" in tasks[0]["request"]["messages"][0]["content"]
+
+
+def test_create_chunk_tasks_oversized_row_gets_own_chunk(discover_skill_limited):
+    data = [{"col1": "a"}, {"col1": "b c d e f g h i j k"}, {"col1": "z"}]
+    tasks = discover_skill_limited.create_chunk_tasks(
+        data, max_tokens_per_chunk=3, token_counter=_words
+    )
+    assert [len(t["request"]["messages"][1]["content"]) for t in tasks] == [1, 1, 1]
+
+
+def test_create_reduce_tasks_dedupes_and_counts(discover_skill_limited):
+    tasks = discover_skill_limited.create_reduce_tasks(
+        [["Positive", "negative"], ["positive ", "Neutral"]], token_counter=_words
+    )
+    assert len(tasks) == 1
+    text = tasks[0]["request"]["messages"][1]["content"][0]["text"]
+    assert "- Positive (proposed 2x)" in text
+    assert text.count("ositive") == 1
+    assert "at most 3 labels" in tasks[0]["request"]["messages"][0]["content"]
+
+
+def test_discover_labels_single_chunk_skips_reduce(discover_skill_limited):
+    discover_skill_limited.run_tasks_in_parallel = MagicMock(
+        return_value={"chunk_0": {"labels": ["a", "b", "c", "d"]}}
+    )
+    labels = discover_skill_limited.discover_labels(
+        [{"col1": "x"}], max_tokens_per_chunk=100, token_counter=_words
+    )
+    assert labels == ["a", "b", "c"]
+    assert discover_skill_limited.run_tasks_in_parallel.call_count == 1
+
+
+def test_discover_labels_map_then_reduce(discover_skill_limited):
+    def fake_run(tasks, **kwargs):
+        ids = [t["custom_id"] for t in tasks]
+        if ids[0].startswith("chunk_"):
+            return {**{cid: {"labels": [f"label_{i}"]} for i, cid in enumerate(ids)}, ids[-1]: "<ERROR>"}
+        return {ids[0]: {"labels": ["merged"]}}
+
+    discover_skill_limited.run_tasks_in_parallel = MagicMock(side_effect=fake_run)
+    labels = discover_skill_limited.discover_labels(
+        [{"col1": "w w"}] * 4, max_tokens_per_chunk=2, token_counter=_words, max_attempts=1
+    )
+    assert labels == ["merged"]
+    calls = discover_skill_limited.run_tasks_in_parallel.call_args_list
+    assert len(calls) == 3
+    assert len(calls[0].args[0]) == 4
+    # The failed chunk is retried once, then left out of the reduce
+    assert [t["custom_id"] for t in calls[1].args[0]] == ["chunk_3"]
+    assert calls[2].args[0][0]["custom_id"] == "reduce_0_0"
+    assert calls[2].kwargs == {"max_attempts": 1}
+    assert discover_skill_limited.last_failed_tasks == ["chunk_3"]
+
+
+def test_discover_labels_retries_failed_chunks_and_raises_without_labels(discover_skill_limited):
+    answers = iter([{"chunk_0": "<ERROR>"}, {"chunk_0": {"labels": ["a"]}}])
+    discover_skill_limited.run_tasks_in_parallel = MagicMock(side_effect=lambda tasks, **kw: next(answers))
+    assert discover_skill_limited.discover_labels([{"col1": "x"}], token_counter=_words) == ["a"]
+    assert discover_skill_limited.last_failed_tasks == []
+
+    discover_skill_limited.run_tasks_in_parallel = MagicMock(return_value={"chunk_0": {"oops": 1}})
+    with pytest.raises(RuntimeError, match="All 1 label tasks failed"):
+        discover_skill_limited.discover_labels([{"col1": "x"}], token_counter=_words)
+    assert discover_skill_limited.run_tasks_in_parallel.call_count == 2
+
+
+def test_discover_labels_reduce_stays_within_budget(discover_skill_unlimited):
+    calls = []
+
+    def fake_run(tasks, **kwargs):
+        calls.append(tasks)
+        ids = [t["custom_id"] for t in tasks]
+        if ids[0].startswith("chunk_"):
+            return {cid: {"labels": [f"{cid}_{i}" for i in range(5)]} for cid in ids}
+        texts = [t["request"]["messages"][1]["content"][0]["text"] for t in tasks]
+        return {cid: {"labels": [text.split("- ")[1].split(" ")[0]]} for cid, text in zip(ids, texts)}
+
+    discover_skill_unlimited.run_tasks_in_parallel = MagicMock(side_effect=fake_run)
+    labels = discover_skill_unlimited.discover_labels(
+        [{"col1": "w w w w w"}] * 2, max_tokens_per_chunk=8, token_counter=_words
+    )
+    assert labels == ["chunk_0_0"]
+    for tasks in calls[1:]:
+        assert len(tasks) == 1
+        assert _words(tasks[0]["request"]["messages"][1]["content"][0]["text"]) <= 8
@@ -0,0 +1,81 @@
+import random
+import threading
+from unittest.mock import MagicMock
+
+from flashlearn.skills import DistilledClassificationSkill
+
+POSITIVE = ["great", "excellent", "loved", "wonderful", "superb"]
+NEGATIVE = ["awful", "terrible", "hated", "broken", "refund"]
+
+
+def _rows(n, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        words = POSITIVE if rng.random() < 0.5 else NEGATIVE
+        rows.append({"review": f"the product was {rng.choice(words)} and {rng.choice(words)}"})
+    return rows
+
+
+def _labelling_client():
+    """
+    Labels like an LLM would: positive if the review has a positive word.
+    """
+    client = MagicMock()
+    lock = threading.Lock()
+    calls = []
+
+    def create(**kwargs):
+        text = kwargs["messages"][1]["content_str"]
+        label = "positive" if any(w in text for w in POSITIVE) else "negative"
+        with lock:
+            calls.append(label)
+        completion = MagicMock()
+        completion.choices[0].message.tool_calls[0].function.arguments = f'{{"categories": "{label}"}}'
+        completion.usage.prompt_tokens = 20
+        completion.usage.completion_tokens = 5
+        return completion
+
+    client.chat.completions.create.side_effect = create
+    return client, calls
+
+
+def test_routes_confident_rows_locally_after_training():
+    client, calls = _labelling_client()
+    skill = DistilledClassificationSkill(
+        "gpt-4o-mini", ["positive", "negative"], client=client,
+        min_training_rows=100, retrain_every=100, confidence_threshold=0.8,
+    )
+    rows = _rows(600)
+    results = skill.run_distilled_tasks_in_parallel(rows, batch_size=100)
+
+    assert len(results) == 600
+    # The first batch trains the model; later batches are almost all local
+    assert skill.last_routing["llm"] == len(calls)
+    assert 100 <= len(calls) < 200
+    assert skill.last_routing["local"] == 600 - len(calls)
+    expected = ["positive" if any(w in r["review"] for w in POSITIVE) else "negative" for r in rows]
+    assert all(results[str(i)]["categories"] == label for i, label in enumerate(expected))
+    local = [r for r in results.values() if "confidence" in r]
+    assert local and all(r["confidence"] >= 0.8 for r in local)
+    assert skill.total_output_tokens == 5 * len(calls)
+
+
+def test_everything_goes_to_llm_until_trained():
+    client, calls = _labelling_client()
+    skill = DistilledClassificationSkill(
+        "gpt-4o-mini", ["positive", "negative"], client=client, min_training_rows=1000,
+    )
+    assert skill.predict_local(["anything"]) == [None]
+    skill.run_distilled_tasks_in_parallel(_rows(50), batch_size=10)
+    assert skill.last_routing == {"local": 0, "llm": 50}
+    assert len(skill.training) == 50
+
+
+def test_fit_needs_two_categories():
+    skill = DistilledClassificationSkill("gpt-4o-mini", ["positive", "negative"], client=MagicMock())
+    assert skill.fit(["good"], ["positive"]) is False
+    assert skill.fit(["bad", "unknown"], ["negative", "not-a-category"]) is True
+    assert len(skill.training) == 2
+    label, confidence = skill.predict_local(["good"])[0]
+    assert label == "positive" and 0.5 < confidence <= 1.0
@@ -0,0 +1,101 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from flashlearn.skills import ClassificationSkill, DiscoverLabelsSkill, LabelConsolidationSkill
+from flashlearn.skills.label_consolidation import cluster_labels, normalize_label
+
+LABEL_LISTS = [
+    ["Price", "Too expensive", "Acting"],
+    ["pricing", "Prices"],
+    ["price", "Plot holes"],
+    ["plot hole", "Too Expensive!"],
+]
+
+
+def test_normalize_label():
+    assert normalize_label("  Too   Expensive! ") == "too expensive"
+    assert normalize_label("Plot_Holes") == "plot hole"
+    assert normalize_label("Glass") == "glass"
+
+
+@pytest.mark.parametrize("without_sklearn", [False, True])
+def test_cluster_labels_merges_near_duplicates(monkeypatch, without_sklearn):
+    if without_sklearn:
+        monkeypatch.setitem(sys.modules, "sklearn", None)
+    clusters, ambiguous = cluster_labels(LABEL_LISTS)
+    assert clusters[0] == {"label": "Price", "members": ["Price", "Prices", "price"], "count": 3}
+    by_label = {c["label"]: c for c in clusters}
+    assert by_label["Too expensive"]["count"] == 2
+    assert by_label["Plot holes"]["members"] == ["Plot holes", "plot hole"]
+    # "pricing" is close to "Price" but not close enough to merge without asking
+    labels_in_groups = [{clusters[i]["label"] for i in g} for g in ambiguous]
+    assert {"Price", "pricing"} in labels_in_groups
+
+
+@pytest.mark.parametrize("without_sklearn", [False, True])
+def test_ambiguous_groups_do_not_chain(monkeypatch, without_sklearn):
+    if without_sklearn:
+        monkeypatch.setitem(sys.modules, "sklearn", None)
+    # Each label shares a word with the next one only: a chain, not a group
+    words = ["apple", "banana", "cherry", "damson", "elder", "fig", "grape", "hazel", "kiwi", "lemon"]
+    chain = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    clusters, ambiguous = cluster_labels([chain], max_group_size=3)
+    assert ambiguous
+    for group in ambiguous:
+        assert 2 <= len(group) <= 3
+        labels = [set(clusters[c]["label"].split()) for c in group]
+        # complete link: every pair of labels in a group is similar
+        assert all(a & b for a in labels for b in labels)
+    assert len({c for group in ambiguous for c in group}) == sum(len(g) for g in ambiguous)
+
+
+def test_consolidate_local_only_makes_no_calls():
+    skill = LabelConsolidationSkill(client=MagicMock())
+    skill.run_tasks_in_parallel = MagicMock()
+    labels = skill.consolidate(LABEL_LISTS, max_labels=3, resolve_ambiguous=False)
+    assert labels == ["Price", "Too expensive", "Plot holes"]
+    skill.run_tasks_in_parallel.assert_not_called()
+
+
+def test_consolidate_sends_only_ambiguous_groups():
+    skill = LabelConsolidationSkill(client=MagicMock())
+
+    def fake_run(tasks, **kwargs):
+        assert len(tasks) == 1
+        assert "- pricing" in tasks[0]["request"]["messages"][1]["content_str"]
+        return {"0": {"groups": [{"canonical": "Pricing", "members": ["Price", "pricing"]}]}}
+
+    skill.run_tasks_in_parallel = MagicMock(side_effect=fake_run)
+    labels = skill.consolidate(LABEL_LISTS)
+    assert labels[0] == "Pricing"
+    assert "pricing" not in labels and "Price" not in labels
+
+
+def test_to_classification_skill_shares_client():
+    client = MagicMock()
+    skill = LabelConsolidationSkill("gpt-4o-mini", client=client)
+    classifier = skill.to_classification_skill(["a", "b"])
+    assert isinstance(classifier, ClassificationSkill)
+    assert classifier.categories == ["a", "b"]
+    assert classifier.client is client
+
+
+def test_discover_labels_uses_consolidator():
+    discover = DiscoverLabelsSkill("gpt-4", label_count=2, client=MagicMock())
+    discover.run_tasks_in_parallel = MagicMock(return_value={
+        "chunk_0": {"labels": ["Price", "Acting"]},
+        "chunk_1": {"labels": ["price", "Plot"]},
+    })
+    consolidator = LabelConsolidationSkill(client=MagicMock())
+    consolidator.consolidate = MagicMock(return_value=["Price", "Acting"])
+    labels = discover.discover_labels(
+        [{"text": "a b"}, {"text": "c d"}], max_tokens_per_chunk=2,
+        token_counter=lambda t: len(t.split()), consolidator=consolidator
+    )
+    assert labels == ["Price", "Acting"]
+    consolidator.consolidate.assert_called_once_with(
+        [["Price", "Acting"], ["price", "Plot"]], max_labels=2
+    )
+    assert discover.run_tasks_in_parallel.call_count == 1
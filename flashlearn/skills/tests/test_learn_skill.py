@@ -144,17 +144,41 @@ def mock_completion(args_str):
     return completion
 
 
+def _definition(name):
+    return "{'function_definition': '{\"name\":\"%s\",\"description\":\"...\",\"parameters\":{}}'}" % name
+
+
+def learning_client(client, definitions, validations=None):
+    """
+    Routes the concurrent requests: generation requests (the
+    minimalFunctionDefinition tool) take the next entry of `definitions`,
+    validation requests the next entry of `validations` (default: success).
+    Exceptions in either list are raised instead of returned.
+    """
+    definitions = list(definitions)
+    validations = list(validations or [])
+
+    def create(**kwargs):
+        if kwargs["tools"][0]["function"]["name"] == "minimalFunctionDefinition":
+            outcome = definitions.pop(0) if len(definitions) > 1 else definitions[0]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return mock_completion(outcome)
+        outcome = validations.pop(0) if validations else '{}'
+        if isinstance(outcome, Exception):
+            raise outcome
+        return mock_completion(outcome)
+
+    client.chat.completions.create.side_effect = create
+    return client.chat.completions.create
+
+
 def test_learn_skill_happy_path_text_mode(mock_learn_skill_verbose):
     """
-    If the first completion call yields valid arguments,
-    and the second validation call does not error, we get a GeneralSkill back.
+    A generated definition that passes the local strict check (after repair)
+    is returned as a GeneralSkill after a single model call.
     """
-    # Setup first response: the model returns arguments that parse into valid function info
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = [
-        mock_completion("{'function_definition': '{\"name\":\"testFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        # The second "validation" call doesn't raise => success
-        mock_completion("{\"validated\": true}")
-    ]
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("testFn")])
 
     # Provide data as list-of-dicts
     df_data = [
@@ -162,23 +186,40 @@ def test_learn_skill_happy_path_text_mode(mock_learn_skill_verbose):
         {"colA": ""}  # partially empty
     ]
 
-    skill = mock_learn_skill_verbose.learn_skill(df_data, task="Add function def", retry=2)
+    skill = mock_learn_skill_verbose.learn_skill(df_data, task="Add function def", retry=2, candidates=1)
     assert isinstance(skill, GeneralSkill)
     assert skill._function_definition["type"] == "function"
     assert skill._function_definition["function"]["name"] == "testFn"
-    # Also check that create() was called exactly 2 times
-    assert mock_learn_skill_verbose.client.chat.completions.create.call_count == 2
+    assert skill._function_definition["function"]["parameters"]["additionalProperties"] is False
+    assert create.call_count == 1
+
+
+def test_learn_skill_remote_validation(mock_learn_skill_verbose):
+    """
+    With remote_validation, the candidate is also run on a sample row.
+    """
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("testFn")])
+    df_data = [
+        {"colA": "row1"},
+        {"colA": ""}
+    ]
+
+    skill = mock_learn_skill_verbose.learn_skill(
+        df_data, task="Add function def", retry=2, candidates=1, remote_validation=True
+    )
+    assert isinstance(skill, GeneralSkill)
+    # One generation call + one validation call on the sample row
+    assert create.call_count == 2
+    validation_kwargs = [c.kwargs for c in create.call_args_list
+                         if c.kwargs["tools"][0]["function"]["name"] == "testFn"][0]
+    assert validation_kwargs["messages"][1]["content_str"] == "row1"
 
 
 def test_learn_skill_happy_path_audio_mode(mock_learn_skill_verbose):
     """
     Provide column_modalities that includes "audio" to cover that code path in building user_blocks.
     """
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = [
-        mock_completion("{'function_definition': '{\"name\":\"audioFunc\",\"description\":\"...\",\"parameters\":{}}'}"),
-        # second validation success
-        mock_completion("{\"validated\": true}")
-    ]
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("audioFunc")])
     df_data = [
         {"audio_col": "audio_data_here"}
     ]
@@ -192,21 +233,19 @@ def test_learn_skill_happy_path_audio_mode(mock_learn_skill_verbose):
     )
     assert isinstance(skill, GeneralSkill)
 
-    # Verify the request included audio parameters
-    args_list = mock_learn_skill_verbose.client.chat.completions.create.call_args_list
-    req_json_first_call = args_list[0][1]  # the kwargs from the first call
-    assert req_json_first_call["model"] == "custom-audio-model"
-    assert req_json_first_call["audio"]["format"] == "wav"
+    # Verify the generation request included audio parameters
+    generation = [c.kwargs for c in create.call_args_list
+                  if c.kwargs["tools"][0]["function"]["name"] == "minimalFunctionDefinition"]
+    assert len(generation) == 3  # default: 3 candidates
+    assert generation[0]["model"] == "custom-audio-model"
+    assert generation[0]["audio"]["format"] == "wav"
 
 
 def test_learn_skill_image_url_mode(mock_learn_skill_verbose):
     """
     Provide an image_url column to cover that path.
     """
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = [
-        mock_completion("{'function_definition': '{\"name\":\"imageUrlFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        mock_completion("{\"validated\": true}")
-    ]
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("imageUrlFn")])
 
     df_data = [
         {"img_col": "http://example.com/image.jpg"}
@@ -216,23 +255,18 @@ def test_learn_skill_image_url_mode(mock_learn_skill_verbose):
         df_data,
         column_modalities={"img_col": "image_url"},
         output_modality="image",
-        retry=1
+        retry=1,
+        candidates=1
     )
     assert isinstance(skill, GeneralSkill)
-
-    args_list = mock_learn_skill_verbose.client.chat.completions.create.call_args_list
-    req_json_first_call = args_list[0][1]
-    assert req_json_first_call["modalities"] == ["image"]
+    assert create.call_args_list[0].kwargs["modalities"] == ["image"]
 
 
 def test_learn_skill_image_base64_jpeg(mock_learn_skill_verbose):
     """
     Provide an image_base64 column that starts with /9j => 'data:image/jpeg;base64,' prefix.
     """
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = [
-        mock_completion("{'function_definition': '{\"name\":\"jpegFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        mock_completion("{\"validated\": true}")
-    ]
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("jpegFn")])
 
     df_data = [
         {"img64": "/9jSO-MUCH-JUNK-B64..."}
@@ -241,71 +275,188 @@ def test_learn_skill_image_base64_jpeg(mock_learn_skill_verbose):
     skill = mock_learn_skill_verbose.learn_skill(
         df_data,
         column_modalities={"img64": "image_base64"},
-        retry=1
+        retry=1,
+        candidates=1
     )
     assert isinstance(skill, GeneralSkill)
+    user_blocks = create.call_args_list[0].kwargs["messages"][1]["content"]
+    assert user_blocks[1]["image_url"]["url"].startswith("data:image/jpeg;base64,")
 
 
 def test_learn_skill_empty_rows(mock_learn_skill_verbose):
     """
-    If the entire data is empty or columns produce no blocks, we handle gracefully.
-    We do produce a minimal request, but user_blocks might be minimal.
+    If the entire data is empty or columns produce no blocks, we handle gracefully:
+    the candidate is validated with the generation request itself as its tool.
     """
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = [
-        mock_completion("{'function_definition': '{\"name\":\"emptyFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        mock_completion("{\"validated\": true}")
-    ]
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("emptyFn")])
 
     df_data = [
         {"colA": ""},
         {"colA": ""}
     ]
 
-    skill = mock_learn_skill_verbose.learn_skill(df_data, task="Empty", retry=1)
-    # We do still create a skill, though the content blocks were basically empty
-    # except for the 'task' text block
+    skill = mock_learn_skill_verbose.learn_skill(
+        df_data, task="Empty", retry=1, candidates=1, remote_validation=True
+    )
     assert isinstance(skill, GeneralSkill)
+    assert create.call_count == 2
+    assert create.call_args_list[1].kwargs["tools"][0]["function"]["name"] == "emptyFn"
 
 
 def test_learn_skill_retry_logic(mock_learn_skill_verbose):
     """
-    If the second completion (validation) fails the first time, we retry up to 'retry' times.
-    If eventually it succeeds, we get a skill. If it never succeeds, we return None.
-    We'll do 2 attempts: the second is success.
+    If validation fails in the first round, a second round generates and
+    validates a new candidate.
     """
-    side_effects = [
-        mock_completion("{'function_definition': '{\"name\":\"retryFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        Exception("Validation call fails #1"),
-        # second iteration in the for x in range(retry)
-        mock_completion("{\"validated\": true}")
-    ]
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = side_effects
+    create = learning_client(
+        mock_learn_skill_verbose.client,
+        [_definition("retryFn")],
+        validations=[Exception("Validation call fails #1")],
+    )
 
     df_data = [
         {"colA": "data"}
     ]
-    skill = mock_learn_skill_verbose.learn_skill(df_data, retry=2)
+    skill = mock_learn_skill_verbose.learn_skill(df_data, retry=2, candidates=1, remote_validation=True)
     assert isinstance(skill, GeneralSkill), "Eventually success on second retry."
-    # We confirm we called completions.create 3 times:
-    # 1 for extraction + 1 that failed validation + 1 that succeeded
-    assert mock_learn_skill_verbose.client.chat.completions.create.call_count == 4
+    # 2 rounds of (generation + validation)
+    assert create.call_count == 4
 
 
 def test_learn_skill_all_retries_fail(mock_learn_skill_verbose):
     """
-    If all 'retry' attempts to validate fail, we return None.
+    If all 'retry' rounds fail validation, we return None.
     """
-    side_effects = [
-        mock_completion("{'function_definition': '{\"name\":\"failFn\",\"description\":\"...\",\"parameters\":{}}'}"),
-        Exception("Validation fail #1"),
-        Exception("Validation fail #2"),
-    ]
-    mock_learn_skill_verbose.client.chat.completions.create.side_effect = side_effects
+    create = learning_client(
+        mock_learn_skill_verbose.client,
+        [_definition("failFn")],
+        validations=[Exception("Validation fail #1"), Exception("Validation fail #2")],
+    )
 
     df_data = [
         {"colA": "some"}
     ]
-    skill = mock_learn_skill_verbose.learn_skill(df_data, retry=2)
+    skill = mock_learn_skill_verbose.learn_skill(df_data, retry=2, candidates=1, remote_validation=True)
     assert skill is None, "After 2 retries, no success => None returned."
-    # Called 3 times total (1 extraction + 2 validation attempts)
-    assert mock_learn_skill_verbose.client.chat.completions.create.call_count == 3
\ No newline at end of file
+    assert create.call_count == 4
+
+
+def test_learn_skill_picks_best_candidate(mock_learn_skill_verbose):
+    """
+    Candidates are validated on sample rows; the one with most valid outputs wins.
+    """
+    mock_learn_skill_verbose.client.chat.completions.create.side_effect = None
+    names = iter(["badFn", "goodFn"])
+
+    def create(**kwargs):
+        name = kwargs["tools"][0]["function"]["name"]
+        if name == "minimalFunctionDefinition":
+            return mock_completion(_definition(next(names)))
+        if name == "badFn":
+            raise RuntimeError("provider rejected the schema")
+        return mock_completion('{}')
+
+    mock_learn_skill_verbose.client.chat.completions.create.side_effect = create
+    skill = mock_learn_skill_verbose.learn_skill(
+        [{"colA": "a"}, {"colA": "b"}], retry=1, candidates=2, validation_rows=2, max_attempts=1,
+        remote_validation=True
+    )
+    assert skill._function_definition["function"]["name"] == "goodFn"
+
+
+def test_learn_skills_batch(mock_learn_skill_verbose):
+    """
+    learn_skills learns several skills in one pair of orchestrator runs.
+    """
+    def create(**kwargs):
+        if kwargs["tools"][0]["function"]["name"] == "minimalFunctionDefinition":
+            task_text = kwargs["messages"][1]["content"][0]["text"]
+            return mock_completion(_definition("sentiment" if "sentiment" in task_text else "topic"))
+        return mock_completion('{}')
+
+    mock_learn_skill_verbose.client.chat.completions.create.side_effect = create
+    skills = mock_learn_skill_verbose.learn_skills(
+        [
+            {"df": [{"text": "great"}], "task": "sentiment"},
+            {"df": [{"text": "sports news"}], "task": "topic"},
+        ],
+        retry=1,
+        candidates=1,
+    )
+    assert [s._function_definition["function"]["name"] for s in skills] == ["sentiment", "topic"]
+
+
+def test_learn_skill_uses_skill_cache(tmp_path):
+    """
+    A learned skill is written to the cache and returned from it on the next
+    run without any model call; invalidate_skill forces learning again.
+    """
+    client = MagicMock()
+    create = learning_client(client, [_definition("cachedFn")])
+    rows = [{"colA": "row1"}]
+
+    first = LearnSkill(client=client, skill_cache=str(tmp_path)).learn_skill(rows, task="t", candidates=1)
+    assert create.call_count == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    learner = LearnSkill(client=client, skill_cache=str(tmp_path))
+    second = learner.learn_skill(rows, task="t", candidates=1)
+    assert create.call_count == 1
+    assert second._function_definition == first._function_definition
+    assert second.columns == ["colA"]
+
+    # Different sample => different key
+    learner.learn_skill([{"colA": "other"}], task="t", candidates=1)
+    assert create.call_count == 2
+
+    assert learner.invalidate_skill(rows, task="t") is True
+    learner.learn_skill(rows, task="t", candidates=1)
+    assert create.call_count == 3
+
+
+def test_skill_cache_invalidate_all_and_corrupt_entry(tmp_path):
+    from flashlearn.skills.skill_cache import SkillCache
+
+    cache = SkillCache(str(tmp_path))
+    key = SkillCache.key("t", ["b", "a"], None, [{"a": 1, "b": 2}], "m")
+    assert key == SkillCache.key("t", ["a", "b"], {}, [{"b": 2, "a": 1}], "m")
+    assert key != SkillCache.key("t", ["a", "b"], None, [{"a": 1, "b": 2}], "other-model")
+
+    skill = GeneralSkill("m", {"type": "function", "function": {"name": "f"}}, columns=["a"])
+    stored = cache.put(key, skill)
+    assert set(stored) == {"skill_class", "system_prompt", "function_definition", "columns"}
+    assert cache.get(key, model_name="m2").model_name == "m2"
+
+    (tmp_path / "broken.json").write_text("{not json")
+    assert cache.get("broken") is None
+    assert cache.invalidate() == 2
+    assert cache.get(key) is None
+
+
+def test_learn_skill_samples_large_input(mock_learn_skill_verbose):
+    """
+    Only a token-bounded sample of a large df goes into the generation prompt.
+    """
+    create = learning_client(mock_learn_skill_verbose.client, [_definition("sampledFn")])
+    df_data = [{"colA": f"row {i} " + "filler " * 500} for i in range(3000)]
+
+    skill = mock_learn_skill_verbose.learn_skill(
+        df_data, task="t", retry=1, candidates=1, sample_tokens=1000, max_field_tokens=50
+    )
+    assert isinstance(skill, GeneralSkill)
+    user_blocks = create.call_args_list[0].kwargs["messages"][1]["content"]
+    assert 1 < len(user_blocks) <= 30
+    assert all(block["text"].endswith("…") for block in user_blocks[1:])
+
+
+def test_learn_skill_strict_check_rejects_and_retries(mock_learn_skill_verbose):
+    """
+    A candidate that cannot be repaired locally is dropped without a model
+    call; the next round's candidate is used.
+    """
+    bad_definition = {"name": "bad", "parameters": {"type": "object", "properties": {"tags": {"type": "array"}}}}
+    unfixable = json.dumps({"function_definition": json.dumps(bad_definition)})
+    create = learning_client(mock_learn_skill_verbose.client, [unfixable, _definition("goodFn")])
+    skill = mock_learn_skill_verbose.learn_skill([{"colA": "x"}], retry=2, candidates=1)
+    assert skill._function_definition["function"]["name"] == "goodFn"
+    assert create.call_count == 2
@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from flashlearn.core.orchestration import process_tasks_in_parallel
+from flashlearn.skills import ClassificationSkill
+from flashlearn.skills.pipeline import Pipeline, PipelineStage, StageStats, _PipelineRun, merge_result
+
+
+def _tool_response(arguments):
+    response = MagicMock()
+    type(response).usage = MagicMock(prompt_tokens=5, completion_tokens=5)
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [MagicMock()]
+    response.choices[0].message.tool_calls[0].function.arguments = arguments
+    return response
+
+
+def _client(calls, fail_text=None):
+    client = MagicMock()
+
+    def create(**kwargs):
+        text = kwargs["messages"][-1]["content_str"]
+        calls.append((kwargs["model"], text))
+        if fail_text is not None and fail_text in text:
+            raise RuntimeError("boom")
+        answer = "pos" if kwargs["model"] == "first" else "long"
+        return _tool_response('{"categories": "%s"}' % answer)
+
+    client.chat.completions.create.side_effect = create
+    return client
+
+
+def _pipeline(client, **kwargs):
+    sentiment = ClassificationSkill("first", categories=["pos", "neg"], client=client)
+    length = ClassificationSkill("second", categories=["short", "long"], client=client)
+    return Pipeline([
+        PipelineStage(
+            sentiment,
+            transform=lambda row, res: None if row["text"] == "drop" else
+            {"text": row["text"], "sentiment": res["categories"]},
+            name="sentiment",
+        ),
+        PipelineStage(length, name="length"),
+    ], **kwargs)
+
+
+def test_merge_result():
+    assert merge_result({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
+    assert merge_result({"a": 1}, "x") == {"a": 1, "result": "x"}
+
+
+def test_stage_stats_mean_latency():
+    stats = StageStats("s", succeeded=1, failed=1, total_latency=3.0)
+    assert stats.mean_latency == 1.5
+    assert StageStats("empty").mean_latency is None
+
+
+def test_pipeline_runs_rows_through_all_stages():
+    calls = []
+    pipeline = _pipeline(_client(calls), max_in_flight=2)
+    rows = [{"text": f"row {i}"} for i in range(6)] + [{"text": "drop"}]
+
+    results = pipeline.run(rows, show_progress=False)
+
+    assert set(results) == {str(i) for i in range(6)}
+    assert results["0"] == {"text": "row 0", "sentiment": "pos", "categories": "long"}
+    second_stage_inputs = [text for model, text in calls if model == "second"]
+    assert "row 0\npos" in second_stage_inputs
+    # Rows reach stage 2 before stage 1 has seen every row
+    models = [model for model, _ in calls]
+    assert models.index("second") < len(models) - 1 - models[::-1].index("first")
+
+    sentiment, length = pipeline.stats
+    assert (sentiment.name, sentiment.started, sentiment.succeeded, sentiment.dropped) == ("sentiment", 7, 7, 1)
+    assert (length.started, length.succeeded, length.failed) == (6, 6, 0)
+    assert pipeline.last_status.num_tasks_succeeded == 13
+
+
+def test_pipeline_run_schedules_later_stages_first():
+    stages = [
+        PipelineStage(ClassificationSkill(f"m{i}", categories=["a", "b"]), name=f"s{i}")
+        for i in range(3)
+    ]
+    run = _PipelineRun(stages, [{"text": f"row {i}"} for i in range(4)], lambda i, row: str(i), 4)
+    tasks = run.tasks()
+    assert [next(tasks)["custom_id"] for _ in range(2)] == ["0@0", "1@0"]
+
+    run.advance("1@0", {"categories": "a"})
+    assert next(tasks)["custom_id"] == "1@1"
+    # Row 0 reaches stage 1 and row 1 stage 2 together: row 1 goes first
+    run.advance("0@0", {"categories": "a"})
+    run.advance("1@1", {"categories": "a"})
+    assert [next(tasks)["custom_id"] for _ in range(3)] == ["1@2", "0@1", "2@0"]
+
+
+def test_pipeline_failed_row_is_error_and_not_forwarded():
+    calls = []
+    pipeline = _pipeline(_client(calls, fail_text="row 1"))
+    results = pipeline.run([{"text": "row 0"}, {"text": "row 1"}], max_attempts=1, show_progress=False)
+
+    assert results["1"] == "<ERROR>"
+    assert results["0"]["categories"] == "long"
+    assert pipeline.stats[0].failed == 1
+    assert pipeline.stats[1].started == 1
+
+
+def test_pipeline_stream_yields_final_rows():
+    calls = []
+    pipeline = _pipeline(_client(calls))
+    stream = pipeline.stream(({"text": f"row {i}"} for i in range(4)), buffer_size=1)
+    results = dict(stream)
+    assert sorted(results) == ["0", "1", "2", "3"]
+    assert all(row["sentiment"] == "pos" for row in results.values())
+    assert stream.status.num_tasks_succeeded == 8
+
+
+def test_pipeline_requires_stages():
+    with pytest.raises(ValueError):
+        Pipeline([])
+
+
+def test_orchestrator_polls_source_that_yields_none():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _tool_response('{"answer": "x"}')
+
+    def source():
+        yield None
+        yield None
+        yield {"custom_id": "a", "request": {"messages": []}}
+        yield None
+        yield {"custom_id": "b", "request": {"messages": []}}
+
+    results, status = asyncio.run(process_tasks_in_parallel(
+        tasks_data=source(), client=mock_client, show_progress=False
+    ))
+    assert results == {"a": {"answer": "x"}, "b": {"answer": "x"}}
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+from flashlearn.skills import RelevanceFilter
+from flashlearn.skills.relevance_filter import RelevanceCache
+from flashlearn.utils.chunking import chunk_text, iter_file_chunks
+
+
+def _words(text):
+    return len(text.split())
+
+
+def _fake_run(label_for):
+    def run(tasks, **kwargs):
+        return {
+            t["custom_id"]: {"categories": label_for(t["request"]["messages"][1]["content_str"])}
+            for t in tasks
+        }
+    return run
+
+
+CONTEXT = "Cats purr loudly. Dogs bark. Cats sleep a lot. Fish swim. Birds sing."
+
+
+def test_filter_keeps_relevant_chunks_and_merges_neighbours(monkeypatch):
+    rf = RelevanceFilter("m", client=MagicMock(), chunk_tokens=3, target_tokens=5, token_counter=_words)
+    calls = []
+
+    def run(self, tasks, **kwargs):
+        calls.append([t["request"]["messages"][1]["content_str"] for t in tasks])
+        return _fake_run(lambda text: "relevant" if "Cats" in text else (
+            "somehow_relevant" if "Dogs" in text else "irrelevant"))(tasks)
+
+    monkeypatch.setattr("flashlearn.skills.classification.ClassificationSkill.run_tasks_in_parallel", run)
+    chunks = rf.filter("What do cats do?", CONTEXT)
+
+    # Pass 1 keeps the cat and dog chunks and merges the neighbours; the later, stricter
+    # passes and the final budget cut leave only chunks about cats.
+    assert all("Cats" in c["text"] for c in chunks)
+    assert sum(c["tokens"] for c in chunks) <= 5
+    assert rf.last_passes[0] == {"chunks": 5, "classified": 5, "survivors": 3}
+    assert len(calls[0]) == 5
+
+
+class WordEncoding:
+    def encode_ordinary_batch(self, texts):
+        return [text.split() for text in texts]
+
+    def encode(self, text):
+        return text.split()
+
+
+def test_merge_neighbours_drops_repeated_overlap(tmp_path):
+    text = "Café ouvert. Chats dorment. Chiens aboient. Poissons nagent. Oiseaux chantent."
+    path = tmp_path / "context.txt"
+    path.write_text(text, encoding="utf-8")
+    for chunks in (
+        chunk_text(text, max_tokens=4, token_counter=_words, overlap_tokens=2),
+        list(iter_file_chunks(str(path), max_tokens=4, overlap_tokens=2, encoding=WordEncoding())),
+    ):
+        assert len(chunks) > 2
+        spans = [{**c, "category": "relevant", "_span": (i, i)} for i, c in enumerate(chunks)]
+        merged = RelevanceFilter._merge_neighbours(spans, 100, _words)
+        assert [m["text"] for m in merged] == [text]
+        assert merged[0]["tokens"] == _words(text)
+
+
+def test_filter_stops_early_when_context_fits():
+    rf = RelevanceFilter("m", client=MagicMock(), chunk_tokens=100, target_tokens=100, token_counter=_words)
+    chunks = rf.filter("q", CONTEXT)
+    assert [c["text"] for c in chunks] == [CONTEXT]
+    assert rf.last_passes == []
+
+
+def test_cache_skips_known_chunks(monkeypatch, tmp_path):
+    run = MagicMock(side_effect=_fake_run(lambda text: "relevant" if "Cats" in text else "irrelevant"))
+    monkeypatch.setattr(
+        "flashlearn.skills.classification.ClassificationSkill.run_tasks_in_parallel",
+        lambda self, tasks, **kw: run(tasks, **kw),
+    )
+    cache_path = str(tmp_path / "rel.sqlite")
+    for _ in range(2):
+        rf = RelevanceFilter("m", client=MagicMock(), chunk_tokens=3, target_tokens=5,
+                             max_passes=1, cache_path=cache_path, token_counter=_words)
+        rf.filter("What do cats do?", CONTEXT)
+        rf.cache.close()
+    assert run.call_count == 1
+    assert rf.last_passes[0]["classified"] == 0
+
+
+def test_failed_classification_keeps_chunk(monkeypatch):
+    monkeypatch.setattr(
+        "flashlearn.skills.classification.ClassificationSkill.run_tasks_in_parallel",
+        lambda self, tasks, **kw: {t["custom_id"]: "<ERROR>" for t in tasks},
+    )
+    rf = RelevanceFilter("m", client=MagicMock(), chunk_tokens=3, target_tokens=5,
+                         max_passes=1, token_counter=_words)
+    chunks = rf.filter("q", CONTEXT)
+    assert chunks  # nothing was dropped, only cut to the budget
+    assert rf.cache.get_many([RelevanceCache.key("m", "q", "Fish swim. ")]) == {}
+
+
+def test_answer_streams_from_filtered_context(monkeypatch):
+    client = MagicMock()
+    events = []
+    for piece in ["Cats ", "purr."]:
+        event = MagicMock()
+        event.choices[0].delta.content = piece
+        events.append(event)
+    client.chat.completions.create.return_value = iter(events)
+    rf = RelevanceFilter("m", client=client, chunk_tokens=100, target_tokens=100, token_counter=_words)
+
+    assert "".join(rf.answer("What do cats do?", CONTEXT)) == "Cats purr."
+    kwargs = client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert "Question: What do cats do?" in kwargs["messages"][1]["content"]
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from flashlearn.skills import toolkit
+from flashlearn.skills.general_skill import GeneralSkill
+
+
+def test_index_lists_all_definitions():
+    names = toolkit.list_skills()
+    assert len(names) == 263
+    assert "ConvertToGoogleQueries" in names
+    assert "ConvertToGoogleQueries" in dir(toolkit)
+    assert toolkit.describe("ConvertToGoogleQueries").startswith("Convert the given question")
+
+
+def test_get_and_attribute_access_share_cached_definition():
+    config = toolkit.get("ClassifyDifficultyOfQuestion")
+    assert toolkit.ClassifyDifficultyOfQuestion is config
+    assert config["skill_class"] == "GeneralSkill"
+    assert config["function_definition"]["type"] == "function"
+
+
+def test_unknown_skill_raises():
+    with pytest.raises(KeyError):
+        toolkit.get("NoSuchSkill")
+    with pytest.raises(AttributeError):
+        toolkit.NoSuchSkill
+    with pytest.raises(ImportError):
+        from flashlearn.skills.toolkit import NoSuchSkill  # noqa: F401
+
+
+def test_search_matches_name_and_description():
+    assert "ConvertToGoogleQueries" in toolkit.search("google queries")
+    assert toolkit.search("zzzz-no-match") == []
+
+
+def test_every_definition_normalizes_to_a_tool():
+    for name in toolkit.list_skills():
+        function = toolkit.get(name)["function_definition"]["function"]
+        assert function["name"]
+        assert function["parameters"]["type"] == "object"
+
+
+def test_normalize_stringified_definition():
+    config = {
+        "skill_class": "GeneralSkill",
+        "system_prompt": "p",
+        "function_definition": {
+            "function_definition": json.dumps({
+                "name": "F",
+                "description": "d",
+                "strict": True,
+                "parameters": {"type": "object", "properties": {"x": {"type": "string"}}},
+                "required": ["x"],
+                "additionalProperties": False,
+            }) + "}"
+        },
+    }
+    function = toolkit.normalize_definition(config)["function_definition"]["function"]
+    assert function["name"] == "F"
+    assert function["parameters"]["required"] == ["x"]
+    assert function["parameters"]["additionalProperties"] is False
+    assert "required" not in function
+
+
+def test_toolkit_definition_loads_as_general_skill():
+    skill = GeneralSkill.load_skill(toolkit.get("AdvancedKeywordContextMap"), client=object())
+    assert skill._build_function_def()["function"]["name"] == "StoreKeywordContext"
@@ -1,553 +1,109 @@
-# Auto-generated Python dictionaries from JSON files
-
-AcademicAbstract = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateAcademicAbstract', 'description': 'Generates an academic-style abstract summarizing the document.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'abstract': {'type': 'string'}}, 'required': ['abstract'], 'additionalProperties': False}}}}
-
-ActionSceneDescription = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateActionScene', 'description': 'Generates an intense, cinematic action scene.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'action_scene': {'type': 'string'}}, 'required': ['action_scene'], 'additionalProperties': False}}}}
-
-AdvancedKeywordContextMap = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"StoreKeywordContext","description":"Store context windows around keywords and return snippets associated with each keyword.","strict":true,"parameters":{"type":"object","properties":{"keyword_context":{"type":"object","properties":{"keyword":{"type":"array","items":{"type":"string"}}},"additionalProperties":false}},"additionalProperties":false},"required":["keyword_context"]}}'}}
-
-AdvancedSpellingAndGrammarStats = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountGrammarSpellingErrors', 'description': 'Counts the number of grammar and spelling errors in a given text and provides a score.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'error_counts': {'type': 'object', 'properties': {'spelling': {'type': 'integer'}, 'grammar': {'type': 'integer'}}, 'required': ['spelling', 'grammar']}, 'score': {'type': 'integer'}}, 'required': ['error_counts', 'score'], 'additionalProperties': False}}}}
-
-AggregatedEmotionHistogram = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateEmotionHistogram', 'description': 'Generate a histogram of emotional categories from given data.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'emotion_histogram': {'type': 'object', 'properties': {'joy': {'type': 'integer'}, 'anger': {'type': 'integer'}, 'sadness': {'type': 'integer'}, 'fear': {'type': 'integer'}, 'surprise': {'type': 'integer'}}, 'required': ['joy', 'anger', 'sadness', 'fear', 'surprise']}}, 'required': ['emotion_histogram'], 'additionalProperties': False}}}}
-
-AnswerFactualQuestion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AnswerQuestion', 'description': 'Quickly answer a direct question using the provided context.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answer': {'type': 'string'}}, 'required': ['answer'], 'additionalProperties': False}}}}
-
-AnswerWithQuotes = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GetAnswerAndQuote', 'description': 'Returns an answer and a verbatim quote from the context.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answer': {'type': 'string'}, 'quote': {'type': 'string'}}, 'required': ['answer', 'quote'], 'additionalProperties': False}}}}
-
-AppointmentReminderMessage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateAppointmentReminder', 'description': 'Generate a short, friendly reminder of an upcoming appointment.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reminder_message': {'type': 'string'}}, 'required': ['reminder_message'], 'additionalProperties': False}}}}
-
-AutoThankYouForFeedback = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateThankYouFeedback', 'description': 'Generates an automated thank-you message for feedback received.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'thank_you': {'type': 'string'}}, 'required': ['thank_you'], 'additionalProperties': False}}}}
-
-AverageParagraphComplexity = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComputeAverageComplexity', 'description': 'Calculate the average complexity of text per paragraph.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'complexity_score': {'type': 'number'}}, 'required': ['complexity_score'], 'additionalProperties': False}}}}
-
-AverageSentenceLength = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComputeMeanSentenceLength', 'description': 'Calculates the average sentence length in a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'avg_sentence_length': {'type': 'number'}}, 'required': ['avg_sentence_length'], 'additionalProperties': False}}}}
-
-BasicSentimentStats = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TextSentimentAnalysis', 'description': 'Counts the percentages of positive, negative, and neutral texts.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'positive': {'type': 'number'}, 'negative': {'type': 'number'}, 'neutral': {'type': 'number'}}, 'required': ['positive', 'negative', 'neutral'], 'additionalProperties': False}}}}
-
-BrandMentionDetector = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DetectBrandReferences', 'description': 'Detect brand references from a brand list and return a mapping of brand names to their existence in a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'brands': {'type': 'object', 'additionalProperties': {'type': 'boolean'}}}, 'required': ['brands'], 'additionalProperties': False}}}}
-
-BrandPerceptionAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CalculateBrandSentiment', 'description': 'Calculate brand sentiment or loyalty from text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'brand_sentiment': {'type': 'object', 'properties': {'sentiment_score': {'type': 'number'}, 'notes': {'type': 'string'}}, 'required': ['sentiment_score', 'notes']}}, 'required': ['brand_sentiment'], 'additionalProperties': False}}}}
-
-BulletedSynopsis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'summarizeText', 'description': 'Summarize text into bullet points using a custom bullet prefix.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'synopsis_bullets': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['synopsis_bullets'], 'additionalProperties': False}}}}
-
-BulletPointSummary = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertToBulletPoints', 'description': 'Convert the given document into concise bullet points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_BlogPost = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertBlogPostToBulletPoints', 'description': 'Converts a blog post into a concise set of bullet points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_ChapterNotes = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CondenseChapter', 'description': 'Condenses a book chapter into bullet points, summarizing main characters, themes, or plot events.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_FeedbackList = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeUserFeedback', 'description': 'Group and summarize user feedback into bullet points. Each bullet point represents a distinct theme or suggestion.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_Instructions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertInstructionsToBulletPoints', 'description': 'Transform detailed instructions into a concise bullet list of steps.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_MeetingRecap = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteMeetingTranscript', 'description': 'Rewrite the provided meeting transcript into bullet points focusing on main discussions and action items.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_PressRelease = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractAnnounceBullets', 'description': 'Extracts primary announcements from a press release and organizes them as bullet points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_ResearchArticle = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateResearchBulletPoints', 'description': 'Given a research article, generate bullet points about its hypotheses, methods, and key findings.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_TrainingGuide = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CondenseTrainingGuide', 'description': 'Condenses a lengthy training guide into concise bullet-point tips.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_UserManual = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeUserManual', 'description': 'Summarizes the user manual into bullet points to help new users quickly grasp the features.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-BulletSummary_Whitepaper = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'BreakDownWhitepaper', 'description': 'Break down a technical whitepaper into bullet points for method, results, and conclusions.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-CategorizeNewsArticle = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeArticle', 'description': "Map a news article to a broad category (e.g., 'sports', 'politics', etc.).", 'strict': True, 'parameters': {'type': 'object', 'properties': {'category': {'type': 'string'}}, 'required': ['category'], 'additionalProperties': False}}}}
-
-CategoryPredictionFromKeywords = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeText', 'description': 'Match text to a predefined set of categories using keywords and return the category.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'category': {'type': 'string'}}, 'required': ['category'], 'additionalProperties': False}}}}
-
-ChildrenStoryWithMoral = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateChildrenStory', 'description': "Generates a brief children's story teaching a moral lesson.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'story': {'type': 'string'}}, 'required': ['story'], 'additionalProperties': False}}}}
-
-ClassifyCodeSnippetLanguage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyProgrammingLanguage', 'description': 'Identifies the programming language of a provided code snippet.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'language': {'type': 'string'}}, 'required': ['language'], 'additionalProperties': False}}}}
-
-ClassifyCommentSection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifyComments', 'description': "Classify multiple user comments as 'toxic', 'spam', 'relevant', etc. Returns a list of labels for each comment.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'comment_labels': {'type': 'array', 'items': {'type': 'string', 'enum': ['toxic', 'spam', 'relevant']}}}, 'required': ['comment_labels'], 'additionalProperties': False}}}}
-
-ClassifyDifficultyOfQuestion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RateQuestionDifficulty', 'description': "Rates question difficulty as 'easy', 'medium', or 'hard'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'difficulty': {'type': 'string', 'enum': ['easy', 'medium', 'hard']}}, 'required': ['difficulty'], 'additionalProperties': False}}}}
-
-ClassifyGenreOfBlurb = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TagLiteraryGenre', 'description': "Tag a short text as 'romance', 'mystery', 'sci-fi', or other literary genre.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'genre': {'type': 'string', 'enum': ['romance', 'mystery', 'sci-fi', 'other']}}, 'required': ['genre'], 'additionalProperties': False}}}}
-
-ClassifyLegalDocumentType = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyLegalDocumentType', 'description': 'Identifies the type of a legal document such as contract, will, or complaint.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'legal_type': {'type': 'string'}}, 'required': ['legal_type'], 'additionalProperties': False}}}}
-
-ClassifyMarketingHeadline = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LabelHeadlineStyle', 'description': "Labels a marketing headline's style such as 'discount-based', 'emotional', or 'urgency'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'headline_style': {'type': 'string'}}, 'required': ['headline_style'], 'additionalProperties': False}}}}
-
-ClassifyQualityOfWriting = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeWritingQuality', 'description': 'Categorize the quality of writing as excellent, good, or needs work.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'quality': {'type': 'string', 'enum': ['excellent', 'good', 'needs work']}}, 'required': ['quality'], 'additionalProperties': False}}}}
-
-ClassifyReviewSentiment = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeReviews', 'description': "Label each review as 'positive', 'negative', or 'neutral'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'sentiment': {'type': 'string', 'enum': ['positive', 'negative', 'neutral']}}, 'required': ['sentiment'], 'additionalProperties': False}}}}
-
-ClothingItemClassifier = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TagItemDescription', 'description': "Tag an item description as 'shirt', 'pants', 'shoes', etc.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'clothing_type': {'type': 'string'}}, 'required': ['clothing_type'], 'additionalProperties': False}}}}
-
-CodeDebugQA = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DebugCodeBehavior', 'description': 'Answer a question about code behavior or bugs.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'debug_answer': {'type': 'string'}}, 'required': ['debug_answer'], 'additionalProperties': False}}}}
-
-CodeDocstringExtractor = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractDocstrings', 'description': 'Finds and returns docstrings or comments in source code.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'docstrings': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['docstrings'], 'additionalProperties': False}}}}
-
-CodeOfConductReminder = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RemindCodeOfConduct', 'description': 'Reminds a group about the code of conduct or policy guidelines.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reminder': {'type': 'string'}}, 'required': ['reminder'], 'additionalProperties': False}}}}
-
-CombineAndDeduplicateRecords = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'MergeRecords', 'description': 'Merge records describing the same entity into one and return a new list of unique records.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'uniqueRecords': {'type': 'array', 'items': {'type': 'object'}}}, 'required': ['uniqueRecords'], 'additionalProperties': False}}}}
-
-ComedicAutoReplyEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateFunnyOutOfOfficeReply', 'description': 'Generates a humorous out-of-office automatic reply message.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'auto_reply': {'type': 'string'}}, 'required': ['auto_reply'], 'additionalProperties': False}}}}
-
-ComedicDialogueSketch = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateHumorousDialogue', 'description': 'Generates a humorous dialogue between specified characters.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'dialogue': {'type': 'string'}}, 'required': ['dialogue'], 'additionalProperties': False}}}}
-
-ComedicInsultGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GeneratePlayfulInsult', 'description': 'Generates a playful, mild comedic insult.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'insult': {'type': 'string'}}, 'required': ['insult'], 'additionalProperties': False}}}}
-
-ComedicObituaryPrompt = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComedicObituary', 'description': 'Generates a lighthearted and satirical obituary.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'obituary': {'type': 'string'}}, 'required': ['obituary'], 'additionalProperties': False}}}}
-
-ComedicParodySketch = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'WriteComedicParody', 'description': 'This function generates a short comedic parody of a specified scenario.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'parody': {'type': 'string'}}, 'required': ['parody'], 'additionalProperties': False}}}}
-
-ComedicProductReview = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateComedicReview', 'description': 'Generates a humorous ad-style review for a product.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'comedic_review': {'type': 'string'}}, 'required': ['comedic_review'], 'additionalProperties': False}}}}
-
-CompareHeadersAcrossDocuments = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CheckHeadingsInDocs', 'description': 'Check which documents contain which headings and return a mapping of headings to a boolean array indicating presence in each document.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'headingA': {'type': 'array', 'items': {'type': 'boolean'}}, 'headingB': {'type': 'array', 'items': {'type': 'boolean'}}, 'headingC': {'type': 'array', 'items': {'type': 'boolean'}}}, 'required': ['headingA', 'headingB', 'headingC'], 'additionalProperties': False}}}}
-
-CompareReviewScores = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComputeAvgRatingByCategory', 'description': 'Compute average rating by category from (text, score) pairs.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'averages': {'type': 'object', 'properties': {'categoryA': {'type': 'number'}, 'categoryB': {'type': 'number'}}, 'required': ['categoryA', 'categoryB']}}, 'required': ['averages'], 'additionalProperties': False}}}}
-
-CompetitorMentionsFrequency = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountCompetitorReferences', 'description': 'Counts the references to each competitor in the data provided.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'competitor_counts': {'type': 'object', 'properties': {'CompetitorA': {'type': 'integer'}, 'CompetitorB': {'type': 'integer'}}, 'required': ['CompetitorA', 'CompetitorB'], 'additionalProperties': False}}, 'required': ['competitor_counts'], 'additionalProperties': False}}}}
-
-ComposeCustomerSupportEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftPoliteResponse', 'description': "Generates a polite response explaining steps to resolve a user's issue.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'support_email': {'type': 'string'}}, 'required': ['support_email'], 'additionalProperties': False}}}}
-
-ComputeSyntacticDiversity = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'EstimateSyntacticDiversity', 'description': 'Estimates the syntactic diversity of a text based on its complexity and variety of sentence structures.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'syntactic_diversity': {'type': 'number'}}, 'required': ['syntactic_diversity'], 'additionalProperties': False}}}}
-
-CondescendingPersuasion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteTextPersuasively', 'description': 'Rewrites text to persuade from a superior vantage point in a humorous tone.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'condescending_version': {'type': 'string'}}, 'required': ['condescending_version'], 'additionalProperties': False}}}}
-
-ConflictingAnswerHandler = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CheckForConflicts', 'description': 'Check multiple sources for contradictory answers.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'conflicts': {'type': 'object', 'properties': {'source1': {'type': 'string'}, 'source2': {'type': 'string'}}, 'required': ['source1', 'source2']}}, 'required': ['conflicts'], 'additionalProperties': False}}}}
-
-ConflictingOpinionExtractor = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindContradictoryStatements', 'description': 'Identify pairs of contradictory statements.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'conflicts': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'string'}}}}, 'required': ['conflicts'], 'additionalProperties': False}}}}
-
-ContextDrivenFAQ = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SelectOrSynthesizeFAQ', 'description': 'Select the best FAQ entry or synthesize a new one.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'faq_answer': {'type': 'string'}}, 'required': ['faq_answer'], 'additionalProperties': False}}}}
-
-ConversationTurnAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name": "CountParticipantSpeech", "description": "Counts how many times each participant speaks and calculates average turn length.", "strict": true, "parameters": {"type": "object", "properties": {"turn_data": {"type": "object", "additionalProperties": {"type": "object", "properties": {"turns": {"type": "integer"}, "avg_length": {"type": "number"}}, "required": ["turns", "avg_length"]}}}}, "required": ["turn_data"], "additionalProperties": false}}'}}
-
-CoordinatesExtractor = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractCoordinates', 'description': 'Pull out lat/long if found. Return {"coordinates": [lat, long]} or {"coordinates": null} if none.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'coordinates': {'type': 'array', 'items': {'type': 'number'}, 'nullable': True}}, 'required': ['coordinates'], 'additionalProperties': False}}}}
-
-CorrectCommonMisconceptions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClarifyMisconceptions', 'description': 'A function that returns an explanation to clarify typical misconceptions regarding a topic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'explanation': {'type': 'string'}}, 'required': ['explanation'], 'additionalProperties': False}}}}
-
-CorrelationOfKeywords = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'KeywordCoOccurrences', 'description': 'Show how often given keywords appear together.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'co_occurrences': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['co_occurrences'], 'additionalProperties': False}}}}
-
-CreateShortDescription = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateMetaDescription', 'description': 'Produce a concise promotional or meta description from the text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'short_description': {'type': 'string'}}, 'required': ['short_description'], 'additionalProperties': False}}}}
-
-CreateSloganVersion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateSlogan', 'description': 'Generates a one-liner slogan from the provided text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'slogan': {'type': 'string'}}, 'required': ['slogan'], 'additionalProperties': False}}}}
-
-CrossOverFanFiction = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'MergeCharactersFromDifferentUniverses', 'description': 'Creates a short piece of fan fiction by merging characters from various universes.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'fan_fiction': {'type': 'string'}}, 'required': ['fan_fiction'], 'additionalProperties': False}}}}
-
-DailyBulletinAnnouncement = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'summarizeDailyNews', 'description': 'Summarizes daily internal news items.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bulletin': {'type': 'string'}}, 'required': ['bulletin'], 'additionalProperties': False}}}}
-
-DateOfEvent = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindDateTimeMention', 'description': 'Extracts a mention of a date or time from the given text and returns it as a JSON object.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'date_time': {'type': 'string', 'nullable': True}}, 'required': ['date_time'], 'additionalProperties': False}}}}
-
-DetectReadabilityDropOff = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FlagDenseParagraphs', 'description': 'Identifies and flags paragraphs that are too dense or complex.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'difficult_paragraphs': {'type': 'array', 'items': {'type': 'integer'}}}, 'required': ['difficult_paragraphs'], 'additionalProperties': False}}}}
-
-DetectSpamMessage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifySpam', 'description': "Classify whether a message is spam (true/false). Return {'is_spam': true} or {'is_spam': false}.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'is_spam': {'type': 'boolean'}}, 'required': ['is_spam'], 'additionalProperties': False}}}}
-
-DirectQuotePassage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractQuotedPassage', 'description': 'Returns the exact excerpt from the document that best addresses the question.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'quoted_passage': {'type': 'string'}}, 'required': ['quoted_passage'], 'additionalProperties': False}}}}
-
-DocToOutline = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'OrganizeTextOutline', 'description': 'Organizes text into an outline based on its headings.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'outline': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['outline'], 'additionalProperties': False}}}}
-
-DomainSpecificClassification = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeDomainText', 'description': "Refines classification of the text based on a given domain context (e.g., 'medical').", 'strict': True, 'parameters': {'type': 'object', 'properties': {'classification': {'type': 'string'}}, 'required': ['classification'], 'additionalProperties': False}}}}
-
-EmotionalToneDetection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'EmotionIntensityScores', 'description': 'Provide intensity scores for emotions such as joy, anger, and sadness.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'joy': {'type': 'number'}, 'anger': {'type': 'number'}, 'sadness': {'type': 'number'}}, 'required': ['joy', 'anger', 'sadness'], 'additionalProperties': False}}}}
-
-EssayQuestionWriter = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateInDepthExplanation', 'description': 'Generates an in-depth explanation based on provided references.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'essay': {'type': 'string'}}, 'required': ['essay'], 'additionalProperties': False}}}}
-
-ExecutiveBrief = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CondenseText', 'description': 'Condense the text into a concise executive summary with key takeaways.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'executive_summary': {'type': 'string'}}, 'required': ['executive_summary'], 'additionalProperties': False}}}}
-
-ExtractCodeSections = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindCodeBlocks', 'description': 'Extracts code blocks from the given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'code_blocks': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['code_blocks'], 'additionalProperties': False}}}}
-
-ExtractCommonPhrasesAcrossDocs = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindRecurringPhrases', 'description': 'Find recurring phrases across multiple documents.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'common_phrases': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['common_phrases'], 'additionalProperties': False}}}}
-
-ExtractHyperlinks = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindHyperlinksInHTML', 'description': 'Extracts all hyperlink URLs from the provided HTML content.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'links': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['links'], 'additionalProperties': False}}}}
-
-ExtractImportantFigures = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractFigures', 'description': 'Extract numbers, statistics, or key facts from the text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'figures': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['figures'], 'additionalProperties': False}}}}
-
-ExtractJobTitles = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyJobTitles', 'description': 'Extracts job titles from a resume or CV text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'job_titles': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['job_titles'], 'additionalProperties': False}}}}
-
-ExtractKeyPhrases = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractKeyPhrases', 'description': 'Pull out the most relevant phrases from a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'key_phrases': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['key_phrases'], 'additionalProperties': False}}}}
-
-ExtractNamedEntities = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindNamedEntities', 'description': 'Extract named entities such as people, places, and events from a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'entities': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['entities'], 'additionalProperties': False}}}}
-
-ExtractTablesFromHTML = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractTableData', 'description': 'Pull out table data from HTML as rows and return a structured list of tables with cell data.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'tables': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'string'}}}}}, 'required': ['tables'], 'additionalProperties': False}}}}
-
-FableCreationWithAnimals = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateFable', 'description': 'Creates a short fable featuring talking animals with an underlying moral lesson.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'fable': {'type': 'string'}}, 'required': ['fable'], 'additionalProperties': False}}}}
-
-FactualEvidenceCitation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractAnswerWithCitation', 'description': 'Extracts an answer and its supporting citation from a text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answer': {'type': 'string'}, 'citation': {'type': 'string'}}, 'required': ['answer', 'citation'], 'additionalProperties': False}}}}
-
-FairyTaleEndingGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateFairyTaleEnding', 'description': "Generates a classic 'fairy tale' resolution from a conflict scenario.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'fairy_tale_ending': {'type': 'string'}}, 'required': ['fairy_tale_ending'], 'additionalProperties': False}}}}
-
-FillInTheBlank = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CompletePrompt', 'description': 'This function completes a partially written prompt by generating a completion text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'completion': {'type': 'string'}}, 'required': ['completion'], 'additionalProperties': False}}}}
-
-FillMissingInfo = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RetrieveMissingFields', 'description': 'Retrieve data for each missing field from context.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'field1': {'type': 'string'}, 'field2': {'type': 'string'}}, 'required': ['field1', 'field2'], 'additionalProperties': False}}}}
-
-FindRelevantSection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LocateRelevantSection', 'description': 'Locate the paragraph in the document that best answers the question.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'relevant_section': {'type': 'string'}}, 'required': ['relevant_section'], 'additionalProperties': False}}}}
-
-FindSpecificStatistic = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SearchNumericStat', 'description': 'Extracts a numeric statistic from the provided data text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'statistic': {'type': 'string'}}, 'required': ['statistic'], 'additionalProperties': False}}}}
-
-FormalAnnouncementDraft = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'PolishedAnnouncementGenerator', 'description': 'Takes details and produces a polished announcement.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'announcement': {'type': 'string'}}, 'required': ['announcement'], 'additionalProperties': False}}}}
-
-FormulaDerivationQA = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DeriveMathFormula', 'description': 'Walk through deriving or applying a math formula.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'formula_solution': {'type': 'string'}}, 'required': ['formula_solution'], 'additionalProperties': False}}}}
-
-FragmentationAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'MeasureTextFragmentation', 'description': 'Measure how frequently the text changes topic or viewpoint.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'fragmentation_score': {'type': 'number'}}, 'required': ['fragmentation_score'], 'additionalProperties': False}}}}
-
-FreestyleRapLyrics = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateRapLyrics', 'description': 'Generates rap lyrics based on a specified topic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'rap_lyrics': {'type': 'string'}}, 'required': ['rap_lyrics'], 'additionalProperties': False}}}}
-
-FuturisticSciFiScene = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateFuturisticScene', 'description': 'Generates a scene set in a futuristic sci-fi world.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'scene': {'type': 'string'}}, 'required': ['scene'], 'additionalProperties': False}}}}
-
-GatherEntityFrequencyAcrossDocs = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountEntityMentions', 'description': 'Counts how often each known entity is mentioned across documents.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'entity_counts': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['entity_counts'], 'additionalProperties': False}}}}
-
-GenerateBrandTagline = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateTagline', 'description': 'Generates a catchy brand tagline.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'tagline': {'type': 'string'}}, 'required': ['tagline'], 'additionalProperties': False}}}}
-
-GenerateFormalApologyEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateApologyLetter', 'description': 'Generates a formal apology letter for a mistake.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'apology_email': {'type': 'string'}}, 'required': ['apology_email'], 'additionalProperties': False}}}}
-
-GeneratePersonalizedEmailGreeting = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateWarmGreeting', 'description': 'Generates a warm, personal greeting for an email.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'greeting': {'type': 'string'}}, 'required': ['greeting'], 'additionalProperties': False}}}}
-
-GeneratePoem = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreatePoem', 'description': 'Generates a poem based on a given theme or style.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'poem': {'type': 'string'}}, 'required': ['poem'], 'additionalProperties': False}}}}
-
-GenerateTableOfContents = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateTableOfContents', 'description': 'Generates a conceptual table of contents based on the topics within a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'table_of_contents': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['table_of_contents'], 'additionalProperties': False}}}}
-
-HeadlineGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateCatchyHeadline', 'description': 'Given the text, produce a single catchy headline.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'headline': {'type': 'string'}}, 'required': ['headline'], 'additionalProperties': False}}}}
-
-HighlightActionItems = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractActionItems', 'description': 'Extract action items or tasks from a meeting note or plan.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'action_items': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['action_items'], 'additionalProperties': False}}}}
-
-HighlightAllPossibleAnswers = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindSnippets', 'description': 'Find every snippet in the doc that might answer a complex query.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'snippets': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['snippets'], 'additionalProperties': False}}}}
-
-HighlightAndAnnotate = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"AnnotateKeySentences","description":"Extract key sentences from a text and annotate them with relevant metadata.","strict":true,"parameters":{"type":"object","properties":{"annotations":{"type":"array","items":{"type":"object","properties":{"text":{"type":"string"},"note":{"type":"string"}},"required":["text","note"]}}}},"required":["annotations"],"additionalProperties":false}}'}}
-
-HighlightAndExpand = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"FindCrucialLines","description":"Identifies crucial lines in the provided text and returns expansions or definitions for each line.","strict":true,"parameters":{"type":"object","properties":{"highlights":{"type":"array","items":{"type":"object","properties":{"text":{"type":"string"},"expansion":{"type":"string"}},"required":["text","expansion"]}}}},"required":["highlights"],"additionalProperties":false}}'}}
-
-HighlightConfidenceAnswer = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GetAnswerWithConfidence', 'description': 'Returns an answer along with a confidence score.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answer': {'type': 'string'}, 'confidence': {'type': 'number'}}, 'required': ['answer', 'confidence'], 'additionalProperties': False}}}}
-
-HighlightKeyPoints = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractKeyIdeas', 'description': 'Extract the key ideas from the provided text and list them as key points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'key_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['key_points'], 'additionalProperties': False}}}}
-
-HighlightSafetyWarnings = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractDisclaimers', 'description': 'Extract important disclaimers or safety warnings from the text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'warnings': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['warnings'], 'additionalProperties': False}}}}
-
-HistoricalAlternateRealityScene = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ReimagineHistoricalEvent', 'description': 'A function that writes a scene re-imagining a historical event in a different way.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'alternate_history': {'type': 'string'}}, 'required': ['alternate_history'], 'additionalProperties': False}}}}
-
-HistoricalFactFinder = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'HistoricalDataAnswer', 'description': 'Answer a question specifically about historical data.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'historical_answer': {'type': 'string'}}, 'required': ['historical_answer'], 'additionalProperties': False}}}}
-
-HolidayGreetingMessage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateFestiveGreeting', 'description': 'Generates a festive greeting for a specified holiday.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'greeting': {'type': 'string'}}, 'required': ['greeting'], 'additionalProperties': False}}}}
-
-HorrorMicroStory = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateHorrorStory', 'description': 'Creates a very short horror story based on a given prompt.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'horror_story': {'type': 'string'}}, 'required': ['horror_story'], 'additionalProperties': False}}}}
-
-HumorizeText = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'MakeTextComedic', 'description': 'Enhances text by adding humorous twists and comedic elements.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'comedic_version': {'type': 'string'}}, 'required': ['comedic_version'], 'additionalProperties': False}}}}
-
-HypothesizePossibleAnswers = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GeneratePotentialAnswers', 'description': 'Generates potential answers from multiple partial contexts.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'possible_answers': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['possible_answers'], 'additionalProperties': False}}}}
-
-IdentifyControversialContent = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LabelSensitiveContent', 'description': 'Label if content is potentially sensitive or controversial.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'controversial': {'type': 'boolean'}}, 'required': ['controversial'], 'additionalProperties': False}}}}
-
-IdentifyHealthyVsUnhealthyRecipe = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeRecipeHealthiness', 'description': 'Determine if a recipe is generally healthy or not.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'healthiness': {'type': 'string', 'enum': ['healthy', 'unhealthy']}}, 'required': ['healthiness'], 'additionalProperties': False}}}}
-
-IdentifyHumorTone = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CheckIfHumorous', 'description': 'Checks if the given text is intended to be humorous.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'is_humorous': {'type': 'boolean'}}, 'required': ['is_humorous'], 'additionalProperties': False}}}}
-
-IdentifyOutliersInTextLengths = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindAbnormallyLongOrShortDocs', 'description': 'Identifies and returns indices or IDs of documents that are significantly longer or shorter than the average document length.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'outliers': {'type': 'array', 'items': {'type': 'integer'}}}, 'required': ['outliers'], 'additionalProperties': False}}}}
-
-ImageCaptionsToSceneCategory = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifyImageCaption', 'description': "Classifies an image caption into categories such as 'indoors', 'outdoors', or 'crowd'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'scene_category': {'type': 'string'}}, 'required': ['scene_category'], 'additionalProperties': False}}}}
-
-ImagineAlienDialogue = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateAlienDialogue', 'description': 'Generates a dialogue between alien beings on a new planet.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'alien_dialogue': {'type': 'string'}}, 'required': ['alien_dialogue'], 'additionalProperties': False}}}}
-
-InstructiveHowTo = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateHowToInstructions', 'description': "Generates stepwise instructions for a 'how-to' question.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'steps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['steps'], 'additionalProperties': False}}}}
-
-InternalUpdateMessage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComposeTeamUpdate', 'description': 'Generates a short update message for a specific team on Slack or Teams.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'update_message': {'type': 'string'}}, 'required': ['update_message'], 'additionalProperties': False}}}}
-
-InvoiceReminderEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftInvoicePaymentReminder', 'description': 'Generates a friendly invoice payment reminder email.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reminder_email': {'type': 'string'}}, 'required': ['reminder_email'], 'additionalProperties': False}}}}
-
-JobOfferLetter = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateJobOfferLetter', 'description': 'Generates a formal job offer letter containing position, salary, and other details.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'offer_letter': {'type': 'string'}}, 'required': ['offer_letter'], 'additionalProperties': False}}}}
-
-JobPostClassification = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LabelJobPosting', 'description': 'Labels a job posting by its field such as IT, HR, marketing, etc.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'field': {'type': 'string'}}, 'required': ['field'], 'additionalProperties': False}}}}
-
-KeywordsWithFrequencies = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractKeywordCounts', 'description': 'Extract repeated keywords and their counts from a given text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'keyword_counts': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['keyword_counts'], 'additionalProperties': False}}}}
-
-KidsJokeGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateFamilyFriendlyJoke', 'description': 'Generates a family-friendly joke based on a given topic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'kids_joke': {'type': 'string'}}, 'required': ['kids_joke'], 'additionalProperties': False}}}}
-
-LabelSarcasmInTweet = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DetectSarcasm', 'description': 'Detect if a tweet is sarcastic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sarcastic': {'type': 'boolean'}}, 'required': ['sarcastic'], 'additionalProperties': False}}}}
-
-LabelTechSupportTickets = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifySupportTickets', 'description': 'Classifies support tickets by urgency such as low, medium, or high.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'urgency': {'type': 'string', 'enum': ['low', 'medium', 'high']}}, 'required': ['urgency'], 'additionalProperties': False}}}}
-
-LanguageOfText = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyLanguage', 'description': 'Identifies the language of the input text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'language': {'type': 'string'}}, 'required': ['language'], 'additionalProperties': False}}}}
-
-LawQuestionAnswer = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LegalQandA', 'description': 'Provides a direct legal Q&A based on provided statutes or documents.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'legal_answer': {'type': 'string'}}, 'required': ['legal_answer'], 'additionalProperties': False}}}}
-
-LivingObjectAnthropomorphicStory = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateObjectStory', 'description': 'Creates a short narrative from the perspective of an inanimate object.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'object_story': {'type': 'string'}}, 'required': ['object_story'], 'additionalProperties': False}}}}
-
-LocationBasedQuery = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AnswerLocationQuery', 'description': 'Responds to a location-based query with addresses or directions.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'location_answer': {'type': 'string'}}, 'required': ['location_answer'], 'additionalProperties': False}}}}
-
-LocationCategorySnippet = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifyLocation', 'description': "Classifies a snippet about a place into types such as 'tourist spot' or 'historical site'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'location_type': {'type': 'string'}}, 'required': ['location_type'], 'additionalProperties': False}}}}
-
-LogicPuzzleSolver = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SolveLogicPuzzle', 'description': 'Solves a short logic puzzle and returns the solution.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'solution': {'type': 'string'}}, 'required': ['solution'], 'additionalProperties': False}}}}
-
-MarkdownToHTML = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertMarkdownToHTML', 'description': 'Converts Markdown text into HTML format.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'html': {'type': 'string'}}, 'required': ['html'], 'additionalProperties': False}}}}
-
-MarketingEmailForNewFeature = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GeneratePromotionalEmail', 'description': 'Generates a promotional email for a new product feature.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'marketing_email': {'type': 'string'}}, 'required': ['marketing_email'], 'additionalProperties': False}}}}
-
-MeasureLinguisticStyleShift = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CompareTextStyles', 'description': 'Score how different two texts are in style/vocabulary.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'style_diff_score': {'type': 'number'}}, 'required': ['style_diff_score'], 'additionalProperties': False}}}}
-
-MeasureRepetitivePhrases = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountRepeatedPhrases', 'description': 'Counts repeated phrases throughout a given text and returns a JSON object with the phrases and their counts.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'repetitions': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['repetitions'], 'additionalProperties': False}}}}
-
-MeetingAgendaGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateMeetingAgenda', 'description': 'Creates a structured meeting agenda with relevant points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'agenda': {'type': 'string'}}, 'required': ['agenda'], 'additionalProperties': False}}}}
-
-MentionExtraction = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractUserMentions', 'description': 'Extract user mentions from text (e.g. @username).', 'strict': True, 'parameters': {'type': 'object', 'properties': {'mentions': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['mentions'], 'additionalProperties': False}}}}
-
-MonologueForVillain = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DramaticVillainMonologue', 'description': 'Generates a dramatic monologue for a villain character.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'villain_monologue': {'type': 'string'}}, 'required': ['villain_monologue'], 'additionalProperties': False}}}}
-
-MultiAuthorTextAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"AnalyzeSegmentStyleFeatures","description":"Analyze style features to see how each segment might differ by author and return the analysis in a structured format.","strict":true,"parameters":{"type":"object","properties":{"segment_analysis":{"type":"object","additionalProperties":{"type":"object","properties":{"vocab_richness":{"type":"number"},"sentence_length":{"type":"number"},"usage_of_adjectives":{"type":"number"}},"required":["vocab_richness","sentence_length","usage_of_adjectives"]}}}},"required":["segment_analysis"],"additionalProperties":false}}'}}
-
-MultiContextFusionAnswer = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FuseContexts', 'description': 'Fuses multiple contexts into one comprehensive answer.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'fusion_answer': {'type': 'string'}}, 'required': ['fusion_answer'], 'additionalProperties': False}}}}
-
-MultiDocReference = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DocumentAnswerMapper', 'description': 'Attempts to answer questions based on multiple documents and returns a mapping of each document to its corresponding answer.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'mapping': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'required': ['mapping'], 'additionalProperties': False}}}}
-
-MultiDocumentTopicModeling = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DiscoverTopics', 'description': 'Discover main topics across multiple documents and return their indices.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'topics': {'type': 'object', 'additionalProperties': {'type': 'array', 'items': {'type': 'integer'}}}}, 'required': ['topics'], 'additionalProperties': False}}}}
-
-MultiLabelTopicDetection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractTopics', 'description': 'Return multiple possible topics from a set of potential labels.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'topics': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['topics'], 'additionalProperties': False}}}}
-
-MultiLanguageSummary = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ProvideShortSummaries', 'description': 'Generate short summaries in multiple languages.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'summaries': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'required': ['summaries'], 'additionalProperties': False}}}}
-
-MultiParagraphSummary = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeDocument', 'description': 'Summarize the original document into a specified number of paragraphs.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'paragraphs': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['paragraphs'], 'additionalProperties': False}}}}
-
-MultiPartQuestionAnswering = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AnswerMultipleQuestions', 'description': 'Answer multiple related questions from a single block of context.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answers': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['answers'], 'additionalProperties': False}}}}
-
-MultiSectionSummary = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeDocumentSections', 'description': 'Break the document into sections and summarize each with given titles.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sections': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'required': ['sections'], 'additionalProperties': False}}}}
-
-MusicGenreClassification = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'PredictMusicGenre', 'description': 'Predict the music genre from a descriptive text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'music_genre': {'type': 'string'}}, 'required': ['music_genre'], 'additionalProperties': False}}}}
-
-NamedEntityPairExtraction = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractEntityPairs', 'description': 'Return pairs of named entities found in the text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'entity_pairs': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'string'}}}}, 'required': ['entity_pairs'], 'additionalProperties': False}}}}
-
-NestedQA = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SplitAndMergeSections', 'description': 'Splits a large document into sections, searches each section, merges partial answers, and returns a consolidated answer.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'answer': {'type': 'string'}}, 'required': ['answer'], 'additionalProperties': False}}}}
-
-NextStepsFollowupAfterMeeting = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftPostMeetingFollowUp', 'description': 'Draft a post-meeting follow-up with next steps and owners.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'followup': {'type': 'string'}}, 'required': ['followup'], 'additionalProperties': False}}}}
-
-NGramFrequency = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FindNGramFrequencies', 'description': 'Find frequencies of n-grams in a text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'ngrams': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['ngrams'], 'additionalProperties': False}}}}
-
-NumericAnswerExtractor = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ParseNumericAnswer', 'description': 'Parses a numeric answer from the data and returns it as a number.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'value': {'type': 'number'}}, 'required': ['value'], 'additionalProperties': False}}}}
-
-ParagraphReduction = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CondenseParagraph', 'description': 'Condense the paragraph by a given reduction factor.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reduced_paragraph': {'type': 'string'}}, 'required': ['reduced_paragraph'], 'additionalProperties': False}}}}
-
-ParseContactInfo = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractContactInfo', 'description': 'Extract phone, email, and address from textual data.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'contact': {'type': 'object', 'properties': {'phone': {'type': 'string'}, 'email': {'type': 'string'}, 'address': {'type': 'string'}}, 'required': ['phone', 'email', 'address']}}, 'required': ['contact'], 'additionalProperties': False}}}}
-
-ParseLogEntriesToFields = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SplitLogLines', 'description': 'Splits log lines into structured fields such as date, severity, and message.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'logs': [{'type': 'object', 'properties': {'date': {'type': 'string'}, 'severity': {'type': 'string', 'enum': ['INFO', 'WARNING', 'ERROR', 'DEBUG']}, 'message': {'type': 'string'}}, 'required': ['date', 'severity', 'message']}]}, 'required': ['logs']}}}}
-
-ParseMathExpressions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractMathFormulas', 'description': 'Extract mathematical formulas from the provided text and return them in an array.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'expressions': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['expressions'], 'additionalProperties': False}}}}
-
-ParseMLACitation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractMLACitationInfo', 'description': 'Extract authors, title, and publication information from an MLA citation.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'citation': {'type': 'object', 'properties': {'authors': {'type': 'string'}, 'title': {'type': 'string'}, 'publication_info': {'type': 'string'}}, 'required': ['authors', 'title', 'publication_info']}}, 'required': ['citation'], 'additionalProperties': False}}}}
-
-ParseMusicPlaylistDescription = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractTracksFromPlaylist', 'description': 'Extracts track names or artists from a given playlist text and returns them in an array.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'tracks': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['tracks'], 'additionalProperties': False}}}}
-
-ParseRecipeInstructions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractRecipeDetails', 'description': 'Extract ingredients and steps from a recipe text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'ingredients': {'type': 'array', 'items': {'type': 'string'}}, 'steps': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['ingredients', 'steps'], 'additionalProperties': False}}}}
-
-ParseRSSFeedItem = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractRssItem', 'description': 'Extracts headline, link, and date from an RSS feed snippet.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'rss_item': {'type': 'object', 'properties': {'headline': {'type': 'string'}, 'link': {'type': 'string'}, 'date': {'type': 'string'}}, 'required': ['headline', 'link', 'date']}}, 'required': ['rss_item'], 'additionalProperties': False}}}}
-
-PerformanceReviewInsight = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyComplimentsCriticisms', 'description': 'Identifies recurring compliments and criticisms from performance reviews.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'compliments': {'type': 'array', 'items': {'type': 'string'}}, 'criticisms': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['compliments', 'criticisms'], 'additionalProperties': False}}}}
-
-PersonalizedFollowupEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FollowUpEmail', 'description': 'Generates a follow-up email referencing a previous conversation or event.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'followup_email': {'type': 'string'}}, 'required': ['followup_email'], 'additionalProperties': False}}}}
-
-PhilippicOrConstructiveCriticism = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LabelCritique', 'description': "Labels a critique as either 'harsh' or 'constructive'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'critique_type': {'type': 'string', 'enum': ['harsh', 'constructive']}}, 'required': ['critique_type'], 'additionalProperties': False}}}}
-
-PhoneNumbersFromLogs = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractPhoneNumbers', 'description': 'Extract phone numbers from logs.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'phone_numbers': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['phone_numbers'], 'additionalProperties': False}}}}
-
-PirateStyleTranslation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteToPirate', 'description': "Rewrite text with pirate expressions including 'Ahoy' and 'Matey'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'pirate_text': {'type': 'string'}}, 'required': ['pirate_text'], 'additionalProperties': False}}}}
-
-PolicyManualAnswer = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConsultPolicy', 'description': 'Consult policy text to produce a relevant answer.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'policy_answer': {'type': 'string'}}, 'required': ['policy_answer'], 'additionalProperties': False}}}}
-
-PoliteMeetingRescheduleEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RescheduleMeetingEmailGenerator', 'description': 'Generates an email request to reschedule a meeting with a brief explanation.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reschedule_email': {'type': 'string'}}, 'required': ['reschedule_email'], 'additionalProperties': False}}}}
-
-PositivityVsNegativityTrend = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name": "CalculatePositivityRatio", "description": "Calculates the positivity ratio for each item and tracks it over time.", "strict": true, "parameters": {"type": "object", "properties": {"trend": {"type": "array", "items": {"type": "object", "properties": {"index": {"type": "integer"}, "ratio": {"type": "number"}}, "required": ["index", "ratio"]}}}}, "required": ["trend"], "additionalProperties": false}}'}}
-
-PrioritizeCustomerQueries = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortUserQueries', 'description': 'Order user queries from highest to lowest priority.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sorted_queries': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sorted_queries'], 'additionalProperties': False}}}}
-
-ProductReturnApprovalEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ApproveProductReturn', 'description': 'Generates a formal notice approving a product return.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'return_approval': {'type': 'string'}}, 'required': ['return_approval'], 'additionalProperties': False}}}}
-
-ProductReviewSatisfactionLevel = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifyCustomerSatisfaction', 'description': 'Classifies customer satisfaction as low, medium, or high.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'satisfaction': {'type': 'string', 'enum': ['low', 'medium', 'high']}}, 'required': ['satisfaction'], 'additionalProperties': False}}}}
-
-ProfanityFilter = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'FlagStrongProfanity', 'description': 'Identifies whether the given text contains strong profanity and returns a flag.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'contains_profanity': {'type': 'boolean'}}, 'required': ['contains_profanity'], 'additionalProperties': False}}}}
-
-ProgressiveToneAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TrackToneChange', 'description': 'Tracks how tone changes from one text to the next and returns a progression of tones.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'tone_progression': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['tone_progression'], 'additionalProperties': False}}}}
-
-ProjectKickoffEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'announceProject', 'description': 'Announce a new project with immediate action items.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'kickoff_email': {'type': 'string'}}, 'required': ['kickoff_email'], 'additionalProperties': False}}}}
-
-PuzzleRiddleGenerator = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CreateRiddle', 'description': 'Generates a riddle or puzzle based on a specified topic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'riddle': {'type': 'string'}}, 'required': ['riddle'], 'additionalProperties': False}}}}
-
-RankBestAnswers = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ScoreCandidateAnswers', 'description': "Scores candidate answers' relevance and returns a list of answers with their corresponding scores.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'ranked_answers': {'type': 'array', 'items': {'type': 'array', 'items': {'type': 'string'}}}}, 'required': ['ranked_answers'], 'additionalProperties': False}}}}
-
-ReadingLevelEstimation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'EstimateReadingLevel', 'description': 'Estimates the reading level based on word complexity.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reading_level': {'type': 'string'}}, 'required': ['reading_level'], 'additionalProperties': False}}}}
-
-ReorderSupportTickets = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortTicketsBySeverity', 'description': 'Sorts tickets based on policy for severity and returns a sorted list of tickets.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sorted_tickets': {'type': 'array', 'items': {'type': 'object', 'properties': {'ticket_id': {'type': 'string'}, 'severity': {'type': 'string', 'enum': ['low', 'medium', 'high', 'critical']}, 'description': {'type': 'string'}}, 'required': ['ticket_id', 'severity', 'description']}}}, 'required': ['sorted_tickets'], 'additionalProperties': False}}}}
-
-RepeatedQuestionDetection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ListRepeatedQuestions', 'description': 'Identifies and lists any repeated questions found in the provided text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'repeated_questions': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['repeated_questions'], 'additionalProperties': False}}}}
-
-ReRankAppNotifications = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortNotifications', 'description': 'Sort notifications so the user sees the most critical first.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'notifications': {'type': 'array', 'items': {'type': 'object', 'properties': {'id': {'type': 'string'}, 'message': {'type': 'string'}, 'priority': {'type': 'string', 'enum': ['high', 'medium', 'low']}}, 'required': ['id', 'message', 'priority']}}}, 'required': ['notifications'], 'additionalProperties': False}}}}
-
-ReRankContactMethods = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RankContactMethods', 'description': 'Order ways to contact a user by preference and effectiveness.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'ranked_methods': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['ranked_methods'], 'additionalProperties': False}}}}
-
-ReRankForumQuestions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortForumQuestionsByRelevance', 'description': 'Order forum questions by relevance to user interests.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sorted_questions': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['sorted_questions'], 'additionalProperties': False}}}}
-
-ReRankHelpArticles = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortHelpArticles', 'description': 'Sort help articles by relevance to a user’s query and return a new ordered list of articles.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'re_ranked': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['re_ranked'], 'additionalProperties': False}}}}
-
-ReRankProductSearchResults = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SortProductResults', 'description': 'Sort or reorder product results by query relevance.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sorted_results': {'type': 'array', 'items': {'type': 'object', 'properties': {'product_id': {'type': 'string'}, 'product_name': {'type': 'string'}, 'relevance_score': {'type': 'number'}}, 'required': ['product_id', 'product_name', 'relevance_score']}}}, 'required': ['sorted_results'], 'additionalProperties': False}}}}
-
-ResumeCoverLetterTemplate = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateCoverLetterSkeleton', 'description': 'Generates a skeleton for a job application cover letter.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'cover_letter': {'type': 'string'}}, 'required': ['cover_letter'], 'additionalProperties': False}}}}
-
-RetrieveDefinitionOfTerm = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LookupTermDefinition', 'description': 'Retrieve the definition of a specified term from a reference text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'definition': {'type': 'string'}}, 'required': ['definition'], 'additionalProperties': False}}}}
-
-RewordForPositiveTone = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AdjustToneToPositive', 'description': 'Adjusts the phrasing of the text to have a more positive or uplifting tone.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'positive_version': {'type': 'string'}}, 'required': ['positive_version'], 'additionalProperties': False}}}}
-
-RewriteAsDystopianIntro = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateDystopianIntro', 'description': 'Transforms text into a dystopian opening paragraph.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'dystopian_intro': {'type': 'string'}}, 'required': ['dystopian_intro'], 'additionalProperties': False}}}}
-
-RewriteAsEpicSaga = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExpandHeroicSaga', 'description': 'Expands a snippet into an epic heroic saga.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'epic_saga': {'type': 'string'}}, 'required': ['epic_saga'], 'additionalProperties': False}}}}
-
-RewriteAsIfSpokenByRobot = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AddRoboticSpeechPatterns', 'description': 'This function converts input text into mechanical, robotic speech patterns.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'robot_text': {'type': 'string'}}, 'required': ['robot_text'], 'additionalProperties': False}}}}
-
-RewriteAsPressRelease = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GeneratePressRelease', 'description': 'Produces a formal press release version of the provided text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'press_release': {'type': 'string'}}, 'required': ['press_release'], 'additionalProperties': False}}}}
-
-RewriteAsStory = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TransformToNarrative', 'description': 'Transforms the text into a short narrative featuring specific characters.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'story': {'type': 'string'}}, 'required': ['story'], 'additionalProperties': False}}}}
-
-RewriteForChildren = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AdaptTextForYoungerAudience', 'description': 'Adapts text to be more suitable for a younger reading audience by simplifying the language and structure.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'child_friendly': {'type': 'string'}}, 'required': ['child_friendly'], 'additionalProperties': False}}}}
-
-RewriteInBriefTextMessageForm = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CondenseParagraph', 'description': 'Condenses a paragraph into a short text message.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'text_message': {'type': 'string'}}, 'required': ['text_message'], 'additionalProperties': False}}}}
-
-RewriteInFormalTone = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteText', 'description': 'Rewrites the text in a more formal, academic style.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'formal_text': {'type': 'string'}}, 'required': ['formal_text'], 'additionalProperties': False}}}}
-
-RewriteInQnAFormat = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name": "TransformToQA", "description": "Transforms content into a list of Q&A pairs.", "strict": true, "parameters": {"type": "object", "properties": {"qa_pairs": {"type": "array", "items": {"type": "array", "items": [{"type": "string"}, {"type": "string"}]} }}}, "required": ["qa_pairs"], "additionalProperties": false}}'}}
-
-RewriteInShakespeareanEnglish = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TransformToShakespearean', 'description': 'Transforms text or a concept into a Shakespearean style.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'shakespearean_text': {'type': 'string'}}, 'required': ['shakespearean_text'], 'additionalProperties': False}}}}
-
-RewriteInThirdPerson = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertToThirdPerson', 'description': 'Converts first-person references in the text to third-person.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'third_person_text': {'type': 'string'}}, 'required': ['third_person_text'], 'additionalProperties': False}}}}
-
-RewriteIntoBlogIntroduction = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateBlogIntroduction', 'description': 'Turns a piece of text into a blog-style introduction paragraph.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'blog_intro': {'type': 'string'}}, 'required': ['blog_intro'], 'additionalProperties': False}}}}
-
-RewriteIntoSongChorus = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateChorus', 'description': 'Transform text into lyric chorus in a specified music genre.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'chorus': {'type': 'string'}}, 'required': ['chorus'], 'additionalProperties': False}}}}
-
-RewriteLegaleseInPlainLanguage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertLegaleseToPlainLanguage', 'description': 'Converts legal jargon into clear, plain-language statements.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'plain_language': {'type': 'string'}}, 'required': ['plain_language'], 'additionalProperties': False}}}}
-
-RewritePassiveToActive = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteToActiveVoice', 'description': 'Rewrites sentences to use active voice.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'active_voice_text': {'type': 'string'}}, 'required': ['active_voice_text'], 'additionalProperties': False}}}}
-
-RewriteSentencesAsBulletPoints = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertTextToBullets', 'description': 'Converts each sentence of the input text into a bullet point format.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullets': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullets'], 'additionalProperties': False}}}}
-
-RewriteToSchema = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ParseTextToSchema', 'description': 'Parses text input and maps data to the specified schema fields.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'schema': {'type': 'object', 'properties': {'field1': {'type': 'string'}, 'field2': {'type': 'string'}}, 'required': ['field1', 'field2']}}, 'required': ['schema'], 'additionalProperties': False}}}}
-
-RewriteWithAdditionalContext = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AugmentText', 'description': 'Insert extra contextual information into the original text seamlessly.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'augmented_text': {'type': 'string'}}, 'required': ['augmented_text'], 'additionalProperties': False}}}}
-
-RewriteWithSarcasticTone = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConvertToSarcastic', 'description': 'Converts neutral text into a sarcastic version.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'sarcastic_text': {'type': 'string'}}, 'required': ['sarcastic_text'], 'additionalProperties': False}}}}
-
-RomanceMiniPlotSetup = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftRomanticStory', 'description': 'Generates an outline of a romantic story with a key conflict.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'plot_outline': {'type': 'string'}}, 'required': ['plot_outline'], 'additionalProperties': False}}}}
-
-ScheduleUpdateNotification = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeScheduleChanges', 'description': 'This function summarizes schedule changes and notifies the relevant recipients.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'update_notification': {'type': 'string'}}, 'required': ['update_notification'], 'additionalProperties': False}}}}
-
-SeriousnessOfComplaint = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RankComplaintSeverity', 'description': "Ranks complaint severity from 'minor' to 'major'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'severity': {'type': 'string', 'enum': ['minor', 'moderate', 'major']}}, 'required': ['severity'], 'additionalProperties': False}}}}
-
-ShortAnswerCompletion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ShortAnswerFunction', 'description': 'Returns a concise answer in a specific format.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'short_answer': {'type': 'string'}}, 'required': ['short_answer'], 'additionalProperties': False}}}}
-
-ShortAnswerGradedEvaluation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GradeAnswer', 'description': 'Compares a provided answer to a correct answer and returns a grade.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'grade': {'type': 'string', 'enum': ['correct', 'partial', 'incorrect']}}, 'required': ['grade'], 'additionalProperties': False}}}}
-
-ShortDefinitionLookup = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GetGlossaryDefinition', 'description': 'Find a short definition from a glossary.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'definition': {'type': 'string'}}, 'required': ['definition'], 'additionalProperties': False}}}}
-
-ShortHaiku = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComposeHaiku', 'description': 'Compose a 17-syllable haiku on a given topic.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'haiku': {'type': 'string'}}, 'required': ['haiku'], 'additionalProperties': False}}}}
-
-ShortParagraphSynopsis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeParagraph', 'description': 'Creates a single-sentence summary of a larger paragraph.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'synopsis': {'type': 'string'}}, 'required': ['synopsis'], 'additionalProperties': False}}}}
-
-ShortStoryWriter = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateFictionalNarrative', 'description': 'Produces a short fictional narrative within a specified word limit.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'story': {'type': 'string'}}, 'required': ['story'], 'additionalProperties': False}}}}
-
-SimplifyForNonExperts = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RewriteTechnicalContent', 'description': 'Rewrite technical content in simple, plain language.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'simple_explanation': {'type': 'string'}}, 'required': ['simple_explanation'], 'additionalProperties': False}}}}
-
-SkillBasedRoutingHandler = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifySupportCase', 'description': 'Classify a support case to route it to the correct specialized agent.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'route_to': {'type': 'string'}}, 'required': ['route_to'], 'additionalProperties': False}}}}
-
-SkillLevelAssessment = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ClassifySkillLevel', 'description': "Classifies a person's skill level in a specific domain as 'beginner', 'intermediate', or 'expert'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'skill_level': {'type': 'string', 'enum': ['beginner', 'intermediate', 'expert']}}, 'required': ['skill_level'], 'additionalProperties': False}}}}
-
-SpeechForSpecialEvent = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftSpeech', 'description': 'Generates a brief speech for occasions such as weddings or graduations.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'speech': {'type': 'string'}}, 'required': ['speech'], 'additionalProperties': False}}}}
-
-SponsorRenewalRequestEmail = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'InviteSponsorRenewal', 'description': 'Invite a sponsor to renew their support for an event.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'renewal_request': {'type': 'string'}}, 'required': ['renewal_request'], 'additionalProperties': False}}}}
-
-StanceAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountTextsSentiment', 'description': 'Count how many texts are pro, against, or neutral on an issue.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'pro': {'type': 'integer'}, 'against': {'type': 'integer'}, 'neutral': {'type': 'integer'}}, 'required': ['pro', 'against', 'neutral'], 'additionalProperties': False}}}}
-
-StandardizeAddressFormat = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'StandardizeAddress', 'description': 'Maps a messy address block into a standardized format.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'address': {'type': 'object', 'properties': {'street': {'type': 'string'}, 'city': {'type': 'string'}, 'zip': {'type': 'string'}}, 'required': ['street', 'city', 'zip']}}, 'required': ['address']}}}}
-
-StepByStepSolution = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CategorizeReviews', 'description': 'Classifies product reviews into different categories such as positive, negative, mixed, or neutral.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'category': {'type': 'string', 'enum': ['positive', 'negative', 'mixed', 'neutral']}, 'confidence_score': {'type': 'number', 'description': 'Confidence score of the classification from 0 to 1.'}}, 'required': ['category', 'confidence_score'], 'additionalProperties': False}}}}
-
-StoryArcDetection = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyStoryArc', 'description': 'Identifies the exposition, climax, and resolution segments in a story and returns their positions in paragraphs.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'story_arc': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['story_arc'], 'additionalProperties': False}}}}
-
-StoryCohesionScore = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ScoreNarrativeCohesion', 'description': 'Scores how logically coherent a narrative is.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'cohesion_score': {'type': 'number'}}, 'required': ['cohesion_score'], 'additionalProperties': False}}}}
-
-StoryToFactSheet = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ExtractFactualData', 'description': 'Extract factual data from a narrative and place it into labeled fields in JSON.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'facts': {'type': 'object', 'properties': {'location': {'type': 'string'}, 'characters': {'type': 'string'}}, 'required': ['location', 'characters']}}, 'required': ['facts'], 'additionalProperties': False}}}}
-
-StructureForumPosts = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"ConvertForumTextToStructuredFields","description":"Convert forum text lines into structured fields such as title and author.","strict":true,"parameters":{"type":"object","properties":{"forumPosts":{"type":"array","items":{"type":"object","properties":{"title":{"type":"string"},"author":{"type":"string"}},"required":["title","author"]}}}},"required":["forumPosts"],"additionalProperties":false}}'}}
-
-StylizedMotivationalQuote = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComposeMotivationalQuote', 'description': 'Generates a motivational quote in a specified style or tone.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'quote': {'type': 'string'}}, 'required': ['quote'], 'additionalProperties': False}}}}
-
-SummarizeDialogue = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeTranscript', 'description': 'Summarizes a conversation or meeting transcript into its major points.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'dialogue_summary': {'type': 'string'}}, 'required': ['dialogue_summary'], 'additionalProperties': False}}}}
-
-SummarizeFeedbackTrends = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'AnalyzeFeedbackSentiment', 'description': 'Analyze overall sentiment and common themes in feedback.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'summary': {'type': 'string'}}, 'required': ['summary'], 'additionalProperties': False}}}}
-
-SummarizeText = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeDocument', 'description': 'Generate a concise summary of a long document in JSON format.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'summary': {'type': 'string'}}, 'required': ['summary'], 'additionalProperties': False}}}}
-
-SummaryToBulletList = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SplitSummaryIntoBulletPoints', 'description': 'Splits a summary into bullet points at sentence boundaries.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'bullet_points': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['bullet_points'], 'additionalProperties': False}}}}
-
-SummaryWithQuotes = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SummarizeTextWithQuotes', 'description': 'Summarizes the text while preserving some original quotes verbatim.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'summary': {'type': 'string'}}, 'required': ['summary'], 'additionalProperties': False}}}}
-
-TfIdfRanking = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CalculateTFIDF', 'description': 'Calculate TF-IDF scores for given terms.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'tfidf_scores': {'type': 'object', 'properties': {'term1': {'type': 'number'}, 'term2': {'type': 'number'}}, 'required': ['term1', 'term2'], 'additionalProperties': False}}, 'required': ['tfidf_scores'], 'additionalProperties': False}}}}
-
-ThematicSummary = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'GenerateThemeSummaries', 'description': 'Generate short summaries of each theme from a list of provided themes.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'theme1': {'type': 'string'}, 'theme2': {'type': 'string'}}, 'required': ['theme1', 'theme2'], 'additionalProperties': False}}}}
-
-TimelineEventClassifier = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'TagEventDescription', 'description': "Tags an event description into a timeline category such as 'political' or 'social'.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'event_category': {'type': 'string'}}, 'required': ['event_category'], 'additionalProperties': False}}}}
-
-TimelineOfEvents = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"ChronologicalEventOrganizer","description":"Identifies chronological references and places them in order, returning the ordered events as an array of objects.","strict":true,"parameters":{"type":"object","properties":{"events":{"type":"array","items":{"type":"object","properties":{"date":{"type":"string"},"description":{"type":"string"}},"required":["date","description"]}}}},"required":["events"],"additionalProperties":false}}'}}
-
-TopicModelingSnippet = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyTopics', 'description': 'Identify possible topics or themes in a snippet.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'topics': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['topics'], 'additionalProperties': False}}}}
-
-TopNWords = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'IdentifyFrequentWords', 'description': 'Identifies the N most frequent words in the provided text.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'top_words': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['top_words'], 'additionalProperties': False}}}}
-
-TrackPolarizingKeywords = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'CountKeywordOccurrences', 'description': 'Counts occurrences of loaded terms in a corpus.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'keyword_counts': {'type': 'object', 'additionalProperties': {'type': 'integer'}}}, 'required': ['keyword_counts'], 'additionalProperties': False}}}}
-
-TransformAppReviewsToJSON = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ParseAppReviews', 'description': 'Parse lines of app reviews into structured JSON format with review and rating.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'reviews': {'type': 'array', 'items': {'type': 'object', 'properties': {'review': {'type': 'string'}, 'rating': {'type': 'string'}}, 'required': ['review', 'rating']}}}, 'required': ['reviews'], 'additionalProperties': False}}}}
-
-TransformChatTranscriptToJSON = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'function_definition': '{"name":"CreateConversation","description":"Creates a conversation structure with speaker, message, and timestamp, returning a list of messages.","strict":true,"parameters":{"type":"object","properties":{"messages":{"type":"array","items":{"type":"object","properties":{"speaker":{"type":"string"},"message":{"type":"string"},"time":{"type":"string"}},"required":["speaker","message","time"]}}}},"required":["messages"],"additionalProperties":false}}'}}
-
-TransformHrDocToJSON = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ParseHRDocument', 'description': 'Parse an HR document and map each heading to a JSON key.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'hr_structure': {'type': 'object', 'additionalProperties': {'type': 'string'}}}, 'required': ['hr_structure'], 'additionalProperties': False}}}}
-
-TransformIntoCSV = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'convertToCSV', 'description': 'Converts a list of dictionaries to a CSV-formatted string.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'csv': {'type': 'string'}}, 'required': ['csv'], 'additionalProperties': False}}}}
-
-TransformParagraphsToList = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'SplitTextIntoParagraphs', 'description': 'Splits a block of text into paragraphs and returns them as an array.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'paragraphs': {'type': 'array', 'items': {'type': 'string'}}}, 'required': ['paragraphs'], 'additionalProperties': False}}}}
-
-TransformXMLToJSON = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ParseXMLToJSON', 'description': 'Parse XML data into an equivalent JSON structure.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'json_data': {'type': 'object'}}, 'required': ['json_data'], 'additionalProperties': False}}}}
-
-TriviaQuestionSolver = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ProvideTriviaAnswer', 'description': 'Provides a concise answer to a trivia question.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'trivia_answer': {'type': 'string'}}, 'required': ['trivia_answer'], 'additionalProperties': False}}}}
-
-UnifyMeasurementUnits = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'normalizeMeasurements', 'description': 'Scan for measurements and normalize them to a standard system.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'normalized_text': {'type': 'string'}}, 'required': ['normalized_text'], 'additionalProperties': False}}}}
-
-UnifyMultipleAnswers = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'MergeAnswers', 'description': 'Merges partial answers from different sources into a comprehensive unified answer.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'unified_answer': {'type': 'string'}}, 'required': ['unified_answer'], 'additionalProperties': False}}}}
-
-UserEscalationHandler = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DraftEscalationResponse', 'description': 'Draft a calm, solution-oriented response to a user escalation.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'escalation_response': {'type': 'string'}}, 'required': ['escalation_response'], 'additionalProperties': False}}}}
-
-UserFeedbackAutoReply = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ThankUserForFeedback', 'description': 'Generates a quick response thanking a user for their feedback', 'strict': True, 'parameters': {'type': 'object', 'properties': {'auto_reply': {'type': 'string'}}, 'required': ['auto_reply'], 'additionalProperties': False}}}}
-
-UserMoodAnalysis = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'LabelUserMood', 'description': "Labels a user's mood as excited, frustrated, etc.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'mood': {'type': 'string', 'enum': ['excited', 'frustrated', 'happy', 'sad', 'anxious', 'calm']}}, 'required': ['mood'], 'additionalProperties': False}}}}
-
-UserOnboardingInstructions = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'generateWelcomeMessage', 'description': 'Generates a step-by-step welcome message for a new user.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'onboarding_guide': {'type': 'string'}}, 'required': ['onboarding_guide'], 'additionalProperties': False}}}}
-
-VolunteerRecruitmentMessage = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'RecruitEventVolunteers', 'description': 'Draft a call-to-action asking for event volunteers.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'recruitment_email': {'type': 'string'}}, 'required': ['recruitment_email'], 'additionalProperties': False}}}}
-
-WorkshopInvitation = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ConstructWorkshopInvitation', 'description': 'Generates an invitation for a workshop including date, location, and RSVP details.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'invitation': {'type': 'string'}}, 'required': ['invitation'], 'additionalProperties': False}}}}
-
-WriteCongratulatoryNote = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'ComposeCongratsNote', 'description': 'Generates a short congratulatory note for someone reaching a milestone.', 'strict': True, 'parameters': {'type': 'object', 'properties': {'congrats_note': {'type': 'string'}}, 'required': ['congrats_note'], 'additionalProperties': False}}}}
-
-YesNoMaybeQuestion = {'skill_class': 'GeneralSkill', 'system_prompt': 'Exactly populate the provided function definition', 'function_definition': {'type': 'function', 'function': {'name': 'DecisionMaker', 'description': "Returns a decision of 'yes', 'no', or 'maybe' along with a short justification.", 'strict': True, 'parameters': {'type': 'object', 'properties': {'response': {'type': 'string', 'enum': ['yes', 'no', 'maybe']}, 'justification': {'type': 'string'}}, 'required': ['response', 'justification'], 'additionalProperties': False}}}}
-
-ConvertToGoogleQueries = {
-  "skill_class": "GeneralSkill",
-  "system_prompt": "Exactly populate the provided function definition",
-  "function_definition": {
-    "type": "function",
-    "function": {
-      "name": "ConvertToGoogleQueries",
-      "description": "Convert the given question into between 1 and n google queries to answer the given question.",
-      "strict": True,
-      "parameters": {
-        "type": "object",
-        "properties": {
-          "google_queries": {
-            "type": "array",
-            "items": {
-              "type": "string"
-            }
-          }
-        },
-        "required": [
-          "google_queries"
-        ],
-        "additionalProperties": False
-      }
-    }
-  }
-}
+"""
+Built-in skill definitions ("toolkit").
+
+Each skill is stored as definitions/<Name>.json and listed in index.json
+(name -> function name and description), so importing the toolkit reads no
+definitions at all. A definition is parsed, normalized and cached the first time
+it is requested:
+
+    from flashlearn.skills import toolkit
+    config = toolkit.get("ConvertToGoogleQueries")
+
+    # or, as before
+    from flashlearn.skills.toolkit import ConvertToGoogleQueries
+
+Regenerate index.json with generate_init.py after adding or editing definitions.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DEFINITIONS_DIR = os.path.join(_HERE, "definitions")
+_INDEX_PATH = os.path.join(_HERE, "index.json")
+
+# Helpers that live in the toolkit package but are not skill definitions.
+_HELPERS = {"SimpleGoogleSearch": ".simple_search"}
+
+
+@lru_cache(maxsize=None)
+def _index() -> Dict[str, Dict[str, str]]:
+    with open(_INDEX_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_skills() -> List[str]:
+    """
+    Returns the names of all toolkit skills.
+    """
+    return sorted(_index())
+
+
+def describe(name: str) -> str:
+    """
+    Returns the one-line description of a toolkit skill.
+    """
+    if name not in _index():
+        raise KeyError(f"Unknown toolkit skill: {name}")
+    return _index()[name]["description"]
+
+
+def search(query: str) -> List[str]:
+    """
+    Returns the names of skills whose name or description contains every word of
+    the query (case-insensitive).
+    """
+    words = query.lower().split()
+    return [
+        name for name, entry in sorted(_index().items())
+        if all(w in f"{name} {entry['function']} {entry['description']}".lower() for w in words)
+    ]
+
+
+@lru_cache(maxsize=None)
+def get(name: str) -> Dict[str, Any]:
+    """
+    Returns the skill config (skill_class, system_prompt, function_definition) for
+    a toolkit skill, ready for GeneralSkill.load_skill. Parsed definitions are
+    cached; treat the returned dict as read-only.
+    """
+    if name not in _index():
+        raise KeyError(f"Unknown toolkit skill: {name}")
+    with open(os.path.join(_DEFINITIONS_DIR, f"{name}.json"), "r", encoding="utf-8") as f:
+        return normalize_definition(json.load(f))
+
+
+def normalize_definition(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Brings a stored skill config into the standard tool shape:
+      {"type": "function", "function": {"name", "description", "strict", "parameters"}}
+
+    Some definitions were saved with the function serialized as a JSON string
+    ({"function_definition": "<json>"}), some with a stray trailing brace or with
+    "required"/"additionalProperties" placed next to "parameters" instead of inside
+    it; those are parsed and repaired.
+    """
+    function_def = config.get("function_definition")
+    if isinstance(function_def, dict) and isinstance(function_def.get("function_definition"), str):
+        function, _ = json.JSONDecoder().raw_decode(function_def["function_definition"].strip())
+        parameters = function.setdefault("parameters", {"type": "object", "properties": {}})
+        for key in ("required", "additionalProperties"):
+            if key in function:
+                parameters.setdefault(key, function.pop(key))
+        config = {**config, "function_definition": {"type": "function", "function": function}}
+    return config
+
+
+def __getattr__(name):
+    if name in _HELPERS:
+        from importlib import import_module
+        return getattr(import_module(_HELPERS[name], __name__), name)
+    if not name.startswith("_") and name in _index():
+        return get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_index()) | set(_HELPERS))
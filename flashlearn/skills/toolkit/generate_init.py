@@ -1,29 +1,44 @@
 import os
 import json
 
-
-def add_json_to_init(folder_path):
-    init_file_path = os.path.join(folder_path, "__init__.py")
-
-    with open(init_file_path, 'w', encoding='utf-8') as init_file:
-        init_file.write("# Auto-generated Python dictionaries from JSON files\n\n")
-
-        for filename in os.listdir(folder_path):
-            if filename.endswith(".json"):
-                json_path = os.path.join(folder_path, filename)
-                try:
-                    # Load JSON data
-                    with open(json_path, 'r', encoding='utf-8') as json_file:
-                        data = json.load(json_file)
-
-                    # Convert JSON file name to valid Python variable name
-                    variable_name = filename.replace(".json", "").replace("-", "_")
-
-                    # Write Python-friendly dictionary
-                    init_file.write(f"{variable_name} = {repr(data)}\n\n")
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Error processing {filename}: {e}")
-
-
-# Run the function in the current directory
-add_json_to_init(os.getcwd())
+from flashlearn.skills.toolkit import normalize_definition
+
+
+def build_index(folder_path):
+    """
+    Writes index.json (skill name -> function name and description) for every
+    definitions/<Name>.json file. The toolkit package reads only this index at
+    lookup time and loads individual definitions on demand.
+    """
+    definitions_path = os.path.join(folder_path, "definitions")
+    index = {}
+
+    for filename in sorted(os.listdir(definitions_path)):
+        if filename.endswith(".json"):
+            json_path = os.path.join(definitions_path, filename)
+            try:
+                # Load JSON data
+                with open(json_path, 'r', encoding='utf-8') as json_file:
+                    data = json.load(json_file)
+
+                function = normalize_definition(data)["function_definition"]["function"]
+
+                # Skill names must be valid Python identifiers for attribute access
+                skill_name = filename[:-len(".json")].replace("-", "_")
+                if skill_name != filename[:-len(".json")]:
+                    os.rename(json_path, os.path.join(definitions_path, f"{skill_name}.json"))
+
+                index[skill_name] = {
+                    "function": function.get("name", skill_name),
+                    "description": function.get("description", ""),
+                }
+            except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
+                print(f"Error processing {filename}: {e}")
+
+    with open(os.path.join(folder_path, "index.json"), 'w', encoding='utf-8') as index_file:
+        json.dump(index, index_file, indent=1, ensure_ascii=False)
+        index_file.write("\n")
+
+
+if __name__ == "__main__":
+    build_index(os.path.dirname(os.path.abspath(__file__)))
@@ -3,15 +3,43 @@ Initialize the 'utils' subpackage of FlashLearn.
 
 This file ensures 'utils' is recognized as a subpackage.
 You can expose utility classes/functions here if needed.
+
+Attributes are imported on first access (PEP 562), so importing
+flashlearn.utils does not pull in kagglehub, PIL or tiktoken.
 """
 
-# Example of importing utility modules or classes:
-from .demo_data import imdb_reviews_50k, cats_and_dogs
-from .logging_utils import setup_logger
-from .token_utils import count_tokens_for_tasks
+import importlib
+
+# Exported name -> submodule that defines it.
+_EXPORTS = {
+    'imdb_reviews_50k': '.demo_data',
+    'cats_and_dogs': '.demo_data',
+    'load_csv_sample': '.csv_loader',
+    'reservoir_sample': '.csv_loader',
+    'chunk_text': '.chunking',
+    'iter_file_chunks': '.chunking',
+    'flatten_result': '.join',
+    'join_results': '.join',
+    'write_jsonl': '.join',
+    'sample_rows': '.sampling',
+    'setup_logger': '.logging_utils',
+    'MediaRef': '.media',
+    'encode_image': '.image_pipeline',
+    'iter_encoded_images': '.image_pipeline',
+    'count_tokens_for_tasks': '.token_utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    'imdb_reviews_50k', 'cats_and_dogs',
-    'setup_logger',
-    'count_tokens_for_tasks',
-]
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
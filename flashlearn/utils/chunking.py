@@ -0,0 +1,216 @@
+import codecs
+import mmap
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flashlearn.utils.token_utils import get_token_counter
+
+# A paragraph break, or whitespace after sentence-ending punctuation.
+_BOUNDARY = re.compile(r"\n\s*\n|(?<=[.!?。])[\"')\]]*\s+")
+
+# (offset, text, tokens) of a sentence/paragraph, or of a piece of one.
+Unit = Tuple[int, str, int]
+
+
+def split_units(text: str) -> Iterator[tuple]:
+    """
+    Yields (offset, unit) for the sentences/paragraphs of text. Units keep their
+    trailing whitespace, so joining them gives back the original text.
+    """
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        end = match.end()
+        if end > start:
+            yield start, text[start:end]
+            start = end
+    if start < len(text):
+        yield start, text[start:]
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int = 512,
+    token_counter: Optional[Callable[[str], int]] = None,
+    overlap_tokens: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Splits text into chunks of at most max_tokens tokens, cutting at paragraph
+    and sentence boundaries (a sentence longer than max_tokens is cut between
+    words, or inside a word only as a last resort).
+
+    :param token_counter: Counts tokens of a string (default: tiktoken cl100k_base).
+    :param overlap_tokens: Repeat up to this many tokens of trailing sentences
+                           from one chunk at the start of the next.
+    :return: Rows {"text", "offset", "tokens"}; offset is the chunk's character
+             offset in text. Rows can be passed to create_tasks directly.
+    """
+    count = token_counter or get_token_counter()
+    units = (
+        piece
+        for offset, unit in split_units(text)
+        for piece in _fit(offset, unit, count(unit), max_tokens, count)
+    )
+    return list(_pack(units, max_tokens, overlap_tokens))
+
+
+def iter_file_chunks(
+    path: str,
+    max_tokens: int = 512,
+    overlap_tokens: int = 0,
+    encoding: Any = None,
+    encoding_name: str = "cl100k_base",
+    batch_size: int = 1024,
+    window_bytes: int = 1 << 20,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streams token-bounded chunks from a UTF-8 text file of any size.
+
+    The file is memory-mapped and decoded window by window; sentences are
+    token-counted in batches (encode_ordinary_batch, multithreaded in tiktoken),
+    so memory stays at about one window plus one batch regardless of file size.
+    Chunk boundaries follow the same rules as chunk_text.
+
+    :param encoding: A tiktoken-like encoding (encode_ordinary_batch or encode);
+                     defaults to tiktoken.get_encoding(encoding_name).
+    :param batch_size: Sentences per encoding batch.
+    :param window_bytes: Bytes decoded from the mapped file at a time.
+    :return: Rows {"text", "offset", "tokens"}; offset is the chunk's byte
+             offset in the file.
+    """
+    if encoding is None:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+    count = _encoding_counter(encoding)
+    units = _batch_counted(_iter_file_units(path, window_bytes), encoding, batch_size)
+    fitted = (
+        piece
+        for offset, unit, tokens in units
+        for piece in _fit(offset, unit, tokens, max_tokens, count, byte_offsets=True)
+    )
+    yield from _pack(fitted, max_tokens, overlap_tokens)
+
+
+def _encoding_counter(encoding: Any) -> Callable[[str], int]:
+    encode = getattr(encoding, "encode_ordinary", None) or encoding.encode
+    return lambda text: len(encode(text))
+
+
+def _iter_file_units(path: str, window_bytes: int) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (byte offset, unit) for the sentences/paragraphs of a file. The last
+    unit of each window is held back until the next window completes it (or
+    until it grows past window_bytes characters without a boundary).
+    """
+    if os.path.getsize(path) == 0:
+        return
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        carry, carry_offset = "", 0
+        for start in range(0, len(mm), window_bytes):
+            final = start + window_bytes >= len(mm)
+            buffer = carry + decoder.decode(mm[start:start + window_bytes], final=final)
+            units = list(split_units(buffer))
+            if not units:
+                continue
+            if not final and len(units[-1][1]) <= window_bytes:
+                *units, (_, carry) = units
+            else:
+                carry = ""
+            offset = carry_offset
+            for _, unit in units:
+                yield offset, unit
+                offset += len(unit.encode("utf-8"))
+            carry_offset = offset
+
+
+def _batch_counted(units: Iterable[Tuple[int, str]], encoding: Any, batch_size: int) -> Iterator[Unit]:
+    """
+    Adds token counts to (offset, unit) pairs, encoding batch_size units at a time.
+    """
+    encode_batch = getattr(encoding, "encode_ordinary_batch", None)
+    count = _encoding_counter(encoding)
+    batch: List[Tuple[int, str]] = []
+
+    def flush():
+        texts = [text for _, text in batch]
+        lengths = [len(t) for t in encode_batch(texts)] if encode_batch else [count(t) for t in texts]
+        for (offset, text), tokens in zip(batch, lengths):
+            yield offset, text, tokens
+        batch.clear()
+
+    for unit in units:
+        batch.append(unit)
+        if len(batch) >= batch_size:
+            yield from flush()
+    if batch:
+        yield from flush()
+
+
+def _fit(
+    offset: int,
+    unit: str,
+    tokens: int,
+    max_tokens: int,
+    count: Callable[[str], int],
+    byte_offsets: bool = False,
+) -> Iterator[Unit]:
+    """
+    Yields (offset, piece, tokens) pieces of unit that each fit max_tokens.
+    """
+    if tokens <= max_tokens:
+        yield offset, unit, tokens
+        return
+
+    def size(text):
+        return len(text.encode("utf-8")) if byte_offsets else len(text)
+
+    words = re.findall(r"\s*\S+\s*", unit) or [unit]
+    if len(words) == 1:
+        # One huge "word": cut by characters in proportion to the token count
+        step = max(1, len(unit) * max_tokens // tokens)
+        for i in range(0, len(unit), step):
+            piece = unit[i:i + step]
+            yield offset, piece, count(piece)
+            offset += size(piece)
+        return
+    piece, piece_offset = "", offset
+    for word in words:
+        if piece and count(piece + word) > max_tokens:
+            yield from _fit(piece_offset, piece, count(piece), max_tokens, count, byte_offsets)
+            piece_offset += size(piece)
+            piece = ""
+        piece += word
+    if piece:
+        yield from _fit(piece_offset, piece, count(piece), max_tokens, count, byte_offsets)
+
+
+def _pack(units: Iterable[Unit], max_tokens: int, overlap_tokens: int) -> Iterator[Dict[str, Any]]:
+    """
+    Greedily packs units into chunks of at most max_tokens (the sum of unit
+    counts), starting each chunk with up to overlap_tokens of trailing units
+    from the previous one.
+    """
+    window: List[Unit] = []
+    used = 0
+
+    def chunk():
+        return {"text": "".join(u[1] for u in window), "offset": window[0][0], "tokens": used}
+
+    for unit in units:
+        tokens = unit[2]
+        if window and used + tokens > max_tokens:
+            yield chunk()
+            kept: List[Unit] = []
+            kept_tokens = 0
+            for prev in reversed(window if overlap_tokens > 0 else ()):
+                if kept_tokens + prev[2] > overlap_tokens or kept_tokens + prev[2] + tokens > max_tokens:
+                    break
+                kept.insert(0, prev)
+                kept_tokens += prev[2]
+            window, used = kept, kept_tokens
+        window.append(unit)
+        used += tokens
+    if window:
+        yield chunk()
@@ -0,0 +1,232 @@
+import contextlib
+import csv
+import json
+import logging
+import mmap
+import os
+import random
+import shutil
+import sys
+import tempfile
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+_CACHE_MAGIC = b"FLCOLS1\n"
+# Row offsets buffered per column before they are spooled to disk
+_OFFSETS_BATCH = 8192
+
+flash_logger = logging.getLogger("FlashLearn")
+
+
+def reservoir_sample(items: Iterable[Any], k: int, rng: Optional[random.Random] = None) -> List[Any]:
+    """
+    Returns k items sampled uniformly from an iterable of unknown length, in one
+    pass and O(k) memory (reservoir sampling, Algorithm R).
+    Returns all items if there are fewer than k.
+    """
+    rng = rng or random.Random()
+    reservoir: List[Any] = []
+    if k <= 0:
+        return reservoir
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = rng.randint(0, i)
+            if j < k:
+                reservoir[j] = item
+    return reservoir
+
+
+def iter_csv_rows(csv_path: str) -> Iterable[Dict[str, str]]:
+    """
+    Streams the rows of a CSV file (with header) as dicts.
+    """
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def write_columns_cache(columns: Dict[str, List[str]], cache_path: str) -> None:
+    """
+    Writes string columns to a compact binary file: a magic line, a JSON header
+    (column names, row count), then per column an array of little-endian uint64
+    row offsets followed by the UTF-8 encoded values back to back.
+    """
+    names = list(columns)
+    n_rows = len(columns[names[0]]) if names else 0
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_CACHE_MAGIC)
+        f.write(json.dumps({"columns": names, "rows": n_rows}).encode("utf-8") + b"\n")
+        for name in names:
+            encoded = [value.encode("utf-8") for value in columns[name]]
+            offsets = array("Q", [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            f.write(offsets.tobytes())
+            f.write(b"".join(encoded))
+    os.replace(tmp_path, cache_path)
+
+
+def build_columns_cache(csv_path: str, cache_path: str) -> None:
+    """
+    Writes the columns cache of a CSV file (same format as write_columns_cache)
+    in one streaming pass. Each column's offsets and values are spooled to
+    temporary files and concatenated at the end, so memory does not grow with
+    the file.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(csv_path, "r", encoding="utf-8", newline="") as f, contextlib.ExitStack() as stack:
+        reader = csv.DictReader(f)
+        names = list(reader.fieldnames or [])
+        offset_files = [stack.enter_context(tempfile.TemporaryFile()) for _ in names]
+        value_files = [stack.enter_context(tempfile.TemporaryFile()) for _ in names]
+        pending = [array("Q", [0]) for _ in names]
+        ends = [0] * len(names)
+
+        def flush(k):
+            if sys.byteorder != "little":
+                pending[k].byteswap()
+            offset_files[k].write(pending[k].tobytes())
+            pending[k] = array("Q")
+
+        n_rows = 0
+        for row in reader:
+            n_rows += 1
+            for k, name in enumerate(names):
+                value = (row.get(name) or "").encode("utf-8")
+                value_files[k].write(value)
+                ends[k] += len(value)
+                pending[k].append(ends[k])
+                if len(pending[k]) >= _OFFSETS_BATCH:
+                    flush(k)
+        for k in range(len(names)):
+            flush(k)
+
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(_CACHE_MAGIC)
+                out.write(json.dumps({"columns": names, "rows": n_rows}).encode("utf-8") + b"\n")
+                for offsets, values in zip(offset_files, value_files):
+                    for spool in (offsets, values):
+                        spool.seek(0)
+                        shutil.copyfileobj(spool, out)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class ColumnsCache:
+    """
+    Read-only view over a file written by write_columns_cache. The file is
+    memory-mapped and only the requested rows are decoded.
+    """
+
+    def __init__(self, cache_path: str):
+        with open(cache_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm.readline() != _CACHE_MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a columns cache: {cache_path}")
+        header = json.loads(self._mm.readline())
+        self.columns: List[str] = header["columns"]
+        self.rows: int = header["rows"]
+
+        # Per column: (offsets array, start of the value bytes).
+        self._layout = []
+        pos = self._mm.tell()
+        for _ in self.columns:
+            offsets = array("Q")
+            offsets.frombytes(self._mm[pos:pos + 8 * (self.rows + 1)])
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            pos += 8 * (self.rows + 1)
+            self._layout.append((offsets, pos))
+            pos += offsets[-1]
+
+    def row(self, index: int) -> Dict[str, str]:
+        row = {}
+        for name, (offsets, base) in zip(self.columns, self._layout):
+            start, end = base + offsets[index], base + offsets[index + 1]
+            row[name] = self._mm[start:end].decode("utf-8")
+        return row
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def read_columns_cache(cache_path: str, indices: Optional[Iterable[int]] = None) -> Optional[List[Dict[str, str]]]:
+    """
+    Returns the rows at the given indices (all rows if None) from a columns cache,
+    or None if the file is not a valid cache.
+    """
+    try:
+        cache = ColumnsCache(cache_path)
+    except (ValueError, json.JSONDecodeError):
+        return None
+    try:
+        return [cache.row(i) for i in (range(cache.rows) if indices is None else indices)]
+    finally:
+        cache.close()
+
+
+def load_csv_sample(
+        csv_path: str,
+        sample: int = 100,
+        full: bool = False,
+        seed: Optional[int] = None,
+        use_cache: bool = True,
+        cache_path: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """
+    Returns a random sample of rows (or all rows with full=True) from a CSV file.
+
+    With use_cache, the parsed file is stored next to the CSV in a binary columnar
+    cache (<csv_path>.columns) on the first call, built in one streaming pass;
+    later calls load the cache and only materialize the sampled rows. Without
+    the cache, or if it cannot be written (e.g. a read-only dataset directory),
+    the CSV is streamed once with reservoir sampling in O(sample) memory.
+
+    :param csv_path: Path to a CSV file with a header row.
+    :param sample: Number of rows to return.
+    :param full: Return every row, in file order.
+    :param seed: Seed for a reproducible sample.
+    :param use_cache: Read/write the columnar cache.
+    :param cache_path: Override the cache location.
+    """
+    rng = random.Random(seed)
+
+    if not use_cache:
+        if full:
+            return list(iter_csv_rows(csv_path))
+        rows = reservoir_sample(iter_csv_rows(csv_path), sample, rng)
+        rng.shuffle(rows)
+        return rows
+
+    cache_path = cache_path or f"{csv_path}.columns"
+    if not (os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)):
+        try:
+            build_columns_cache(csv_path, cache_path)
+        except OSError as e:
+            if not os.path.exists(csv_path):
+                raise
+            flash_logger.warning(f"Could not write the columns cache {cache_path} ({e}); sampling without it.")
+            return load_csv_sample(csv_path, sample, full, seed, use_cache=False)
+
+    try:
+        cache = ColumnsCache(cache_path)
+    except (ValueError, json.JSONDecodeError):
+        os.remove(cache_path)
+        return load_csv_sample(csv_path, sample, full, seed, use_cache, cache_path)
+    try:
+        if full:
+            indices = range(cache.rows)
+        else:
+            indices = rng.sample(range(cache.rows), min(sample, cache.rows))
+        return [cache.row(i) for i in indices]
+    finally:
+        cache.close()
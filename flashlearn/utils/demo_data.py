@@ -1,11 +1,10 @@
 import os
 import random
 import base64
-import csv
 from io import BytesIO
 
-import kagglehub
-from PIL import Image
+from .csv_loader import load_csv_sample
+from .image_pipeline import iter_encoded_images
 
 
 def encode_image_to_base64(image_path: str) -> str:
@@ -14,13 +13,23 @@ def encode_image_to_base64(image_path: str) -> str:
     :param image_path: File path of the image
     :return: Base64 encoded string of the image
     """
+    from PIL import Image
+
     with Image.open(image_path) as img:
         buffered = BytesIO()
         img.save(buffered, format="JPEG")
         return base64.b64encode(buffered.getvalue()).decode("utf-8")
 
 
-def cats_and_dogs(sample: int = 100, train_ratio: float = 0.5):
+def cats_and_dogs(
+        sample: int = 100,
+        train_ratio: float = 0.5,
+        as_paths: bool = False,
+        max_edge: int = None,
+        quality: int = 75,
+        workers: int = None,
+        cache_dir: str = None,
+):
     """
     Returns two lists of dictionaries (train_data, test_data) with base64-encoded
     images of cats and dogs. Each dictionary has:
@@ -30,10 +39,21 @@ def cats_and_dogs(sample: int = 100, train_ratio: float = 0.5):
       }
     The first list is the 'train' portion, and the second is 'test'.
 
+    With as_paths=True, rows hold {"image_path": <file path>, "label": ...}
+    instead; use column_modalities={"image_path": "image_path"} so images are
+    only encoded when each request is sent.
+
     :param sample: Total number of images to sample from the dataset.
     :param train_ratio: Fraction of data to put in the training set.
+    :param as_paths: Return file paths instead of base64 strings.
+    :param max_edge: Downscale images so the longest edge is at most this (None = full size).
+    :param quality: JPEG quality used when recompressing.
+    :param workers: Encoding processes (default: all cores); see iter_encoded_images.
+    :param cache_dir: Optional content-hash cache directory for encoded images.
     :return: (train_data, test_data)
     """
+    import kagglehub
+
     # Download and locate the dataset
     path = kagglehub.dataset_download("samuelcortinhas/cats-and-dogs-image-classification")
     cats_dir = os.path.join(path, "train", "cats")
@@ -50,51 +70,48 @@ def cats_and_dogs(sample: int = 100, train_ratio: float = 0.5):
     cat_sample = random.sample(cat_images, half_sample)
     dog_sample = random.sample(dog_images, half_sample)
 
-    # Encode images and build list of dicts
-    data = []
-    for img_path in cat_sample:
-        encoded_image = encode_image_to_base64(img_path)
-        data.append({"image_base64": encoded_image, "label": 0})
-    for img_path in dog_sample:
-        encoded_image = encode_image_to_base64(img_path)
-        data.append({"image_base64": encoded_image, "label": 1})
-
-    return data
-
-
-def imdb_reviews_50k(sample: int = 100, full=False):
+    if as_paths:
+        return ([{"image_path": p, "label": 0} for p in cat_sample]
+                + [{"image_path": p, "label": 1} for p in dog_sample])
+
+    # Encode images in parallel and build list of dicts
+    labels = [0] * len(cat_sample) + [1] * len(dog_sample)
+    encoded = iter_encoded_images(
+        cat_sample + dog_sample,
+        max_edge=max_edge,
+        quality=quality,
+        workers=workers,
+        cache_dir=cache_dir,
+    )
+    return [
+        {"image_base64": encoded_image, "label": label}
+        for (_, encoded_image), label in zip(encoded, labels)
+    ]
+
+
+def imdb_reviews_50k(sample: int = 100, full=False, seed: int = None, use_cache: bool = True):
     """
-    Returns IMDb reviews as two lists of dicts (train_data, test_data).
+    Returns IMDb reviews as a list of dicts.
     Each dict has:
       {
         "review": <the text>,
         "sentiment": <"positive" or "negative">
       }
 
-    The first list is the 'train' portion (10% by default),
-    the second list is the 'test' portion.
+    The parsed CSV is cached in a binary columnar file next to the kagglehub
+    download, so repeated calls only decode the sampled rows. With
+    use_cache=False the CSV is streamed once with reservoir sampling instead.
 
     :param sample: Number of total samples to extract from the dataset.
-    :return: (train_data, test_data)
+    :param full: Return the whole dataset in file order.
+    :param seed: Seed for a reproducible sample.
+    :param use_cache: Read/write the columnar cache (see load_csv_sample).
+    :return: List of review dicts
     """
-    # Download and load the IMDb dataset (CSV)
+    import kagglehub
+
+    # Download and locate the IMDb dataset (CSV)
     dataset_path = kagglehub.dataset_download("lakshmi25npathi/imdb-dataset-of-50k-movie-reviews")
     csv_path = os.path.join(dataset_path, "IMDB Dataset.csv")
 
-    # Read CSV as list of dicts
-    all_rows = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)  # fieldnames from header: "review","sentiment"
-        for row in reader:
-            # row is {"review": ..., "sentiment": ...}
-            all_rows.append(row)
-
-    if not full:
-        # Sample a random subset if needed
-        if sample < len(all_rows):
-            all_rows = random.sample(all_rows, sample)
-
-        # Shuffle the data
-        random.shuffle(all_rows)
-
-    return all_rows
\ No newline at end of file
+    return load_csv_sample(csv_path, sample=sample, full=full, seed=seed, use_cache=use_cache)
@@ -0,0 +1,115 @@
+import base64
+import hashlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+def encode_image(image_bytes: bytes, max_edge: Optional[int] = 768, quality: int = 85) -> str:
+    """
+    Decodes an image, downscales it so its longest edge is at most max_edge
+    (None keeps the original size), recompresses it as JPEG and returns base64.
+    """
+    from PIL import Image
+
+    with Image.open(BytesIO(image_bytes)) as img:
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        if max_edge and max(img.size) > max_edge:
+            img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        buffered = BytesIO()
+        img.save(buffered, format="JPEG", quality=quality)
+        return base64.b64encode(buffered.getvalue()).decode("utf-8")
+
+
+def _encode_batch(
+        paths: List[str],
+        max_edge: Optional[int],
+        quality: int,
+        cache_dir: Optional[str]
+) -> List[str]:
+    """
+    Worker entry point: encodes a batch of image files, using the disk cache
+    (keyed by a hash of the file content and encoding settings) when given.
+    """
+    encoded = []
+    for path in paths:
+        with open(path, "rb") as f:
+            image_bytes = f.read()
+
+        cache_path = None
+        if cache_dir:
+            key = hashlib.sha256(image_bytes)
+            key.update(f"|{max_edge}|{quality}".encode("utf-8"))
+            cache_path = os.path.join(cache_dir, key.hexdigest() + ".b64")
+            if os.path.exists(cache_path):
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    encoded.append(f.read())
+                continue
+
+        data = encode_image(image_bytes, max_edge=max_edge, quality=quality)
+        if cache_path:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        encoded.append(data)
+    return encoded
+
+
+def iter_encoded_images(
+        paths: Iterable[str],
+        max_edge: Optional[int] = 768,
+        quality: int = 85,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        batch_size: int = 8,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Streams (path, base64_jpeg) pairs for the given image files, in input order.
+
+    Decoding, downscaling and JPEG recompression run on a process pool, with at
+    most a few batches per worker in flight, so memory stays bounded no matter
+    how many paths are passed. With cache_dir set, results are cached on disk by
+    content hash and repeated runs skip re-encoding.
+
+    :param paths: Image file paths (any iterable, consumed lazily).
+    :param max_edge: Downscale so the longest edge is at most this (None = keep size).
+    :param quality: JPEG quality (1-95).
+    :param workers: Pool size (default: os.cpu_count()); 0 or 1 encodes in-process.
+    :param cache_dir: Optional directory for the content-hash cache.
+    :param batch_size: Paths per worker submission.
+    """
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def batches():
+        batch = []
+        for path in paths:
+            batch.append(str(path))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    if workers <= 1:
+        for batch in batches():
+            yield from zip(batch, _encode_batch(batch, max_edge, quality, cache_dir))
+        return
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in batches():
+            pending.append((batch, pool.submit(_encode_batch, batch, max_edge, quality, cache_dir)))
+            if len(pending) >= max_pending:
+                done_batch, future = pending.popleft()
+                yield from zip(done_batch, future.result())
+        while pending:
+            done_batch, future = pending.popleft()
+            yield from zip(done_batch, future.result())
@@ -0,0 +1,118 @@
+import json
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, Optional, Tuple, Union
+
+
+def flatten_result(result: Any, prefix: str = "", sep: str = ".") -> Dict[str, Any]:
+    """
+    Turns a result into flat output columns:
+      {"categories": "pos", "meta": {"score": 1}} -> {"categories": "pos", "meta.score": 1}
+    Lists are kept as values. Non-dict results (e.g. "<ERROR>") become {"<prefix>error": result}.
+    """
+    if hasattr(result, "items") and not isinstance(result, dict):
+        result = dict(result.items())  # e.g. LazyArguments
+    if not isinstance(result, dict):
+        return {f"{prefix}error": result}
+
+    flat: Dict[str, Any] = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten_result(value, prefix=f"{name}{sep}", sep=sep))
+        else:
+            flat[name] = value
+    return flat
+
+
+def join_results(
+        rows: Iterable[Dict[str, Any]],
+        results: Iterable[Tuple[str, Any]],
+        row_id: Callable[[int, Dict[str, Any]], str] = lambda index, row: str(index),
+        buffer_size: int = 10000,
+        prefix: str = "",
+        flatten: bool = True,
+        has_task: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        skill: Any = None,
+        column_modalities: Dict[str, str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Joins a stream of (custom_id, result) pairs back onto the input rows and
+    yields enriched rows ({**row, **output fields}) in result-arrival order.
+
+    Input rows are read lazily, only as far as the newest result requires; rows
+    whose results have not arrived yet wait in a reorder buffer. Results come
+    back roughly in submission order (bounded by the orchestrator's queue
+    window), so memory stays at most buffer_size rows for any dataset size.
+    Rows that never get a result are emitted at the end with
+    "<prefix>error": "<MISSING>".
+
+    Rows without content get no task from create_tasks/iter_tasks, so no
+    result will ever arrive for them. Pass has_task (or the skill and the
+    column_modalities the tasks were built with) and such rows are emitted
+    as soon as they are read, with "<prefix>error": "<SKIPPED>", instead of
+    filling the buffer.
+
+    :param rows: The input rows, in the order their tasks were created.
+    :param results: (custom_id, result) pairs, e.g. skill.stream_tasks_in_parallel(tasks).
+    :param row_id: custom_id of a row; defaults to its index, as in create_tasks/iter_tasks.
+    :param buffer_size: Max rows held while waiting for their results.
+    :param prefix: Prefix for the output columns (e.g. "llm_").
+    :param flatten: Flatten nested result dicts into dotted columns; otherwise
+                    the result is stored under "<prefix>result".
+    :param has_task: Predicate telling whether a row produced a task.
+    :param skill: A data skill; has_task then checks skill.build_content_blocks.
+    :param column_modalities: As passed to create_tasks/iter_tasks (with skill).
+    :raises ValueError: If results run more than buffer_size rows ahead of
+                        the oldest pending row.
+    """
+    if has_task is None and skill is not None:
+        def has_task(row):
+            return bool(skill.build_content_blocks(row, column_modalities or {}))
+
+    rows_iter = enumerate(rows)
+    waiting: Dict[str, Dict[str, Any]] = {}
+
+    def enrich(row: Dict[str, Any], result: Any) -> Dict[str, Any]:
+        fields = flatten_result(result, prefix) if flatten else {f"{prefix}result": result}
+        return {**row, **fields}
+
+    for custom_id, result in results:
+        custom_id = str(custom_id)
+        while custom_id not in waiting:
+            try:
+                index, row = next(rows_iter)
+            except StopIteration:
+                break
+            if has_task is not None and not has_task(row):
+                yield enrich(row, "<SKIPPED>")
+                continue
+            waiting[row_id(index, row)] = row
+            if len(waiting) > buffer_size:
+                raise ValueError(
+                    f"join_results reorder buffer overflow: more than {buffer_size} rows are "
+                    "waiting for results. Increase buffer_size or check custom_ids match row_id."
+                )
+        row = waiting.pop(custom_id, None)
+        if row is not None:
+            yield enrich(row, result)
+
+    for row in waiting.values():
+        yield enrich(row, "<MISSING>")
+    for _, row in rows_iter:
+        skipped = has_task is not None and not has_task(row)
+        yield enrich(row, "<SKIPPED>" if skipped else "<MISSING>")
+
+
+def write_jsonl(rows: Iterable[Dict[str, Any]], sink: Union[str, IO[str]]) -> int:
+    """
+    Writes rows to a JSON Lines file (path or open text file) as they arrive.
+    Returns the number of rows written.
+    """
+    if isinstance(sink, str):
+        with open(sink, "w", encoding="utf-8") as f:
+            return write_jsonl(rows, f)
+
+    count = 0
+    for row in rows:
+        sink.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,107 @@
+import base64
+import mimetypes
+import os
+from typing import Any, Dict, List
+
+MEDIA_REF_TYPE = "media_ref"
+
+_AUDIO_FORMATS = {".wav": "wav", ".mp3": "mp3"}
+
+
+class MediaRef:
+    """
+    A lazy reference to an image or audio file.
+
+    Rows and tasks only carry the file path (as a small JSON-safe "media_ref"
+    content block); the file is read and base64-encoded by the orchestrator's
+    worker thread right before the request is sent, and the encoded buffer is
+    dropped as soon as the call returns.
+    """
+
+    __slots__ = ("path", "kind", "format")
+
+    def __init__(self, path: str, kind: str = "image", format: str = None):
+        if kind not in ("image", "audio"):
+            raise ValueError(f"Unsupported media kind: {kind}")
+        self.path = str(path)
+        self.kind = kind
+        self.format = format or _guess_format(self.path, kind)
+
+    def to_block(self) -> Dict[str, Any]:
+        """
+        Returns the placeholder content block stored in tasks.
+        """
+        return {
+            "type": MEDIA_REF_TYPE,
+            MEDIA_REF_TYPE: {"path": self.path, "kind": self.kind, "format": self.format}
+        }
+
+    @classmethod
+    def from_block(cls, block: Dict[str, Any]) -> "MediaRef":
+        ref = block[MEDIA_REF_TYPE]
+        return cls(ref["path"], ref.get("kind", "image"), ref.get("format"))
+
+    def encode(self) -> str:
+        """
+        Reads the file and returns its base64 encoding.
+        """
+        with open(self.path, "rb") as f:
+            return base64.b64encode(f.read()).decode("utf-8")
+
+    def resolve(self) -> Dict[str, Any]:
+        """
+        Returns the provider-ready content block with the encoded file.
+        """
+        if self.kind == "audio":
+            return {
+                "type": "input_audio",
+                "input_audio": {"data": self.encode(), "format": self.format}
+            }
+        return {
+            "type": "image_url",
+            "image_url": {"url": f"data:{self.format};base64,{self.encode()}"}
+        }
+
+    def __repr__(self) -> str:
+        return f"MediaRef({self.path!r}, kind={self.kind!r})"
+
+
+def _guess_format(path: str, kind: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if kind == "audio":
+        return _AUDIO_FORMATS.get(ext, "wav")
+    return mimetypes.types_map.get(ext, "image/jpeg")
+
+
+def resolve_media_refs(request_json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a request with every "media_ref" block replaced by its encoded block.
+
+    The input request is never modified: only the containers on the path to a
+    media_ref block are copied. Requests without media_ref blocks are returned as-is.
+    """
+    messages = request_json.get("messages")
+    if not messages or not any(_has_media_ref(m) for m in messages):
+        return request_json
+
+    resolved_messages: List[Dict[str, Any]] = []
+    for message in messages:
+        if not _has_media_ref(message):
+            resolved_messages.append(message)
+            continue
+        content = [
+            MediaRef.from_block(block).resolve()
+            if isinstance(block, dict) and block.get("type") == MEDIA_REF_TYPE
+            else block
+            for block in message["content"]
+        ]
+        resolved_messages.append({**message, "content": content})
+
+    return {**request_json, "messages": resolved_messages}
+
+
+def _has_media_ref(message: Dict[str, Any]) -> bool:
+    content = message.get("content") if isinstance(message, dict) else None
+    if not isinstance(content, list):
+        return False
+    return any(isinstance(b, dict) and b.get("type") == MEDIA_REF_TYPE for b in content)
@@ -0,0 +1,151 @@
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flashlearn.utils.token_utils import get_token_counter
+
+_WORD = re.compile(r"\w+")
+
+
+def truncate_to_tokens(text: str, max_tokens: int, count: Callable[[str], int]) -> str:
+    """
+    Cuts text to at most max_tokens tokens (between words where possible) and
+    marks the cut with "…".
+    """
+    tokens = count(text)
+    if tokens <= max_tokens:
+        return text
+    cut = max(1, len(text) * max_tokens // tokens)
+    while cut > 1 and count(text[:cut]) > max_tokens:
+        cut = cut * 9 // 10
+    space = text.rfind(" ", 0, cut)
+    if space > cut // 2:
+        cut = space
+    return text[:cut].rstrip() + "…"
+
+
+def _tfidf_vectors(texts: List[str]) -> List[Dict[str, float]]:
+    """
+    L2-normalised word TF-IDF vectors as sparse dicts.
+    """
+    counts = [Counter(_WORD.findall(t.lower())) for t in texts]
+    df = Counter(w for c in counts for w in c)
+    n = len(texts)
+    vectors = []
+    for c in counts:
+        vec = {w: tf * (math.log((1 + n) / (1 + df[w])) + 1) for w, tf in c.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({w: v / norm for w, v in vec.items()})
+    return vectors
+
+
+def _similarity_to(vectors, j: int) -> List[float]:
+    """
+    Cosine similarity of every vector to vector j (a sparse matrix or dicts).
+    """
+    if isinstance(vectors, list):
+        target = vectors[j]
+        return [sum(v * target.get(w, 0.0) for w, v in vec.items()) for vec in vectors]
+    return (vectors @ vectors[j].T).toarray().ravel().tolist()
+
+
+def _vectorize(texts: List[str]):
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        return _tfidf_vectors(texts)
+    if not any(_WORD.search(t) for t in texts):
+        return _tfidf_vectors(texts)
+    return TfidfVectorizer(token_pattern=_WORD.pattern).fit_transform(texts)
+
+
+def sample_rows(
+    df: List[Dict[str, Any]],
+    columns: List[str],
+    max_tokens: int = 4000,
+    max_field_tokens: int = 200,
+    column_modalities: Dict[str, str] = None,
+    stratify_columns: List[str] = None,
+    pool_size: int = 2000,
+    media_tokens: int = 800,
+    token_counter: Optional[Callable[[str], int]] = None,
+    seed: int = 0,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Picks a small, diverse subset of rows that fits a token budget, so a
+    prompt built from it stays the same size however many rows are passed.
+
+    Rows are grouped into strata by which columns they fill and by the values
+    of stratify_columns (default: text columns with few distinct values, such
+    as a label column). Strata take turns, largest first; within a stratum the
+    next row is the one least similar (TF-IDF cosine over its text fields) to
+    the rows already picked. Text fields are truncated to max_field_tokens and
+    media fields count as media_tokens. At most pool_size rows, drawn at
+    random with seed, are considered.
+
+    :return: (original index, row restricted to columns with truncated text)
+             pairs, in original order.
+    """
+    count = token_counter or get_token_counter()
+    modalities = column_modalities or {}
+    text_columns = [c for c in columns if modalities.get(c, "text") == "text"]
+
+    candidates = [
+        i for i, row in enumerate(df)
+        if any(col in row and str(row[col]).strip() for col in columns)
+    ]
+    if len(candidates) > pool_size:
+        candidates = sorted(random.Random(seed).sample(candidates, pool_size))
+    if not candidates:
+        return []
+
+    if stratify_columns is None:
+        limit = max(2, int(math.sqrt(len(candidates))))
+        stratify_columns = [
+            col for col in text_columns
+            if len({str(df[i].get(col, "")).strip() for i in candidates}) <= limit
+        ]
+
+    rows, sizes, strata = [], [], defaultdict(list)
+    for pos, i in enumerate(candidates):
+        row, tokens = {}, 0
+        for col in columns:
+            value = str(df[i].get(col, "")).strip()
+            if not value:
+                continue
+            if modalities.get(col, "text") == "text":
+                value = truncate_to_tokens(value, max_field_tokens, count)
+                tokens += count(value) + count(col) + 4
+            else:
+                tokens += media_tokens
+            row[col] = value
+        rows.append(row)
+        sizes.append(tokens)
+        strata[(
+            tuple(col in row for col in columns),
+            tuple(row.get(col, "") for col in stratify_columns),
+        )].append(pos)
+
+    vectors = _vectorize([" ".join(row.get(col, "") for col in text_columns) for row in rows])
+    closeness = [-1.0] * len(rows)
+    picked, used = [], 0
+    queues = sorted(strata.values(), key=len, reverse=True)
+    while queues:
+        for queue in list(queues):
+            fitting = [pos for pos in queue if used + sizes[pos] <= max_tokens]
+            if not fitting:
+                queues.remove(queue)
+                continue
+            pos = min(fitting, key=lambda p: closeness[p])
+            queue.remove(pos)
+            picked.append(pos)
+            used += sizes[pos]
+            closeness = [max(c, s) for c, s in zip(closeness, _similarity_to(vectors, pos))]
+            if not queue:
+                queues.remove(queue)
+    if not picked:
+        # Nothing fits: one row (the smallest) is still better than none
+        picked = [min(range(len(rows)), key=lambda p: sizes[p])]
+    return [(candidates[pos], rows[pos]) for pos in sorted(picked)]
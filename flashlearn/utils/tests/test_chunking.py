@@ -0,0 +1,91 @@
+from flashlearn.utils.chunking import chunk_text, iter_file_chunks, split_units
+
+
+def _words(text):
+    return len(text.split())
+
+
+def test_split_units_round_trips():
+    text = "First sentence. Second one!\n\nNew paragraph? Yes. tail"
+    units = list(split_units(text))
+    assert "".join(u for _, u in units) == text
+    assert [u for _, u in units][:2] == ["First sentence. ", "Second one!\n\n"]
+    assert all(text[o:o + len(u)] == u for o, u in units)
+
+
+def test_chunk_text_respects_budget_and_sentences():
+    text = "One two three. Four five six. Seven eight nine. Ten."
+    chunks = chunk_text(text, max_tokens=6, token_counter=_words)
+    assert [c["text"] for c in chunks] == ["One two three. Four five six. ", "Seven eight nine. Ten."]
+    assert [c["tokens"] for c in chunks] == [6, 4]
+    assert all(text[c["offset"]:c["offset"] + len(c["text"])] == c["text"] for c in chunks)
+
+
+def test_chunk_text_splits_long_sentence_between_words():
+    text = "a b c d e f g h."
+    chunks = chunk_text(text, max_tokens=3, token_counter=_words)
+    assert [c["text"] for c in chunks] == ["a b c ", "d e f ", "g h."]
+    assert "".join(c["text"] for c in chunks) == text
+
+
+def test_chunk_text_cuts_huge_word_by_characters():
+    chunks = chunk_text("x" * 100, max_tokens=10, token_counter=lambda t: len(t) // 5)
+    assert "".join(c["text"] for c in chunks) == "x" * 100
+    assert all(c["tokens"] <= 10 for c in chunks)
+
+
+class WordEncoding:
+    """Stands in for a tiktoken Encoding: one token per whitespace-separated word."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode_ordinary(self, text):
+        return text.split()
+
+    def encode_ordinary_batch(self, texts):
+        self.batches.append(len(texts))
+        return [t.split() for t in texts]
+
+
+def test_chunk_text_overlap_repeats_trailing_sentences():
+    text = "A b. C d. E f. G h."
+    chunks = chunk_text(text, max_tokens=4, token_counter=_words, overlap_tokens=2)
+    assert [c["text"] for c in chunks] == ["A b. C d. ", "C d. E f. ", "E f. G h."]
+    assert [c["offset"] for c in chunks] == [0, 5, 10]
+
+
+def test_iter_file_chunks_streams_with_byte_offsets(tmp_path):
+    text = "".join(f"Sentence número {i} has ünïcode words. " for i in range(200)) + "\n\nEnd."
+    path = tmp_path / "corpus.txt"
+    path.write_text(text, encoding="utf-8")
+    data = path.read_bytes()
+    encoding = WordEncoding()
+
+    # A tiny window forces units and multi-byte characters across window borders
+    chunks = list(iter_file_chunks(str(path), max_tokens=20, encoding=encoding,
+                                   batch_size=16, window_bytes=37))
+
+    assert "".join(c["text"] for c in chunks) == text
+    assert all(c["tokens"] <= 20 for c in chunks)
+    for c in chunks:
+        raw = c["text"].encode("utf-8")
+        assert data[c["offset"]:c["offset"] + len(raw)] == raw
+    assert max(encoding.batches) == 16
+
+    # With a normal window, boundaries match chunk_text on the same text
+    chunks = iter_file_chunks(str(path), max_tokens=20, encoding=WordEncoding())
+    assert [c["text"] for c in chunks] == [
+        c["text"] for c in chunk_text(text, max_tokens=20, token_counter=_words)
+    ]
+
+
+def test_iter_file_chunks_overlap_and_empty_file(tmp_path):
+    path = tmp_path / "small.txt"
+    path.write_text("A b. C d. E f. G h.", encoding="utf-8")
+    chunks = list(iter_file_chunks(str(path), max_tokens=4, overlap_tokens=2, encoding=WordEncoding()))
+    assert [c["text"] for c in chunks] == ["A b. C d. ", "C d. E f. ", "E f. G h."]
+
+    empty = tmp_path / "empty.txt"
+    empty.write_text("", encoding="utf-8")
+    assert list(iter_file_chunks(str(empty), encoding=WordEncoding())) == []
@@ -0,0 +1,115 @@
+import csv
+import random
+
+from flashlearn.utils import csv_loader
+from flashlearn.utils.csv_loader import (
+    build_columns_cache,
+    load_csv_sample,
+    read_columns_cache,
+    reservoir_sample,
+    write_columns_cache,
+)
+
+
+def _write_csv(path, n_rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["review", "sentiment"])
+        writer.writeheader()
+        for i in range(n_rows):
+            writer.writerow({
+                "review": f"review {i}, with \"quotes\"\nand a newline",
+                "sentiment": "positive" if i % 2 else "negative",
+            })
+
+
+def test_reservoir_sample_size_and_uniqueness():
+    result = reservoir_sample(iter(range(1000)), 10, random.Random(0))
+    assert len(result) == 10
+    assert len(set(result)) == 10
+    assert reservoir_sample(range(3), 10) == [0, 1, 2]
+    assert reservoir_sample(range(3), 0) == []
+
+
+def test_reservoir_sample_is_roughly_uniform():
+    rng = random.Random(1)
+    counts = [0] * 10
+    for _ in range(2000):
+        for item in reservoir_sample(range(10), 3, rng):
+            counts[item] += 1
+    # Each item should be picked ~600 times.
+    assert all(450 < c < 750 for c in counts)
+
+
+def test_load_csv_sample_streaming_is_seeded(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, 50)
+
+    first = load_csv_sample(str(csv_path), sample=5, seed=42, use_cache=False)
+    second = load_csv_sample(str(csv_path), sample=5, seed=42, use_cache=False)
+    assert first == second
+    assert len(first) == 5
+    assert set(first[0]) == {"review", "sentiment"}
+    assert not (tmp_path / "data.csv.columns").exists()
+
+
+def test_load_csv_sample_builds_and_reuses_cache(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, 20)
+
+    full = load_csv_sample(str(csv_path), full=True)
+    cache_path = tmp_path / "data.csv.columns"
+    assert cache_path.exists()
+    assert full == load_csv_sample(str(csv_path), full=True, use_cache=False)
+
+    sampled = load_csv_sample(str(csv_path), sample=4, seed=3)
+    assert sampled == load_csv_sample(str(csv_path), sample=4, seed=3)
+    assert len(sampled) == 4
+    assert all(row in full for row in sampled)
+
+
+def test_columns_cache_round_trip(tmp_path):
+    cache_path = str(tmp_path / "cols")
+    columns = {"a": ["x", "", "ünïcode", "has\x00nul"], "b": ["1", "2", "3", "4"]}
+    write_columns_cache(columns, cache_path)
+
+    rows = read_columns_cache(cache_path)
+    assert [row["a"] for row in rows] == columns["a"]
+    assert [row["b"] for row in rows] == columns["b"]
+    assert read_columns_cache(cache_path, [2, 0]) == [
+        {"a": "ünïcode", "b": "3"},
+        {"a": "x", "b": "1"},
+    ]
+
+
+def test_read_columns_cache_ignores_foreign_files(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"not a cache\n")
+    assert read_columns_cache(str(path)) is None
+
+
+def test_load_csv_sample_rebuilds_corrupt_cache(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, 5)
+    (tmp_path / "data.csv.columns").write_bytes(b"garbage\n")
+
+    assert len(load_csv_sample(str(csv_path), full=True)) == 5
+    assert read_columns_cache(str(tmp_path / "data.csv.columns")) is not None
+
+
+def test_build_columns_cache_streams_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_loader, "_OFFSETS_BATCH", 3)
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, 10)
+    cache_path = str(tmp_path / "cols")
+    build_columns_cache(str(csv_path), cache_path)
+    assert read_columns_cache(cache_path) == load_csv_sample(str(csv_path), full=True, use_cache=False)
+
+
+def test_load_csv_sample_falls_back_when_cache_is_unwritable(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, 20)
+    cache_path = str(tmp_path / "missing_dir" / "data.csv.columns")
+
+    rows = load_csv_sample(str(csv_path), sample=4, seed=1, cache_path=cache_path)
+    assert rows == load_csv_sample(str(csv_path), sample=4, seed=1, use_cache=False)
+    assert not (tmp_path / "missing_dir").exists()
@@ -0,0 +1,71 @@
+import base64
+import os
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from flashlearn.utils.image_pipeline import encode_image, iter_encoded_images
+
+
+def decode(b64):
+    return Image.open(BytesIO(base64.b64decode(b64)))
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    """
+    Write a few PNG images of different sizes to disk.
+    """
+    paths = []
+    for i, size in enumerate([(1200, 600), (300, 900), (50, 50), (800, 800)]):
+        path = tmp_path / f"img_{i}.png"
+        Image.new("RGBA", size, (i * 40, 100, 200, 255)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_encode_image_downscales_and_recompresses(image_paths):
+    """
+    The longest edge is capped at max_edge and the output is JPEG.
+    """
+    with open(image_paths[0], "rb") as f:
+        img = decode(encode_image(f.read(), max_edge=400))
+    assert img.format == "JPEG"
+    assert img.size == (400, 200)
+
+
+def test_encode_image_keeps_small_images(image_paths):
+    with open(image_paths[2], "rb") as f:
+        assert decode(encode_image(f.read(), max_edge=400)).size == (50, 50)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_encoded_images_preserves_order(image_paths, workers):
+    """
+    Results stream back in input order, in-process or on a pool.
+    """
+    out = list(iter_encoded_images(iter(image_paths), max_edge=100, workers=workers, batch_size=1))
+    assert [p for p, _ in out] == image_paths
+    assert all(max(decode(b64).size) <= 100 for _, b64 in out)
+
+
+def test_iter_encoded_images_uses_content_cache(image_paths, tmp_path):
+    """
+    A second run is served from the content-hash cache.
+    """
+    cache_dir = str(tmp_path / "cache")
+    first = list(iter_encoded_images(image_paths, max_edge=64, workers=1, cache_dir=cache_dir))
+    assert len(os.listdir(cache_dir)) == len(image_paths)
+
+    # Poison the cache to prove the second run reads from it
+    for name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, name), "w", encoding="utf-8") as f:
+            f.write("cached")
+    second = list(iter_encoded_images(image_paths, max_edge=64, workers=1, cache_dir=cache_dir))
+    assert [b64 for _, b64 in second] == ["cached"] * len(image_paths)
+
+    # Different settings => different cache keys
+    third = list(iter_encoded_images(image_paths, max_edge=32, workers=1, cache_dir=cache_dir))
+    assert third[0][1] != "cached"
+    assert len(first) == len(third)
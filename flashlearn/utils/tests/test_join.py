@@ -0,0 +1,85 @@
+import io
+import json
+
+import pytest
+
+from flashlearn.core.tool_arguments import LazyArguments
+from flashlearn.utils.join import flatten_result, join_results, write_jsonl
+
+
+def test_flatten_result():
+    assert flatten_result({"a": 1, "b": {"c": 2, "d": {"e": 3}}, "l": [1]}) == {
+        "a": 1, "b.c": 2, "b.d.e": 3, "l": [1]
+    }
+    assert flatten_result({"a": 1}, prefix="llm_") == {"llm_a": 1}
+    assert flatten_result("<ERROR>") == {"error": "<ERROR>"}
+    assert flatten_result(LazyArguments('{"x": 1}')) == {"x": 1}
+
+
+def test_join_results_reorders_and_reads_rows_lazily():
+    consumed = []
+
+    def rows():
+        for i in range(5):
+            consumed.append(i)
+            yield {"text": f"t{i}"}
+
+    results = iter([("1", {"label": "b"}), ("0", {"label": "a"}), ("2", "<ERROR>")])
+    joined = join_results(rows(), results)
+
+    assert next(joined) == {"text": "t1", "label": "b"}
+    assert consumed == [0, 1]
+    assert next(joined) == {"text": "t0", "label": "a"}
+    assert next(joined) == {"text": "t2", "error": "<ERROR>"}
+    # Rows without results are emitted at the end
+    assert [r["text"] for r in joined] == ["t3", "t4"]
+
+
+def test_join_results_unflattened_with_custom_ids():
+    rows = [{"id": "x"}, {"id": "y"}]
+    joined = list(join_results(
+        rows, [("y", {"v": 1}), ("x", {"v": 2})],
+        row_id=lambda i, row: row["id"], flatten=False, prefix="out_",
+    ))
+    assert joined == [{"id": "y", "out_result": {"v": 1}}, {"id": "x", "out_result": {"v": 2}}]
+
+
+def test_join_results_buffer_overflow():
+    rows = ({"i": i} for i in range(100))
+    with pytest.raises(ValueError, match="reorder buffer overflow"):
+        list(join_results(rows, [("50", {})], buffer_size=10))
+
+
+def test_write_jsonl_streams_rows(tmp_path):
+    buffer = io.StringIO()
+    assert write_jsonl(iter([{"a": 1}, {"a": 2}]), buffer) == 2
+    assert [json.loads(line) for line in buffer.getvalue().splitlines()] == [{"a": 1}, {"a": 2}]
+
+    path = tmp_path / "out.jsonl"
+    write_jsonl([{"b": 1}], str(path))
+    assert json.loads(path.read_text()) == {"b": 1}
+
+
+def test_join_results_emits_rows_without_a_task_immediately():
+    rows = [{"text": f"t{i}" if i % 2 == 0 else ""} for i in range(50)]
+    # Results arrive only for rows that produced a task, in reverse order within the buffer
+    results = [(str(i), {"label": i}) for i in range(0, 50, 2)]
+    joined = list(join_results(rows, results, has_task=lambda row: bool(row["text"]), buffer_size=10))
+
+    assert len(joined) == 50
+    assert [r["error"] for r in joined if not r["text"]] == ["<SKIPPED>"] * 25
+    assert [r["label"] for r in joined if r["text"]] == list(range(0, 50, 2))
+
+
+def test_join_results_uses_skill_content_blocks():
+    class Skill:
+        def build_content_blocks(self, row, column_modalities):
+            return [{"type": "text", "text": row["text"]}] if row.get("text") else []
+
+    rows = [{"text": ""}, {"text": "a"}, {"text": ""}]
+    joined = list(join_results(rows, [("1", {"v": 1})], skill=Skill(), buffer_size=1))
+    assert joined == [
+        {"text": "", "error": "<SKIPPED>"},
+        {"text": "a", "v": 1},
+        {"text": "", "error": "<SKIPPED>"},
+    ]
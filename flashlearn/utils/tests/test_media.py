@@ -0,0 +1,66 @@
+import base64
+
+import pytest
+
+from flashlearn.utils.media import MediaRef, resolve_media_refs
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "cat.png"
+    path.write_bytes(b"\x89PNG fake image bytes")
+    return path
+
+
+def test_media_ref_block_is_json_safe_placeholder(image_file):
+    """
+    to_block stores only the path and kind, never the encoded data.
+    """
+    block = MediaRef(str(image_file)).to_block()
+    assert block == {
+        "type": "media_ref",
+        "media_ref": {"path": str(image_file), "kind": "image", "format": "image/png"},
+    }
+
+
+def test_resolve_image_and_audio(image_file, tmp_path):
+    """
+    Image refs become data-URL image blocks; audio refs become input_audio blocks.
+    """
+    audio_file = tmp_path / "clip.mp3"
+    audio_file.write_bytes(b"ID3 audio")
+
+    image_block = MediaRef(str(image_file)).resolve()
+    expected = base64.b64encode(image_file.read_bytes()).decode("utf-8")
+    assert image_block["image_url"]["url"] == f"data:image/png;base64,{expected}"
+
+    audio_block = MediaRef(str(audio_file), kind="audio").resolve()
+    assert audio_block["type"] == "input_audio"
+    assert audio_block["input_audio"]["format"] == "mp3"
+
+
+def test_resolve_media_refs_copies_only_what_changes(image_file):
+    """
+    The original request keeps its placeholder; untouched messages are shared.
+    """
+    system_msg = {"role": "system", "content": "prompt"}
+    ref_block = MediaRef(str(image_file)).to_block()
+    request = {
+        "model": "m",
+        "messages": [system_msg, {"role": "user", "content": [{"type": "text", "text": "hi"}, ref_block]}],
+    }
+    resolved = resolve_media_refs(request)
+
+    assert request["messages"][1]["content"][1] is ref_block
+    assert resolved["messages"][0] is system_msg
+    assert resolved["messages"][1]["content"][1]["type"] == "image_url"
+
+
+def test_resolve_media_refs_without_refs_returns_same_object():
+    request = {"messages": [{"role": "user", "content": "plain"}]}
+    assert resolve_media_refs(request) is request
+
+
+def test_invalid_kind():
+    with pytest.raises(ValueError):
+        MediaRef("x.bin", kind="video")
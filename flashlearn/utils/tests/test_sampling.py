@@ -0,0 +1,50 @@
+from flashlearn.utils.sampling import sample_rows, truncate_to_tokens
+
+
+def _words(text):
+    return len(text.split())
+
+
+def test_truncate_to_tokens_cuts_between_words():
+    text = " ".join(f"w{i}" for i in range(100))
+    cut = truncate_to_tokens(text, 10, _words)
+    assert cut.endswith("…")
+    assert _words(cut) <= 10
+    assert text.startswith(cut[:-1])
+    assert truncate_to_tokens("short text", 10, _words) == "short text"
+
+
+def test_sample_rows_fits_budget_regardless_of_size():
+    df = [{"text": f"review number {i} " + "word " * 50, "label": "pos" if i % 3 else "neg"}
+          for i in range(5000)]
+    sample = sample_rows(df, ["text", "label"], max_tokens=300, max_field_tokens=20, token_counter=_words)
+    total = sum(_words(row["text"]) + _words("text") + 4 + _words(row["label"]) + _words("label") + 4
+                for _, row in sample)
+    assert 0 < total <= 300
+    assert all(_words(row["text"]) <= 20 for _, row in sample)
+    indexes = [i for i, _ in sample]
+    assert indexes == sorted(indexes)
+    # Stratified on the low-cardinality label column: both labels represented
+    assert {row["label"] for _, row in sample} == {"pos", "neg"}
+
+
+def test_sample_rows_prefers_diverse_rows():
+    df = [{"text": "the cat sat on the mat"}] * 5 + [
+        {"text": "stock prices fell sharply today"},
+        {"text": "the football match ended in a draw"},
+    ]
+    sample = sample_rows(df, ["text"], max_tokens=3 * 12, token_counter=_words)
+    texts = [row["text"] for _, row in sample]
+    assert len(texts) == 3
+    assert len(set(texts)) == 3
+
+
+def test_sample_rows_skips_empty_rows_and_counts_media():
+    df = [{"img": "", "caption": ""}, {"img": "http://x/1.jpg", "caption": "a dog"}]
+    sample = sample_rows(
+        df, ["img", "caption"], max_tokens=10,
+        column_modalities={"img": "image_url"}, token_counter=_words,
+    )
+    # The only row with content exceeds the budget (media counts 800) but is still returned
+    assert sample == [(1, {"img": "http://x/1.jpg", "caption": "a dog"})]
+    assert sample_rows([{"a": ""}], ["a"], token_counter=_words) == []
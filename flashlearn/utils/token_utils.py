@@ -1,11 +1,13 @@
-import tiktoken
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Callable, List, Dict, Any
 
 def _count_tokens_for_messages(messages: List[Dict[str, str]], model_name: str) -> int:
     """
     Count tokens for the conversation messages using tiktoken.
     Each item in `messages` is { "role": <>, "content": <> }.
     """
+    import tiktoken
+
     enc = tiktoken.encoding_for_model(model_name)
     text = ""
     for msg in messages:
@@ -19,6 +21,8 @@ def _count_tokens_for_function_defs(function_defs: List[Dict[str, Any]], model_n
     Approximate tokens for function definitions by converting them to a string
     (str() or JSON) and encoding that.
     """
+    import tiktoken
+
     enc = tiktoken.encoding_for_model(model_name)
     total_tokens = 0
     for f_def in function_defs:
@@ -56,4 +60,20 @@ def count_tokens_for_tasks(tasks: List[Dict[str, Any]], default_model: str) -> i
     total = 0
     for t in tasks:
         total += count_tokens_for_task(t, default_model)
-    return total
\ No newline at end of file
+    return total
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(encoding_name: str = "cl100k_base") -> Callable[[str], int]:
+    """
+    Returns a function that counts the tokens of a string with the given
+    tiktoken encoding. The encoding is loaded once and shared.
+    """
+    import tiktoken
+
+    enc = tiktoken.get_encoding(encoding_name)
+
+    def count(text: str) -> int:
+        return len(enc.encode(text, disallowed_special=()))
+
+    return count